@@ -28,7 +28,7 @@ from copy import deepcopy
 
 from myhdl._compat import long
 from myhdl._Signal import _Signal
-from myhdl._Waiter import _SignalWaiter, _SignalTupleWaiter
+from myhdl._Waiter import _SignalTupleWaiter
 from myhdl._intbv import intbv
 from myhdl._simulator import _siglist
 from myhdl._bin import bin
@@ -52,7 +52,7 @@ class _ShadowSignal(_Signal):
 
 class _SliceSignal(_ShadowSignal):
 
-    __slots__ = ('_sig', '_left', '_right')
+    __slots__ = ('_sig', '_left', '_right', '_mask')
 
     def __init__(self, sig, left, right=None):
         # XXX error checks
@@ -63,25 +63,33 @@ class _SliceSignal(_ShadowSignal):
         self._sig = sig
         self._left = left
         self._right = right
-        if right is None:
-            gen = self._genfuncIndex()
+        # bit mask for integer arithmetic on intbv sources, or None
+        self._mask = None
+        if isinstance(sig._val, intbv):
+            if right is None:
+                self._mask = 1
+            elif left is not None:
+                self._mask = (long(1) << (left - right)) - 1
+        sig._shadows.append(self)
+
+    def _follow(self, sig):
+        # recompute the value in the update of the source
+        mask = self._mask
+        if mask is None:
+            if self._right is None:
+                self._next = sig._val[self._left]
+            else:
+                self._setNextVal(sig._val[self._left:self._right])
+        elif self._right is None:
+            self._next = bool(sig._val._val >> self._left & 1)
         else:
-            gen = self._genfuncSlice()
-        self._waiter = _SignalWaiter(gen)
-
-    def _genfuncIndex(self):
-        sig, index = self._sig, self._left
-        set_next = _Signal.next.fset
-        while 1:
-            set_next(self, sig[index])
-            yield sig
+            self._next._val = sig._val._val >> self._right & mask
+        if not self._dirty:
+            self._dirty = True
+            _siglist.append(self)
 
-    def _genfuncSlice(self):
-        sig, left, right = self._sig, self._left, self._right
-        set_next = _Signal.next.fset
-        while 1:
-            set_next(self, sig[left:right])
-            yield sig
+    def _sync(self):
+        self._follow(self._sig)
 
     def _setName(self, hdl):
         if self._right is None:
@@ -118,7 +126,7 @@ class _SliceSignal(_ShadowSignal):
 
 class ConcatSignal(_ShadowSignal):
 
-    __slots__ = ('_args', '_sigargs', '_initval')
+    __slots__ = ('_args', '_sigargs', '_initval', '_fields')
 
     def __init__(self, *args):
         assert len(args) >= 2
@@ -152,32 +160,41 @@ class ConcatSignal(_ShadowSignal):
         self._initval = val
         ini = intbv(val)[nrbits:]
         _ShadowSignal.__init__(self, ini)
-        gen = self.genfunc()
-        self._waiter = _SignalTupleWaiter(gen)
-
-    def genfunc(self):
-        set_next = _Signal.next.fset
-        args = self._args
-        sigargs = self._sigargs
-        nrbits = self._nrbits
-        newval = intbv(self._initval)[nrbits:]
-        while 1:
-            hi = nrbits
-            for a in args:
-                if isinstance(a, bool):
-                    w = 1
-                else:
-                    w = len(a)
-                lo = hi - w
-                # note: 'a in sigargs' is equivalence check, not identity
-                if isinstance(a, _Signal):
-                    if isinstance(a._val, intbv):
-                        newval[hi:lo] = a[w:]
-                    else:
-                        newval[hi:lo] = a
-                hi = lo
-            set_next(self, newval)
-            yield sigargs
+        # the fields of each signal argument, by signal id
+        self._fields = fields = {}
+        hi = nrbits
+        for a in args:
+            if isinstance(a, bool):
+                w = 1
+            else:
+                w = len(a)
+            lo = hi - w
+            if isinstance(a, _Signal):
+                if id(a) not in fields:
+                    fields[id(a)] = []
+                    a._shadows.append(self)
+                fields[id(a)].append((lo, (long(1) << w) - 1))
+            hi = lo
+
+    def _follow(self, sig):
+        # recompute the fields of the changed argument only
+        v = sig._val
+        if isinstance(v, intbv):
+            v = v._val
+        else:
+            v = int(v)
+        next = self._next
+        val = next._val
+        for lo, mask in self._fields[id(sig)]:
+            val = val & ~(mask << lo) | (v & mask) << lo
+        next._val = val
+        if not self._dirty:
+            self._dirty = True
+            _siglist.append(self)
+
+    def _sync(self):
+        for s in self._sigargs:
+            self._follow(s)
 
     def _markRead(self):
         self._read = True
@@ -277,6 +294,7 @@ class _TristateSignal(_ShadowSignal):
         self._orival = deepcopy(val)  # keep for drivers
         # reset signal values to None
         self._next = self._val = self._init = None
+        self._update = self._updateMutable
         self._waiter = _SignalTupleWaiter(self._resolve())
 
     def driver(self):
@@ -298,7 +316,9 @@ class _TristateSignal(_ShadowSignal):
                     res = None
                     break
             self._next = res
-            _siglist.append(self)
+            if not self._dirty:
+                self._dirty = True
+                _siglist.append(self)
 
     def toVerilog(self):
         lines = []
@@ -323,6 +343,7 @@ class _TristateDriver(_Signal):
         _Signal.__init__(self, sig._orival)
         # reset signal values to None
         self._next = self._val = self._init = None
+        self._update = self._updateMutable
         self._sig = sig
 
     @_Signal.next.setter
@@ -335,4 +356,6 @@ class _TristateDriver(_Signal):
             # restore original value to cater for intbv handler
             self._next = self._sig._orival
             self._setNextVal(val)
-        _siglist.append(self)
+        if not self._dirty:
+            self._dirty = True
+            _siglist.append(self)
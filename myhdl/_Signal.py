@@ -31,9 +31,9 @@ from __future__ import print_function
 
 from copy import copy, deepcopy
 
-from myhdl._compat import integer_types, long
+from myhdl._compat import integer_types, string_types, long
 from myhdl import _simulator as sim
-from myhdl._simulator import _futureEvents
+from myhdl._simulator import _schedule
 from myhdl._simulator import _siglist
 from myhdl._simulator import _signals
 from myhdl._intbv import intbv
@@ -42,8 +42,6 @@ from myhdl._bin import bin
 
 # from myhdl._enum import EnumItemType
 
-_schedule = _futureEvents.append
-
 
 def _isListOfSigs(obj):
     """ Check if obj is a non-empty list of signals. """
@@ -56,16 +54,44 @@ def _isListOfSigs(obj):
         return False
 
 
+# number of stale waiters that a list keeps, besides as many as it has
+# live waiters
+_staleMargin = 16
+
+
 class _WaiterList(list):
 
+    """ List of the waiters on a signal or an edge.
+
+    The waiters are removed when the list triggers. The procs list holds
+    the processes that stay subscribed, and are triggered each time.
+
+    A waiter that was triggered through another list stays in the list
+    with hasRun set, and is skipped when the list triggers. The list
+    counts these stale waiters, and removes them once they outnumber the
+    others by a margin, so that a removal costs constant time on average.
+    """
+
+    def __init__(self):
+        self.procs = []
+        self.stale = 0
+
+    def drop(self):
+        """ Account for a waiter that has become stale """
+        self.stale += 1
+        if self.stale * 2 > len(self) + _staleMargin:
+            self.purge()
+
     def purge(self):
         if self:
             self[:] = [w for w in self if not w.hasRun]
+        self.stale = 0
 
 
 class _PosedgeWaiterList(_WaiterList):
 
     def __init__(self, sig):
+        _WaiterList.__init__(self)
         self.sig = sig
 
     def _toVerilog(self):
@@ -78,6 +104,7 @@ class _PosedgeWaiterList(_WaiterList):
 class _NegedgeWaiterList(_WaiterList):
 
     def __init__(self, sig):
+        _WaiterList.__init__(self)
         self.sig = sig
 
     def _toVerilog(self):
@@ -121,11 +148,12 @@ class _Signal(object):
 
     __slots__ = ('_next', '_val', '_min', '_max', '_type', '_init', '_shift',
                  '_eventWaiters', '_posedgeWaiters', '_negedgeWaiters',
+                 '_eventProcs', '_posedgeProcs', '_negedgeProcs',
                  '_code', '_tracing', '_nrbits', '_checkVal',
-                 '_setNextVal', '_copyVal2Next', '_printVcd',
+                 '_setNextVal', '_copyVal2Next', '_printVcd', '_update',
                  '_driven', '_read', '_name', '_used', '_inList',
                  '_waiter', 'toVHDL', 'toVerilog', '_slicesigs',
-                 '_numeric'
+                 '_shadows', '_numeric', '_dirty'
                  )
 
     def __init__(self, val=None):
@@ -141,14 +169,17 @@ class _Signal(object):
         self._name = self._driven = None
         self._read = self._used = False
         self._inList = False
+        self._dirty = False
         self._nrbits = 0
         self._shift = 0
         self._numeric = True
         self._printVcd = self._printVcdStr
+        self._update = self._updateImmutable
         if isinstance(val, bool):
             self._type = bool
             self._setNextVal = self._setNextBool
             self._printVcd = self._printVcdBit
+            self._update = self._updateBool
             self._nrbits = 1
         elif isinstance(val, integer_types):
             self._type = integer_types
@@ -164,6 +195,7 @@ class _Signal(object):
             self._nrbits = val.nrbits
             self._shift = val._shift
             self._setNextVal = self._setNextFixbv
+            self._update = self._updateIntbv
             if val._vcd_asfloat:
                 self._printVcd = self._printVcdReal
             elif self._nrbits:
@@ -176,6 +208,7 @@ class _Signal(object):
             self._max = val._max
             self._nrbits = val._nrbits
             self._setNextVal = self._setNextIntbv
+            self._update = self._updateIntbv
             if self._nrbits:
                 self._printVcd = self._printVcdVec
             else:
@@ -186,13 +219,19 @@ class _Signal(object):
                 self._setNextVal = self._setNextNonmutable
             else:
                 self._setNextVal = self._setNextMutable
+                if not isinstance(val, string_types):
+                    self._update = self._updateMutable
             if hasattr(val, '_nrbits'):
                 self._nrbits = val._nrbits
         self._eventWaiters = _WaiterList()
         self._posedgeWaiters = _PosedgeWaiterList(self)
         self._negedgeWaiters = _NegedgeWaiterList(self)
+        self._eventProcs = self._eventWaiters.procs
+        self._posedgeProcs = self._posedgeWaiters.procs
+        self._negedgeProcs = self._negedgeWaiters.procs
         self._code = ""
         self._slicesigs = []
+        self._shadows = []
         self._tracing = 0
         _signals.append(self)
 
@@ -200,25 +239,105 @@ class _Signal(object):
         del self._eventWaiters[:]
         del self._posedgeWaiters[:]
         del self._negedgeWaiters[:]
+        del self._eventProcs[:]
+        del self._posedgeProcs[:]
+        del self._negedgeProcs[:]
         self._val = deepcopy(self._init)
         self._next = deepcopy(self._init)
         self._name = self._driven = None
         self._read = False # dont clear self._used
         self._inList = False 
+        self._dirty = False
         self._numeric = True
         for s in self._slicesigs:
             s._clear()
 
-    def _update(self):
+    # update methods, bound at construction according to the value type
+    def _updateBool(self):
+        self._dirty = False
+        val, next = self._val, self._next
+        if val != next:
+            waiters = self._eventWaiters + self._eventProcs
+            del self._eventWaiters[:]
+            if next:
+                waiters.extend(self._posedgeWaiters)
+                waiters.extend(self._posedgeProcs)
+                del self._posedgeWaiters[:]
+            else:
+                waiters.extend(self._negedgeWaiters)
+                waiters.extend(self._negedgeProcs)
+                del self._negedgeWaiters[:]
+            self._val = next
+            if self._tracing:
+                self._printVcd()
+            if self._shadows:
+                self._propagate()
+            return waiters
+        else:
+            return []
+
+    def _updateIntbv(self):
+        # intbv, modbv and fixbv: transfer the integer value in place
+        self._dirty = False
+        cur = self._val
+        val, next = cur._val, self._next._val
+        if val != next:
+            waiters = self._eventWaiters + self._eventProcs
+            del self._eventWaiters[:]
+            if not val:
+                waiters.extend(self._posedgeWaiters)
+                waiters.extend(self._posedgeProcs)
+                del self._posedgeWaiters[:]
+            elif not next:
+                waiters.extend(self._negedgeWaiters)
+                waiters.extend(self._negedgeProcs)
+                del self._negedgeWaiters[:]
+            cur._val = next
+            if self._tracing:
+                self._printVcd()
+            if self._shadows:
+                self._propagate()
+            return waiters
+        else:
+            return []
+
+    def _updateImmutable(self):
+        self._dirty = False
+        val, next = self._val, self._next
+        if val != next:
+            waiters = self._eventWaiters + self._eventProcs
+            del self._eventWaiters[:]
+            if not val and next:
+                waiters.extend(self._posedgeWaiters)
+                waiters.extend(self._posedgeProcs)
+                del self._posedgeWaiters[:]
+            elif not next and val:
+                waiters.extend(self._negedgeWaiters)
+                waiters.extend(self._negedgeProcs)
+                del self._negedgeWaiters[:]
+            self._val = next
+            if self._tracing:
+                self._printVcd()
+            if self._shadows:
+                self._propagate()
+            return waiters
+        else:
+            return []
+
+    def _updateMutable(self):
+        # any value type, also None for tristate signals
+        self._dirty = False
         val, next = self._val, self._next
         if val != next:
-            waiters = self._eventWaiters[:]
+            waiters = self._eventWaiters + self._eventProcs
             del self._eventWaiters[:]
             if not val and next:
-                waiters.extend(self._posedgeWaiters[:])
+                waiters.extend(self._posedgeWaiters)
+                waiters.extend(self._posedgeProcs)
                 del self._posedgeWaiters[:]
             elif not next and val:
-                waiters.extend(self._negedgeWaiters[:])
+                waiters.extend(self._negedgeWaiters)
+                waiters.extend(self._negedgeProcs)
                 del self._negedgeWaiters[:]
             if next is None:
                 self._val = None
@@ -230,10 +349,17 @@ class _Signal(object):
                 self._val = deepcopy(next)
             if self._tracing:
                 self._printVcd()
+            if self._shadows:
+                self._propagate()
             return waiters
         else:
             return []
 
+    def _propagate(self):
+        # shadow signals follow in the same delta cycle
+        for s in self._shadows:
+            s._follow(self)
+
     # support for the 'val' attribute
     @property
     def val(self):
@@ -244,7 +370,9 @@ class _Signal(object):
     def next(self):
         #        if self._next is self._val:
         #            self._next = deepcopy(self._val)
-        _siglist.append(self)
+        if not self._dirty:
+            self._dirty = True
+            _siglist.append(self)
         return self._next
 
     @next.setter
@@ -252,7 +380,9 @@ class _Signal(object):
         if isinstance(val, _Signal):
             val = val._val
         self._setNextVal(val)
-        _siglist.append(self)
+        if not self._dirty:
+            self._dirty = True
+            _siglist.append(self)
 
     # support for the 'posedge' attribute
     @property
@@ -318,9 +448,12 @@ class _Signal(object):
         self._next = val
 
     def _setNextFixbv(self, val):
-        if isinstance(val, (fixbv, float)):
+        if isinstance(val, fixbv) and val._shift == self._shift:
+            val = val._val
+        elif isinstance(val, (fixbv, float)):
             (own, val) = self._next.align(val)
-            assert (own.si, own.shift) == (self.si, self.shift)
+            assert own.shift == self._shift
+            val = val._val
         elif isinstance(val, intbv):
             val = val._val
         elif not isinstance(val, (integer_types)):
@@ -616,7 +749,7 @@ class _Signal(object):
 
 class _DelayedSignal(_Signal):
 
-    __slots__ = ('_nextZ', '_delay', '_timeStamp',
+    __slots__ = ('_nextZ', '_delay', '_timeStamp', '_inplace', '_copied',
                  )
 
     def __init__(self, val=None, delay=1):
@@ -627,32 +760,56 @@ class _DelayedSignal(_Signal):
         delay -- non-zero delay value
         """
         _Signal.__init__(self, val)
-        self._nextZ = val
+        # schedule the next values as the update method would transfer
+        # them: integers of intbv values, copies of mutable values
+        self._inplace = self._update == self._updateIntbv
+        self._copied = self._update == self._updateMutable
+        self._update = self._updateDelayed
+        self._nextZ = self._scheduled()
         self._delay = delay
         self._timeStamp = 0
 
-    def _update(self):
-        if self._next != self._nextZ:
+    def _scheduled(self):
+        """ Return the next value as it is scheduled """
+        if self._inplace:
+            return self._next._val
+        elif self._copied:
+            return copy(self._next)
+        return self._next
+
+    def _updateDelayed(self):
+        self._dirty = False
+        next = self._scheduled()
+        if next != self._nextZ:
             self._timeStamp = sim._time
-        self._nextZ = self._next
+        self._nextZ = next
         t = sim._time + self._delay
-        _schedule((t, _SignalWrap(self, self._next, self._timeStamp)))
+        _schedule(t, _SignalWrap(self, next, self._timeStamp))
         return []
 
     def _apply(self, next, timeStamp):
         val = self._val
+        if self._inplace:
+            val = val._val
         if timeStamp == self._timeStamp and val != next:
-            waiters = self._eventWaiters[:]
+            waiters = self._eventWaiters + self._eventProcs
             del self._eventWaiters[:]
             if not val and next:
-                waiters.extend(self._posedgeWaiters[:])
+                waiters.extend(self._posedgeWaiters)
+                waiters.extend(self._posedgeProcs)
                 del self._posedgeWaiters[:]
             elif not next and val:
-                waiters.extend(self._negedgeWaiters[:])
+                waiters.extend(self._negedgeWaiters)
+                waiters.extend(self._negedgeProcs)
                 del self._negedgeWaiters[:]
-            self._val = copy(next)
+            if self._inplace:
+                self._val._val = next
+            else:
+                self._val = next
             if self._tracing:
                 self._printVcd()
+            if self._shadows:
+                self._propagate()
             return waiters
         else:
             return []
@@ -22,21 +22,36 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import os
-from operator import itemgetter
+import warnings
 from types import GeneratorType
 
 from myhdl import StopSimulation, _SuspendSimulation
-from myhdl import _simulator, SimulationError
+from myhdl import _simulator, SimulationError, SimulationWarning
+from myhdl._compat import integer_types
 from myhdl._Cosimulation import Cosimulation
-from myhdl._simulator import _signals, _siglist, _futureEvents
+from myhdl._simulator import _signals, _siglist, _schedule, _schedulers
+from myhdl._simulator import _rearms
+from myhdl._simulator import _Context, _contexts, _activate, _deactivate
 from myhdl._Waiter import _Waiter
 from myhdl._Waiter import _inferWaiter
 from myhdl._Waiter import _SignalTupleWaiter
+from myhdl._Signal import _Signal
+from myhdl._ShadowSignal import _SliceSignal, ConcatSignal
 from myhdl._util import _printExcInfo
 from myhdl._instance import _Instantiator
 from myhdl._block import _Block
-
-schedule = _futureEvents.append
+from myhdl._clock import Clock
+from myhdl._cyclesim import _CycleEngine, _CycleFallback
+from myhdl._always_comb import _AlwaysComb
+from myhdl._levelize import _levelize
+from myhdl._checkpoint import _save, _load
+from myhdl._fork import _forkScenarios
+from myhdl._partition import _Plan, _Coordinator
+from myhdl._lanes import _Batch
+from myhdl._packed import _PackedBatch
+from myhdl._profile import _Profile
+from myhdl._activity import _Activity
+from myhdl._watch import _Watchpoint
 
 
 class _error:
@@ -46,6 +61,28 @@ class _error:
 _error.ArgType = "Inappriopriate argument type"
 _error.MultipleCosim = "Only a single cosimulator argument allowed"
 _error.DuplicatedArg = "Duplicated argument"
+_error.SchedulerType = "Unknown scheduler"
+_error.EngineType = "Unknown simulation engine"
+_error.CycleFallback = "Cycle-based simulation not applicable, " \
+    "using event-driven simulation"
+_error.CombLoop = "Combinational loop, not levelized"
+_error.CycleProfile = "Profiling requires event-driven simulation, " \
+    "not profiled"
+_error.CycleWatch = "Watchpoints require event-driven simulation"
+_error.WatchAction = "Watchpoint action should be 'suspend', 'stop' " \
+    "or a callable"
+_error.CyclePartitions = "Partitioned simulation requires event-driven " \
+    "simulation"
+_error.NoFork = "Partitioned simulation requires os.fork"
+_error.Partitioned = "Not supported for a partitioned simulation"
+_error.OnePartition = "Design has a single clock domain, not partitioned"
+_error.CycleLanes = "Batched simulation requires event-driven simulation " \
+    "in a single process"
+_error.LaneCount = "Number of lanes should be a positive integer"
+_error.LaneTrace = "Batched simulation does not support tracing"
+_error.PackedLanes = "Packed simulation requires a number of lanes"
+_error.CycleSkip = "Skipping idle blocks requires event-driven " \
+    "simulation in a single process, without lanes"
 
 # flatten Block objects out
 
@@ -63,35 +100,170 @@ def _flatten(*args):
     return arglist
 
 
-_error.MultipleSim = "Only a single Simulation instance is allowed"
-
-
 class Simulation(object):
 
     """ Simulation class.
 
     Methods:
     run -- run a simulation for some duration
+    checkpoint -- save the simulation state to a file
+    restore -- restore the simulation state from a file
+    fork_scenarios -- run scenarios in forked processes
+    watch -- set a watchpoint on a signal
+    unwatch -- remove a watchpoint
+
+    Attributes:
+    engine -- the simulation engine in use: 'event' or 'cycle'
+    activations -- number of process activations so far
+    timesteps -- number of time steps simulated so far
+    profile -- profile of the profiled runs, or None
+    activity -- evaluations and skips of the always_seq blocks when
+                idle blocks are skipped, or None
 
     """
-    _no_of_instances = 0
-
-    def __init__(self, *args):
+    def __init__(self, *args, **kwargs):
         """ Construct a simulation object.
 
         *args -- list of arguments. Each argument is a generator or
                  a nested sequence of generators.
+        scheduler -- future event queue: 'heap' (default) or 'wheel',
+                     a timing wheel for designs whose events mostly
+                     fall within a small window of the current time
+        engine -- 'event' (default) for event-driven simulation, or
+                  'cycle' for cycle-based simulation of designs that
+                  consist of always_seq, always_comb and edge-triggered
+                  always blocks, clocked by Clock objects. Other designs
+                  fall back to event-driven simulation with a warning.
+        levelize -- if true, rank the always_comb blocks in topological
+                    order, and run them in rank order after the other
+                    processes of a time step, so that each runs at most
+                    once per time step when there is no feedback.
+                    Combinational loops are reported with a warning.
+        partitions -- run groups of instances in separate processes:
+                      a list of groups, each a sequence of instances,
+                      or 'auto' to group the instances by clock domain.
+                      The instances in no group run in the calling
+                      process. Signals that cross partitions should be
+                      driven by blocks triggered by Clock edges only.
+        lanes -- simulate that number of copies of the design at once:
+                 each signal, except those of Clock objects, carries a
+                 vector of lane values, and each block runs once per
+                 activation for all lanes
+        packed -- if true, pack the lanes of bool and intbv signals in
+                  the bits of integers, so that bitwise operators
+                  evaluate all lanes at once. The lanes should not take
+                  different branches.
+        skip_idle -- if true, skip the activations of always_seq blocks
+                     without register variables when none of their input
+                     signals changed since their last evaluation. The
+                     blocks should only depend on the values of their
+                     signals.
 
         """
-        _simulator._time = 0
+        scheduler = kwargs.pop('scheduler', 'heap')
+        engine = kwargs.pop('engine', 'event')
+        levelize = kwargs.pop('levelize', False)
+        partitions = kwargs.pop('partitions', None)
+        lanes = kwargs.pop('lanes', None)
+        packed = kwargs.pop('packed', False)
+        skip_idle = kwargs.pop('skip_idle', False)
+        if kwargs:
+            raise TypeError("Simulation: unexpected keyword argument '%s'"
+                            % sorted(kwargs)[0])
+        if scheduler not in _schedulers:
+            raise SimulationError(_error.SchedulerType, str(scheduler))
+        if engine not in ('event', 'cycle'):
+            raise SimulationError(_error.EngineType, str(engine))
         arglist = _flatten(*args)
-        self._waiters, self._cosims = _makeWaiters(arglist)
-        if Simulation._no_of_instances > 0:
-            raise SimulationError(_error.MultipleSim)
-        Simulation._no_of_instances += 1
+        signals = _reachable(arglist)
+        ownlist, ownsigs = arglist, signals
+        self._link = None
+        if packed and lanes is None:
+            raise SimulationError(_error.PackedLanes)
+        if lanes is not None:
+            if engine != 'event' or partitions is not None:
+                raise SimulationError(_error.CycleLanes)
+            if not isinstance(lanes, integer_types) or lanes < 1:
+                raise SimulationError(_error.LaneCount, repr(lanes))
+            if _simulator._tracing:
+                raise SimulationError(_error.LaneTrace)
+        if skip_idle and (engine != 'event' or partitions is not None or
+                          lanes is not None):
+            raise SimulationError(_error.CycleSkip)
+        if partitions is not None:
+            if engine != 'event':
+                raise SimulationError(_error.CyclePartitions)
+            if not hasattr(os, 'fork'):
+                raise SimulationError(_error.NoFork)
+            if partitions != 'auto':
+                partitions = [_flatten(group) for group in partitions]
+            plan = _Plan(arglist, partitions,
+                         scheduler=scheduler, levelize=levelize)
+            if len(plan.args) > 1:
+                self._link = _Coordinator(plan)
+                ownlist = plan.args[0]
+                ownsigs = _reachable(ownlist)
+            else:
+                warnings.warn(_error.OnePartition,
+                              category=SimulationWarning)
+        self._waiters, self._cosims, clocks = _makeWaiters(ownlist, ownsigs)
+        self._lazy = [clock for clock in clocks if clock.lazy]
+        self._cycle = None
+        if engine == 'cycle':
+            try:
+                self._cycle = _CycleEngine(arglist)
+            except _CycleFallback as e:
+                warnings.warn("%s: %s" % (_error.CycleFallback, e),
+                              category=SimulationWarning)
+                engine = 'event'
+        self.engine = engine
+        self._levels = None
+        if levelize and self._cycle is None:
+            self._levels = _makeLevels(ownlist)
+        self._monitors = _makeMonitors(ownlist)
+        self._batch = None
+        if packed:
+            self._batch = _PackedBatch(lanes, arglist, signals, clocks)
+        elif lanes is not None:
+            self._batch = _Batch(lanes, arglist, signals, clocks,
+                                 self._waiters)
+        self.activity = None
+        if skip_idle:
+            self.activity = _Activity(args, arglist, self._waiters)
+        self.activations = 0
+        self.timesteps = 0
         self._finished = False
-        del _futureEvents[:]
+        self._started = False
+        self._arglist = arglist
+        self._args = args
+        self.profile = None
+
+        # claim the signals, and the trace file if any
+        _claimSignals(signals)
+        ctx = _Context(_schedulers[scheduler](), signals,
+                       _simulator._tracing, _simulator._tf)
+        _simulator._tracing = 0
+        _contexts.append(ctx)
+        self._ctx = ctx
+        _activate(ctx)
+        for clock in clocks:
+            _schedule(clock._start(), clock)
+        for s in _siglist:
+            s._dirty = False
         del _siglist[:]
+        # bring the slice and concat signals up to date with their sources
+        for s in signals:
+            if isinstance(s, (_SliceSignal, ConcatSignal)):
+                s._sync()
+        _deactivate()
+
+    def _release(self):
+        """ Return the signals to the default registry """
+        ctx = self._ctx
+        if ctx in _contexts:
+            _contexts.remove(ctx)
+            _signals.extend(ctx.signals)
+        _deactivate()
 
     def _finalize(self):
         cosims = self._cosims
@@ -103,20 +275,121 @@ class Simulation(object):
         if _simulator._tracing:
             _simulator._tracing = 0
             _simulator._tf.close()
+        if self._link is not None:
+            self._link.quit()
+        if self._batch is not None:
+            self._batch.release()
+        if self.activity is not None:
+            self.activity.release()
         # clean up for potential new run with same signals
-        for s in _signals:
+        for s in self._ctx.signals:
             s._clear()
-        Simulation._no_of_instances = 0
+        self._release()
         self._finished = True
 
     def quit(self):
+        _activate(self._ctx)
         self._finalize()
 
-    def run(self, duration=None, quiet=0):
+    def checkpoint(self, path):
+        """ Save the simulation state to a file.
+
+        The state consists of the simulation time, the signal values,
+        the register variables of always_seq blocks and the pending
+        future events. The design should consist of always, always_seq
+        and always_comb blocks and Clock objects.
+
+        """
+        if self._link is not None:
+            raise SimulationError(_error.Partitioned)
+        _activate(self._ctx)
+        try:
+            _save(self, path)
+        finally:
+            _deactivate()
+
+    def restore(self, path):
+        """ Restore the simulation state from a checkpoint file.
+
+        The simulation should be of the same design as the one that saved
+        the checkpoint. It can be a new simulation, or one that has run.
+
+        """
+        if self._link is not None:
+            raise SimulationError(_error.Partitioned)
+        _activate(self._ctx)
+        try:
+            _load(self, path)
+            if self.activity is not None:
+                self.activity.wake()
+        finally:
+            _deactivate()
+
+    def fork_scenarios(self, scenarios, workers=None):
+        """ Run scenarios in forked processes, and return their results.
+
+        Each scenario is a callable that is called with the simulation in
+        a child process, forked from the current state. It can apply
+        stimulus, continue the run, and return a picklable result. The
+        simulation in the parent is not affected.
+
+        scenarios -- a sequence of callables
+        workers -- the maximum number of child processes that run at
+                   the same time (default: the number of CPUs)
+
+        When tracing, each child continues in a copy of the trace file,
+        with the index of the scenario appended to its name.
+
+        """
+        if self._link is not None:
+            raise SimulationError(_error.Partitioned)
+        _activate(self._ctx)
+        try:
+            return _forkScenarios(self, scenarios, workers)
+        finally:
+            _deactivate()
+
+    def watch(self, sig, predicate=None, action='suspend'):
+        """ Set a watchpoint on a signal, and return it.
+
+        The watchpoint is checked only when the signal changes.
+
+        sig -- the watched signal
+        predicate -- callable on the new value of the signal; the
+                     watchpoint hits when it returns true (default: on
+                     any change)
+        action -- 'suspend' to suspend the run at the end of the time
+                  step (default), 'stop' to stop the simulation at the
+                  end of the time step, or a callable that is called
+                  with the signal right away
+
+        """
+        if self._cycle is not None:
+            raise SimulationError(_error.CycleWatch)
+        if action not in ('suspend', 'stop') and not callable(action):
+            raise SimulationError(_error.WatchAction, repr(action))
+        if not isinstance(sig, _Signal):
+            raise SimulationError(_error.ArgType, str(type(sig)))
+        watchpoint = _Watchpoint(sig, predicate, action)
+        watchpoint.subscribe()
+        return watchpoint
+
+    def unwatch(self, watchpoint):
+        """ Remove a watchpoint """
+        watchpoint.unsubscribe()
+
+    def run(self, duration=None, quiet=0, profile=False, until=None):
         """ Run the simulation for some duration.
 
         duration -- specified simulation duration (default: forever)
         quiet -- don't print StopSimulation messages (default: off)
+        profile -- if true, add the activations and run time of each
+                   process, the signal updates, the delta cycles per
+                   time step and the future event queue depth to the
+                   profile attribute (default: off)
+        until -- a signal, or a (signal, predicate) tuple: suspend the
+                 run at the end of the time step in which the signal
+                 changes, to a value for which the predicate is true
 
         """
 
@@ -124,36 +397,109 @@ class Simulation(object):
         # From this point it will propagate to the caller, that can catch it.
         if self._finished:
             raise StopSimulation("Simulation has already finished")
+        self._started = True
+        prof = None
+        if profile:
+            if self._cycle is not None:
+                warnings.warn(_error.CycleProfile, category=SimulationWarning)
+            else:
+                if self.profile is None:
+                    self.profile = _Profile(self._args, self._arglist)
+                prof = self.profile
+        watchpoint = None
+        if until is not None:
+            if isinstance(until, tuple):
+                watchpoint = self.watch(*until)
+            else:
+                watchpoint = self.watch(until)
+        _activate(self._ctx)
+        try:
+            if self._cycle is not None:
+                return self._runCycles(duration, quiet)
+            return self._runEvents(duration, quiet, prof)
+        finally:
+            if watchpoint is not None:
+                watchpoint.unsubscribe()
+            _deactivate()
+
+    def _runEvents(self, duration, quiet, prof):
         waiters = self._waiters
+        _futureEvents = _simulator._futureEvents
         maxTime = None
         if duration:
             stop = _Waiter(None)
             stop.hasRun = 1
             maxTime = _simulator._time + duration
-            schedule((maxTime, stop))
+            _schedule(maxTime, stop)
         cosims = self._cosims
         t = _simulator._time
-        actives = {}
         tracing = _simulator._tracing
         tracefile = _simulator._tf
         exc = []
         _pop = waiters.pop
         _append = waiters.append
         _extend = waiters.extend
+        levels = self._levels
+        pending = {}
+        monitors = self._monitors
+        postponed = {}
+        nact = self.activations
+        nsteps = self.timesteps or 1
+        lazy = self._lazy
+        link = self._link
+        if link is not None:
+            link.start(self)
 
         while 1:
             try:
 
+                if _rearms:
+                    for waiter in _rearms:
+                        waiter.rearm()
+                    del _rearms[:]
+                if prof is not None:
+                    prof.delta()
+                    prof.update(_siglist)
                 for s in _siglist:
                     _extend(s._update())
                 del _siglist[:]
 
                 while waiters:
                     waiter = _pop()
+                    if monitors is not None:
+                        # defer postponed blocks to the end of the time
+                        # step, once per waiter: a block reached through
+                        # several subscriptions resumes on the first one,
+                        # and the others unlist themselves
+                        if id(waiter.generator) in monitors:
+                            postponed.setdefault(id(waiter), waiter)
+                            continue
+                    if levels is not None:
+                        # defer levelized always_comb blocks
+                        level = levels.get(id(waiter.generator))
+                        if level is not None:
+                            # queue a waiter once per level, even when
+                            # several of its inputs changed
+                            if level in pending:
+                                queued, seen = pending[level]
+                                if id(waiter) not in seen:
+                                    seen.add(id(waiter))
+                                    queued.append(waiter)
+                            else:
+                                pending[level] = ([waiter], set([id(waiter)]))
+                            continue
                     try:
-                        waiter.next(waiters, actives, exc)
+                        if prof is None:
+                            waiter.next(waiters, exc)
+                        else:
+                            prof.next(waiter, waiters, exc)
                     except StopIteration:
                         continue
+                    nact += 1
+
+                if link is not None and link._getMode:
+                    # pass the boundary signals between partitions
+                    link._exchange()
 
                 if cosims:
                     any_cosim_changes = False
@@ -173,48 +519,92 @@ class Simulation(object):
                 elif _siglist:
                     continue
 
-                if actives:
-                    for wl in actives.values():
-                        wl.purge()
-                    actives = {}
+                if pending:
+                    for waiter in pending.pop(min(pending))[0]:
+                        try:
+                            if prof is None:
+                                waiter.next(waiters, exc)
+                            else:
+                                prof.next(waiter, waiters, exc)
+                        except StopIteration:
+                            continue
+                        nact += 1
+                    continue
+
+                if postponed and not (_futureEvents and
+                                      _futureEvents.nextTime() == t):
+                    # the time step is over when time advances
+                    for waiter in postponed.values():
+                        try:
+                            if prof is None:
+                                waiter.next(waiters, exc)
+                            else:
+                                prof.next(waiter, waiters, exc)
+                        except StopIteration:
+                            continue
+                        nact += 1
+                    postponed.clear()
+                    if _siglist or waiters:
+                        continue
 
                 # at this point it is safe to potentially suspend a simulation
                 if exc:
                     raise exc[0]
 
                 # future events
-                if _futureEvents:
+                if _rearms:
+                    for waiter in _rearms:
+                        waiter.rearm()
+                    del _rearms[:]
+                if lazy:
+                    for clock in lazy:
+                        if clock._suspended and clock._listened():
+                            clock._resume()
+                if link is not None:
+                    link.collect()
+                if _futureEvents or link is not None:
                     if t == maxTime:
                         raise _SuspendSimulation(
                             "Simulated %s timesteps" % duration)
-                    _futureEvents.sort(key=itemgetter(0))
-                    t = _simulator._time = _futureEvents[0][0]
+                    if prof is not None and _futureEvents:
+                        prof.step(_futureEvents.nextTime(), len(_futureEvents))
+                    if link is None:
+                        t, events = _futureEvents.pop()
+                    else:
+                        t, events = link.advance()
+                    _simulator._time = t
+                    nsteps += 1
+                    if lazy:
+                        for clock in lazy:
+                            if clock._suspended:
+                                clock._sync()
                     if tracing:
                         print("#%s" % t, file=tracefile)
                     if cosims:
                         for cosim in cosims:
                             cosim._put(t)
-                    while _futureEvents:
-                        newt, event = _futureEvents[0]
-                        if newt == t:
-                            if isinstance(event, _Waiter):
-                                _append(event)
-                            else:
-                                _extend(event.apply())
-                            del _futureEvents[0]
+                    for event in events:
+                        if isinstance(event, _Waiter):
+                            _append(event)
                         else:
-                            break
+                            _extend(event.apply())
                 else:
                     raise StopSimulation("No more events")
 
             except _SuspendSimulation:
+                self.activations, self.timesteps = nact, nsteps
+                if link is not None:
+                    link.suspend()
                 if not quiet:
                     _printExcInfo()
                 if tracing:
                     tracefile.flush()
                 return 1
 
-            except StopSimulation:
+            except StopSimulation as e:
+                self.activations, self.timesteps = nact, nsteps
+                if link is not None:
+                    link._stop(e)
                 if not quiet:
                     _printExcInfo()
                 self._finalize()
@@ -222,6 +612,7 @@ class Simulation(object):
                 return 0
 
             except Exception as e:
+                self.activations, self.timesteps = nact, nsteps
                 if tracing:
                     tracefile.flush()
                 # if the exception came from a yield, make sure we can resume
@@ -232,16 +623,107 @@ class Simulation(object):
                 # now reraise the exepction
                 raise
 
+    def _runCycles(self, duration, quiet):
+        tracing = _simulator._tracing
+        cycle = self._cycle
+        try:
+            cycle.run(duration)
+        except _SuspendSimulation:
+            if not quiet:
+                _printExcInfo()
+            if tracing:
+                _simulator._tf.flush()
+            return 1
+        except StopSimulation:
+            if not quiet:
+                _printExcInfo()
+            self._finalize()
+            return 0
+        except Exception:
+            if tracing:
+                _simulator._tf.flush()
+            self._finalize()
+            raise
+        finally:
+            self.activations = cycle.activations
+            self.timesteps = cycle.timesteps
+
+
+def _reachable(arglist):
+    """ Return the unclaimed signals that the instances refer to.
+
+    Shadow signals, tristate drivers and their sources are included.
+    Generators, waiters and cosimulations do not tell which signals they
+    use: with those, all unclaimed signals are returned.
+    """
+    if any(isinstance(arg, (GeneratorType, _Waiter, Cosimulation))
+           for arg in arglist):
+        return _signals[:]
+    todo = []
+    for arg in arglist:
+        if isinstance(arg, Clock):
+            todo.append(arg.sig)
+        elif isinstance(arg, _Instantiator):
+            todo.extend(arg.sigdict.values())
+            for l in arg.losdict.values():
+                todo.extend(l)
+    seen = {}
+    while todo:
+        s = todo.pop()
+        if id(s) in seen or not isinstance(s, _Signal):
+            continue
+        seen[id(s)] = s
+        todo.extend(s._shadows)
+        for attr in ('_sig', '_bus'):
+            if hasattr(s, attr):
+                todo.append(getattr(s, attr))
+        for attr in ('_args', '_drivers'):
+            if hasattr(s, attr):
+                todo.extend(getattr(s, attr))
+    return [s for s in _signals if id(s) in seen]
+
+
+def _claimSignals(signals):
+    """ Remove the signals of a simulation from the default registry """
+    claimed = set(id(s) for s in signals)
+    _signals[:] = [s for s in _signals if id(s) not in claimed]
+
+
+def _makeLevels(arglist):
+    """ Return the levels of the always_comb generators, by generator id """
+    combs = [arg for arg in arglist if isinstance(arg, _AlwaysComb)]
+    levels, loops = _levelize(combs)
+    if loops:
+        warnings.warn("%s: %s" % (_error.CombLoop, ", ".join(loops)),
+                      category=SimulationWarning)
+    genlevels = {}
+    for inst, level in zip(combs, levels):
+        if level is not None:
+            genlevels[id(inst.gen)] = level
+    return genlevels or None
+
+
+def _makeMonitors(arglist):
+    """ Return the ids of the generators of the postponed blocks """
+    monitors = set()
+    for arg in arglist:
+        if isinstance(arg, _Instantiator) and arg.postponed:
+            monitors.add(id(arg.gen))
+    return monitors or None
+
 
-def _makeWaiters(arglist):
+def _makeWaiters(arglist, signals):
     waiters = []
     ids = set()
     cosims = []
+    clocks = []
     for arg in arglist:
         if isinstance(arg, GeneratorType):
             waiters.append(_inferWaiter(arg))
+        elif isinstance(arg, Clock):
+            clocks.append(arg)
         elif isinstance(arg, _Instantiator):
-            waiters.append(arg.waiter)
+            waiters.append(arg._process())
         elif isinstance(arg, Cosimulation):
             cosims.append(arg)
             waiters.append(_SignalTupleWaiter(arg._waiter()))
@@ -254,8 +736,8 @@ def _makeWaiters(arglist):
         if id(arg) in ids:
             raise SimulationError(_error.DuplicatedArg)
         ids.add(id(arg))
-    # add waiters for shadow signals
-    for sig in _signals:
+    # add waiters for tristate and assigned signals
+    for sig in signals:
         if hasattr(sig, '_waiter'):
             waiters.append(sig._waiter)
-    return waiters, cosims
+    return waiters, cosims, clocks
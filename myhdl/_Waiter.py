@@ -24,23 +24,23 @@ from __future__ import absolute_import
 from types import GeneratorType
 
 import ast
-import inspect
 
 
-from myhdl._util import _dedent
+from myhdl._util import _parse, _codeKey
+from myhdl._cache import _Cache
+from myhdl._resolverefs import _codeNames
 from myhdl._delay import delay
 from myhdl._join import join
 from myhdl._Signal import _Signal, _WaiterList, posedge, negedge
 from myhdl import _simulator
-from myhdl._simulator import _futureEvents
-
-
-schedule = _futureEvents.append
+from myhdl._simulator import _schedule as schedule
+from myhdl._simulator import _rearms
 
 
 class _Waiter(object):
 
-    __slots__ = ('caller', 'generator', 'hasRun', 'nrTriggers', 'semaphore')
+    __slots__ = ('caller', 'generator', 'hasRun', 'nrTriggers', 'semaphore',
+                 'subs')
 
     def __init__(self, generator, caller=None):
         self.caller = caller
@@ -48,8 +48,9 @@ class _Waiter(object):
         self.hasRun = 0
         self.nrTriggers = 1
         self.semaphore = 0
+        self.subs = ()
 
-    def next(self, waiters, actives, exc):
+    def next(self, waiters, exc):
 
         if self.hasRun:
             raise StopIteration
@@ -61,7 +62,15 @@ class _Waiter(object):
         if self.nrTriggers == 1:
             clone = self
         else:
+            # stale in the other lists it waits on; the list that
+            # triggered it has been cleared
             self.hasRun = 1
+            for sub in self.subs:
+                sub.hasRun = 1
+                if sub.listed:
+                    sub.listed = 0
+                    sub.counted = 1
+                    sub.wl.drop()
             clone = _Waiter(self.generator, self.caller)
 
         try:
@@ -85,20 +94,22 @@ class _Waiter(object):
         else:
             clauses = (clause,)
 
-        nr = len(clauses)
+        if clone.nrTriggers > 1:
+            subs = clone.subs = []
+        else:
+            subs = None
         for clause in clauses:
-            if isinstance(clause, _WaiterList):
-                clause.append(clone)
-                if nr > 1:
-                    actives[id(clause)] = clause
-            elif isinstance(clause, _Signal):
-                wl = clause._eventWaiters
-                wl.append(clone)
-                if nr > 1:
-                    actives[id(wl)] = wl
+            if isinstance(clause, (_WaiterList, _Signal)):
+                if isinstance(clause, _Signal):
+                    clause = clause._eventWaiters
+                if subs is None:
+                    clause.append(clone)
+                else:
+                    sub = _Subscription(clone, clause)
+                    clause.append(sub)
+                    subs.append(sub)
             elif isinstance(clause, delay):
-                t = _simulator._time
-                schedule((t + clause._time, clone))
+                schedule(_simulator._time + clause._time, clone)
             elif isinstance(clause, GeneratorType):
                 waiters.append(_Waiter(clause, clone))
             elif isinstance(clause, _Instantiator):
@@ -116,6 +127,37 @@ class _Waiter(object):
                                 (repr(clause), type(clause)))
 
 
+class _Subscription(object):
+
+    """ Subscription of a _Waiter on several lists to one of them.
+
+    When a list triggers, it removes its subscriptions, which mark
+    themselves unlisted before they run their waiter, so that the waiter
+    drops itself only from the lists that still hold it. A list that
+    triggers in the same delta cycle as another one, after the waiter
+    has run, takes back the stale entry that the waiter counted on it.
+    """
+
+    __slots__ = ('waiter', 'generator', 'wl', 'listed', 'counted', 'hasRun')
+
+    def __init__(self, waiter, wl):
+        self.waiter = waiter
+        self.generator = waiter.generator
+        self.wl = wl
+        self.listed = 1
+        self.counted = 0
+        self.hasRun = 0
+
+    def next(self, waiters, exc):
+        self.listed = 0
+        if self.hasRun:
+            if self.counted and self.wl.stale:
+                self.counted = 0
+                self.wl.stale -= 1
+            raise StopIteration
+        self.waiter.next(waiters, exc)
+
+
 class _DelayWaiter(_Waiter):
 
     __slots__ = ('generator')
@@ -123,9 +165,9 @@ class _DelayWaiter(_Waiter):
     def __init__(self, generator):
         self.generator = generator
 
-    def next(self, waiters, actives, exc):
+    def next(self, waiters, exc):
         clause = next(self.generator)
-        schedule((_simulator._time + clause._time, self))
+        schedule(_simulator._time + clause._time, self)
 
 
 class _EdgeWaiter(_Waiter):
@@ -136,28 +178,112 @@ class _EdgeWaiter(_Waiter):
         self.generator = generator
         self.hasRun = 0
 
-    def next(self, waiters, actives, exc):
+    def next(self, waiters, exc):
         clause = next(self.generator)
         clause.append(self)
 
 
-class _EdgeTupleWaiter(_Waiter):
+class _Trigger(object):
 
-    __slots__ = ('generator', 'hasRun')
+    """ Subscription of a tuple waiter to a waiter list.
+
+    A trigger stays in its list until the list is triggered, and is put
+    back when its waiter is rearmed. A trigger with hasRun set has been
+    dropped, and is removed from its list when the list triggers or
+    purges its stale waiters.
+    """
+
+    __slots__ = ('waiter', 'generator', 'wl', 'listed', 'hasRun')
+
+    def __init__(self, waiter, wl):
+        self.waiter = waiter
+        self.generator = waiter.generator
+        self.wl = wl
+        self.listed = 0
+        self.hasRun = 0
+
+    def next(self, waiters, exc):
+        self.listed = 0
+        waiter = self.waiter
+        if self.hasRun or not waiter.armed:
+            raise StopIteration
+        waiter.armed = 0
+        waiter._run()
+
+
+class _TupleWaiter(_Waiter):
+
+    """ Base class of the waiters on a tuple of waiter lists.
+
+    The waiter keeps a _Trigger per list of the tuple, and reuses them as
+    long as the generator yields the same tuple. The first trigger that
+    runs disarms the waiter, so that the others are skipped. The kernel
+    rearms the waiter after the delta cycle, by putting its triggered
+    subscriptions back in their lists. An activation allocates nothing.
+    """
+
+    __slots__ = ('generator', 'hasRun', 'armed', 'clauses', 'triggers')
 
     def __init__(self, generator):
         self.generator = generator
         self.hasRun = 0
+        self.armed = 0
+        self.clauses = None
+        self.triggers = ()
 
-    def next(self, waiters, actives, exc):
-        if self.hasRun:
-            raise StopIteration
-        clauses = next(self.generator)
-        self.hasRun = 1
-        clone = _EdgeTupleWaiter(self.generator)
-        for clause in clauses:
-            clause.append(clone)
-            actives[id(clause)] = clause
+    def next(self, waiters, exc):
+        # initial run: start from fresh subscriptions
+        self.armed = 0
+        self.clauses = None
+        self._run()
+
+    def _run(self):
+        try:
+            clauses = next(self.generator)
+        except StopIteration:
+            # the process has ended: release its other subscriptions
+            self._release()
+            raise
+        if clauses is not self.clauses:
+            if not _sameClauses(clauses, self.clauses):
+                self._release()
+                self.triggers = [_Trigger(self, self._waiterList(clause))
+                                 for clause in clauses]
+            self.clauses = clauses
+        _rearms.append(self)
+
+    def _release(self):
+        """ Drop the triggers from the lists that still hold them """
+        for trigger in self.triggers:
+            trigger.hasRun = 1
+            if trigger.listed:
+                trigger.wl.drop()
+        self.triggers = ()
+
+    def rearm(self):
+        for trigger in self.triggers:
+            if not trigger.listed:
+                trigger.listed = 1
+                trigger.wl.append(trigger)
+        self.armed = 1
+
+
+def _sameClauses(clauses, old):
+    """ Return True if the tuples hold the same objects """
+    if old is None or len(clauses) != len(old):
+        return False
+    for clause, oldclause in zip(clauses, old):
+        if clause is not oldclause:
+            return False
+    return True
+
+
+class _EdgeTupleWaiter(_TupleWaiter):
+
+    __slots__ = ()
+
+    def _waiterList(self, clause):
+        return clause
 
 
 class _SignalWaiter(_Waiter):
@@ -168,29 +294,94 @@ class _SignalWaiter(_Waiter):
         self.generator = generator
         self.hasRun = 0
 
-    def next(self, waiters, actives, exc):
+    def next(self, waiters, exc):
         clause = next(self.generator)
         clause._eventWaiters.append(self)
 
 
-class _SignalTupleWaiter(_Waiter):
+class _SignalTupleWaiter(_TupleWaiter):
 
-    __slots__ = ('generator', 'hasRun')
+    __slots__ = ()
 
-    def __init__(self, generator):
+    def _waiterList(self, clause):
+        return clause._eventWaiters
+
+
+class _FuncWaiter(_Waiter):
+
+    """ Waiter of a process with a static sensitivity list.
+
+    The waiter stays subscribed to the procs lists of its waiter lists,
+    and a trigger calls the function of the process directly, without
+    resuming a generator. The generator is kept to identify the process.
+    """
+
+    __slots__ = ('generator', 'hasRun', 'func', 'wls')
+
+    def __init__(self, generator, func, wls):
         self.generator = generator
         self.hasRun = 0
+        self.func = func
+        self.wls = wls
 
-    def next(self, waiters, actives, exc):
-        if self.hasRun:
+    def next(self, waiters, exc):
+        self.func()
+
+    def subscribe(self):
+        for wl in self.wls:
+            wl.procs.append(self)
+
+
+class _FuncTupleWaiter(_FuncWaiter):
+
+    """ _FuncWaiter on several waiter lists.
+
+    The lists may trigger in the same delta cycle: the first trigger
+    disarms the waiter, and the kernel rearms it after the delta cycle.
+    """
+
+    __slots__ = ('armed',)
+
+    def __init__(self, generator, func, wls):
+        _FuncWaiter.__init__(self, generator, func, wls)
+        self.armed = 0
+
+    def next(self, waiters, exc):
+        if not self.armed:
             raise StopIteration
-        clauses = next(self.generator)
-        self.hasRun = 1
-        clone = _SignalTupleWaiter(self.generator)
-        for clause in clauses:
-            wl = clause._eventWaiters
-            wl.append(clone)
-            actives[id(wl)] = wl
+        self.armed = 0
+        _rearms.append(self)
+        self.func()
+
+    def subscribe(self):
+        _FuncWaiter.subscribe(self)
+        self.armed = 1
+
+    def rearm(self):
+        self.armed = 1
+
+
+class _FuncStarter(_Waiter):
+
+    """ Initial run of a _FuncWaiter.
+
+    It subscribes the waiter, and calls the function first if the process
+    runs before it waits, like an always_comb block.
+    """
+
+    __slots__ = ('generator', 'hasRun', 'waiter', 'first')
+
+    def __init__(self, waiter, first):
+        self.generator = waiter.generator
+        self.hasRun = 0
+        self.waiter = waiter
+        self.first = first
+
+    def next(self, waiters, exc):
+        waiter = self.waiter
+        waiter.subscribe()
+        if self.first:
+            waiter.func()
 
 
 #_kind = enum("SIGNAL_TUPLE", "EDGE_TUPLE", "SIGNAL", "EDGE", "DELAY", "UNDEFINED")
@@ -203,25 +394,48 @@ class _kind(object):
     UNDEFINED = 6
 
 
+def _nameKind(f, n):
+    """ Return the kind of name n in frame f, as _YieldVisitor sees it """
+    if n in f.f_locals:
+        obj = f.f_locals[n]
+    else:
+        obj = f.f_globals.get(n)
+    if isinstance(obj, _Signal):
+        return _kind.SIGNAL
+    elif obj is delay:
+        return _kind.DELAY
+    elif obj is posedge or obj is negedge:
+        return _kind.EDGE
+    return _kind.UNDEFINED
+
+
+_waiterKinds = _Cache('waiter', persistent=True)
+
+
 def _inferWaiter(gen):
     f = gen.gi_frame
-    s = inspect.getsource(f)
-    s = _dedent(s)
-    root = ast.parse(s)
-    root.symdict = f.f_globals.copy()
-    root.symdict.update(f.f_locals)
-    # print ast.dump(root)
-    v = _YieldVisitor(root)
-    v.visit(root)
-    if v.kind == _kind.EDGE_TUPLE:
+    code = gen.gi_code
+    names = _codeNames(code)[0]
+    # the inferred kind depends on the kinds of the names only
+    shape = _codeKey(code) + (tuple([_nameKind(f, n) for n in names]),)
+    kind = _waiterKinds.lookup(shape)
+    if kind is None:
+        root = _parse(code)
+        root.symdict = f.f_globals.copy()
+        root.symdict.update(f.f_locals)
+        # print ast.dump(root)
+        v = _YieldVisitor(root)
+        v.visit(root)
+        kind = _waiterKinds[shape] = v.kind or 0
+    if kind == _kind.EDGE_TUPLE:
         return _EdgeTupleWaiter(gen)
-    if v.kind == _kind.SIGNAL_TUPLE:
+    if kind == _kind.SIGNAL_TUPLE:
         return _SignalTupleWaiter(gen)
-    if v.kind == _kind.DELAY:
+    if kind == _kind.DELAY:
         return _DelayWaiter(gen)
-    if v.kind == _kind.EDGE:
+    if kind == _kind.EDGE:
         return _EdgeWaiter(gen)
-    if v.kind == _kind.SIGNAL:
+    if kind == _kind.SIGNAL:
         return _SignalWaiter(gen)
     # default
     return _Waiter(gen)
@@ -28,6 +28,7 @@ SignalType -- Signal base class
 ConcatSignal --  factory function that models a concatenation shadow signal
 TristateSignal -- factory function that models a tristate shadow signal
 delay -- callable to model delay in a yield statement
+Clock -- clock generator that is scheduled natively by the simulator
 posedge -- callable to model a rising edge on a signal in a yield statement
 negedge -- callable to model a falling edge on a signal in a yield statement
 join -- callable to join clauses in a yield statement
@@ -91,6 +92,10 @@ class InstanceError(Error):
     pass
 
 
+class ClockError(Error):
+    pass
+
+
 class BlockError(Error):
     pass
 
@@ -137,6 +142,11 @@ class ToVerilogWarning(ConversionWarning):
 
 class ToVHDLWarning(ConversionWarning):
     pass
+
+
+class SimulationWarning(UserWarning):
+    pass
+
 # warnings.filterwarnings('always', r".*", ToVerilogWarning)
 
 # def showwarning(message, category, filename, lineno, *args):
@@ -163,8 +173,9 @@ from ._misc import instances, downrange
 from ._always_comb import always_comb
 from ._always_seq import always_seq, ResetSignal
 from ._always import always
-from ._instance import instance
+from ._instance import instance, postponed
 from ._block import block
+from ._clock import Clock
 from ._enum import enum, EnumType, EnumItemType
 from ._traceSignals import traceSignals
 
@@ -195,7 +206,9 @@ __all__ = ["bin",
            "Simulation",
            "instances",
            "instance",
+           "postponed",
            "block",
+           "Clock",
            "always_comb",
            "always_seq",
            "ResetSignal",
@@ -0,0 +1,175 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Activity-based skipping of idle always_seq blocks """
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+
+from myhdl._Signal import _DelayedSignal
+from myhdl._always_seq import _AlwaysSeq
+from myhdl._levelize import _sigs
+from myhdl._profile import _hierarchyNames
+from myhdl._Waiter import _FuncStarter
+
+
+class _BlockActivity(object):
+
+    """ Activity state of an always_seq block.
+
+    The block is dirty when one of its input signals changed since its
+    last evaluation. Otherwise, an evaluation would assign the same
+    values as the previous one, which its registers already hold.
+    """
+
+    __slots__ = ('path', 'dirty', 'evaluations', 'skips')
+
+    def __init__(self, path):
+        self.path = path
+        self.dirty = True
+        self.evaluations = 0
+        self.skips = 0
+
+
+def _marking(sig, blocks):
+    """ Return the update method of sig, wrapped to mark the blocks that
+    read sig dirty when it changes.
+
+    The marks are set in the update of the signal, before any process
+    of the delta cycle runs, so that they do not depend on the order of
+    the processes that a clock edge in the same delta cycle triggers.
+    """
+    update = sig._update
+
+    def marked():
+        if sig._val != sig._next:
+            for b in blocks:
+                b.dirty = True
+        return update()
+    return marked
+
+
+def _skipping(func, block):
+    """ Return func, wrapped to skip the calls while block is clean """
+    def activation():
+        if block.dirty:
+            block.dirty = False
+            block.evaluations += 1
+            func()
+        else:
+            block.skips += 1
+    return activation
+
+
+class _Activity(object):
+
+    """ Activity of the always_seq blocks of a simulation.
+
+    An always_seq block without register variables is skipped on its
+    clock edge when none of its input signals, including the reset,
+    changed since its last evaluation. The block should only depend on
+    the values of its signals. Blocks that read delayed signals, which
+    change outside of the update method, are always evaluated.
+
+    Methods:
+    report -- write a text report
+
+    Attributes:
+    blocks -- {name: [evaluations, skips]} per tracked block
+
+    """
+
+    def __init__(self, args, arglist, waiters):
+        paths = _hierarchyNames(args, arglist)[0]
+        insts = {}
+        for arg in arglist:
+            if isinstance(arg, _AlwaysSeq) and not arg.varregs:
+                insts[id(arg.gen)] = arg
+        self._blocks = []
+        readers = {}
+        for w in waiters:
+            inst = insts.get(id(w.generator))
+            if inst is None or not isinstance(w, _FuncStarter):
+                continue
+            sigs = _sigs(inst, inst.inputs)
+            if inst.reset is not None:
+                sigs.append(inst.reset)
+            if any(isinstance(s, _DelayedSignal) for s in sigs):
+                continue
+            block = _BlockActivity(paths.get(id(inst.gen), (inst.name,)))
+            self._blocks.append(block)
+            for s in sigs:
+                if id(s) not in readers:
+                    readers[id(s)] = (s, [])
+                blocks = readers[id(s)][1]
+                if block not in blocks:
+                    blocks.append(block)
+            w.waiter.func = _skipping(w.waiter.func, block)
+        self._saved = []
+        for s, blocks in readers.values():
+            self._saved.append((s, s._update))
+            s._update = _marking(s, blocks)
+
+    def wake(self):
+        """ Mark all blocks dirty, after the signals were set directly """
+        for b in self._blocks:
+            b.dirty = True
+
+    def release(self):
+        """ Restore the update methods of the signals """
+        for s, update in self._saved:
+            s._update = update
+        del self._saved[:]
+
+    @property
+    def blocks(self):
+        blocks = {}
+        for b in self._blocks:
+            name = ".".join(b.path)
+            if name in blocks:
+                blocks[name][0] += b.evaluations
+                blocks[name][1] += b.skips
+            else:
+                blocks[name] = [b.evaluations, b.skips]
+        return blocks
+
+    def report(self, f=None, limit=20):
+        """ Write a text report, with the blocks by decreasing evaluations.
+
+        f -- file to write to (default: sys.stdout)
+        limit -- number of blocks to list
+
+        """
+        f = f or sys.stdout
+        blocks = sorted(self.blocks.items(),
+                        key=lambda item: (-item[1][0], item[0]))
+        print("%12s %12s %8s  %s" %
+              ("evaluations", "skips", "% skip", "block"), file=f)
+        for name, (n, skips) in blocks[:limit]:
+            total = n + skips
+            print("%12d %12d %8.1f  %s" %
+                  (n, skips, 100.0 * skips / total if total else 0, name),
+                  file=f)
+        n = sum(n for n, skips in self.blocks.values())
+        skips = sum(skips for n, skips in self.blocks.values())
+        if n + skips:
+            print("skipped %d of %d activations (%.1f%%)" %
+                  (skips, n + skips, 100.0 * skips / (n + skips)), file=f)
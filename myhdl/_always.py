@@ -29,7 +29,8 @@ from myhdl._delay import delay
 from myhdl._Signal import _Signal
 from myhdl._Signal import _WaiterList
 from myhdl._Waiter import _Waiter, _SignalWaiter, _SignalTupleWaiter, \
-    _DelayWaiter, _EdgeWaiter, _EdgeTupleWaiter
+    _DelayWaiter, _EdgeWaiter, _EdgeTupleWaiter, _FuncWaiter, \
+    _FuncTupleWaiter, _FuncStarter
 from myhdl._instance import _Instantiator, _getCallInfo
 
 
@@ -88,6 +89,9 @@ def always(*args):
 
 class _Always(_Instantiator):
 
+    # whether the function runs before the block first waits
+    _runFirst = False
+
     def __init__(self, func, senslist, callinfo, sigdict=None):
         self.func = func
         self.senslist = tuple(senslist)
@@ -100,6 +104,26 @@ class _Always(_Instantiator):
     def funcobj(self):
         return self.func
 
+    def _process(self):
+        # with signals and edges only, the function is called directly
+        wls = []
+        for s in self.senslist:
+            if isinstance(s, _Signal):
+                wls.append(s._eventWaiters)
+            elif isinstance(s, _WaiterList):
+                wls.append(s)
+            else:
+                return self.waiter
+        if len(wls) == 1:
+            w = _FuncWaiter(self.gen, self._activation(), wls)
+        else:
+            w = _FuncTupleWaiter(self.gen, self._activation(), wls)
+        return _FuncStarter(w, self._runFirst)
+
+    def _activation(self):
+        """ Return the function that runs on each activation """
+        return self.func
+
     def _waiter(self):
         # infer appropriate waiter class
         # first infer base type of arguments
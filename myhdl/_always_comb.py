@@ -53,6 +53,8 @@ def always_comb(func):
 
 class _AlwaysComb(_Always):
 
+    _runFirst = True
+
     def __init__(self, func, callinfo):
         senslist = []
         super(_AlwaysComb, self).__init__(func, senslist, callinfo=callinfo)
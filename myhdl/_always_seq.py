@@ -132,6 +132,23 @@ class _AlwaysSeq(_Always):
             _, reg, init = v
             reg._val = init
 
+    def _activation(self):
+        if self.reset is None:
+            return self.func
+        reset = self.reset
+        active = reset.active
+        reset_sigs = self.reset_sigs
+        reset_vars = self.reset_vars
+        func = self.func
+
+        def activation():
+            if reset == active:
+                reset_sigs()
+                reset_vars()
+            else:
+                func()
+        return activation
+
     def genfunc_reset(self):
         senslist = self.senslist
         if len(senslist) == 1:
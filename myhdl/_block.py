@@ -29,7 +29,7 @@ import myhdl
 from myhdl._compat import PY2
 from myhdl import BlockError, BlockInstanceError, Cosimulation
 from myhdl._instance import _Instantiator
-from myhdl._util import _flatten
+from myhdl._util import _flatten, _getFrames
 from myhdl._extractHierarchy import (_makeMemInfo,
                                      _UserVerilogCode, _UserVhdlCode,
                                      _UserVerilogInstance, _UserVhdlInstance)
@@ -41,6 +41,7 @@ class _error:
     pass
 _error.ArgType = "%s: A block should return block or instantiator objects"
 _error.InstanceError = "%s: subblock %s should be encapsulated in a block decorator"
+_error.SimArgs = "%s: the simulation exists, its arguments cannot be changed: %s"
 
 
 class _CallInfo(object):
@@ -65,27 +66,26 @@ def _getCallInfo():
 
     """
 
-    stack = inspect.stack()
+    stack = _getFrames(6)
     # caller may be undefined if instantiation from a Python module
-    callerrec = None
-    funcrec = stack[3]
-    name = funcrec[3]
+    callerframe = None
+    frame = stack[3]
+    name = frame.f_code.co_name
     if len(stack) > 4:
-        callerrec = stack[4]
+        callerframe = stack[4]
     # special case for list comprehension's extra scope in PY3
     if name == '<listcomp>':
         if not PY2:
-            funcrec = stack[4]
+            frame = stack[4]
             if len(stack) > 5:
-                callerrec = stack[5]
+                callerframe = stack[5]
 
-    name = funcrec[3]
-    frame = funcrec[0]
+    name = frame.f_code.co_name
     symdict = dict(frame.f_globals)
     symdict.update(frame.f_locals)
     modctxt = False
-    if callerrec is not None:
-        f_locals = callerrec[0].f_locals
+    if callerframe is not None:
+        f_locals = callerframe.f_locals
         if 'self' in f_locals:
             modctxt = isinstance(f_locals['self'], _Block)
     return _CallInfo(name, modctxt, symdict)
@@ -220,6 +220,7 @@ class _Block(object):
         self._updateNamespaces()
         self.verilog_code = self.vhdl_code = None
         self.sim = None
+        self._sim_kwargs = {}
         if hasattr(deco, 'verilog_code'):
             self.verilog_code = _UserVerilogCode(deco.verilog_code, self.symdict, func.__name__,
                                                  func, srcfile, srcline)
@@ -316,7 +317,8 @@ class _Block(object):
                 dump all signal waveforms. Defaults to False.
             testbench (Optional[bool]): Verilog only. Specifies whether a
                 testbench should be created. Defaults to True.
-            timescale(Optional[str]): Verilog only. Defaults to '1ns/10ps'
+            timescale(Optional[str]): Defaults to '1ns/10ps'. In VHDL, its
+                unit is the unit of the delays.
         """
 
         self._clear()
@@ -334,8 +336,8 @@ class _Block(object):
         conv_attrs['directory'] = kwargs.pop('path', '')
         if hdl.lower() == 'verilog':
             conv_attrs['no_testbench'] = not kwargs.pop('testbench', True)
-            conv_attrs['timescale'] = kwargs.pop('timescale', '1ns/10ps')
             conv_attrs['trace'] = kwargs.pop('trace', False)
+        conv_attrs['timescale'] = kwargs.pop('timescale', '1ns/10ps')
         conv_attrs.update(kwargs)
         for k, v in conv_attrs.items():
             setattr(converter, k, v)
@@ -348,12 +350,20 @@ class _Block(object):
                 setattr(myhdl.traceSignals, k, v)
             myhdl.traceSignals(self)
 
-    def run_sim(self, duration=None, quiet=0):
+    def run_sim(self, duration=None, quiet=0, **kwargs):
         if self.sim is None:
             sim = self
             #if self._config_sim['trace']:
             #    sim = myhdl.traceSignals(self)
-            self.sim = myhdl._Simulation.Simulation(sim)
+            self.sim = myhdl._Simulation.Simulation(sim, **kwargs)
+            self._sim_kwargs = kwargs
+        elif kwargs:
+            # the arguments only apply when the simulation is created
+            changed = sorted(k for k in kwargs if k not in self._sim_kwargs or
+                             self._sim_kwargs[k] != kwargs[k])
+            if changed:
+                raise BlockError(_error.SimArgs %
+                                 (self.name, ', '.join(changed)))
         self.sim.run(duration, quiet)
 
     def quit_sim(self):
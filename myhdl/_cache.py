@@ -0,0 +1,206 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Caches of the source analysis done during elaboration.
+
+Instances with the same code share the parsed source and the results of
+its analysis, that are kept per code object.
+
+The persistent caches are also kept on disk, in the directory named by
+the MYHDL_CACHE_DIR environment variable, so that they are shared by
+later runs and by concurrent processes. The keys of a persistent cache
+start with the file name and the code object; on disk, their values are
+stored per code object in a file that is only valid for the contents of
+its source file.
+"""
+from __future__ import absolute_import
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+
+class _Cache(dict):
+
+    """ Dictionary that counts the hits and misses of its lookups """
+
+    def __init__(self, name, persistent=False):
+        self.name = name
+        self.persistent = persistent
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        _caches.append(self)
+
+    def lookup(self, key):
+        """ Return the value for key, or None if it is not cached """
+        value = self.get(key)
+        if value is None and self.persistent and _cacheDir is not None:
+            value = _load(self.name, key)
+            if value is not None:
+                dict.__setitem__(self, key, value)
+                self.loads += 1
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        if self.persistent and _cacheDir is not None:
+            _store(self.name, key, value)
+
+    def clear(self):
+        dict.clear(self)
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+
+_caches = []
+
+
+def _cacheStats():
+    """ Return {name: (hits, misses, size, loads)} of the caches """
+    return dict((c.name, (c.hits, c.misses, len(c), c.loads))
+                for c in _caches)
+
+
+def _clearCaches():
+    for c in _caches:
+        c.clear()
+    _entries.clear()
+    _digests.clear()
+
+
+_cacheDir = None
+_entries = {}
+_digests = {}
+
+
+def _setCacheDir(path):
+    """ Set the directory of the on-disk cache, or disable it with None.
+
+    The entries are kept in a subdirectory per MyHDL and Python version,
+    like the byte code in __pycache__.
+    """
+    global _cacheDir
+    from myhdl import __version__
+    _entries.clear()
+    _digests.clear()
+    if path:
+        impl = getattr(sys, 'implementation', None)
+        tag = getattr(impl, 'cache_tag', None) or \
+            "python-%d%d" % sys.version_info[:2]
+        _cacheDir = os.path.join(path, "myhdl-%s-%s" % (__version__, tag))
+    else:
+        _cacheDir = None
+
+
+def _fileDigest(filename):
+    """ Return the digest of the contents of a source file, or None """
+    try:
+        st = os.stat(filename)
+    except (OSError, TypeError):
+        return None
+    stamp = (st.st_mtime, st.st_size)
+    d = _digests.get(filename)
+    if d is None or d[0] != stamp:
+        try:
+            with open(filename, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except (IOError, OSError):
+            return None
+        d = _digests[filename] = (stamp, digest)
+    return d[1]
+
+
+def _entry(key):
+    """ Return the path and the values of the entry of a cache key.
+
+    The values are None when the source file can not be found.
+    """
+    filename, code = key[:2]
+    digest = _fileDigest(filename)
+    if digest is None:
+        return None, None
+    ident = "%s:%s:%d" % (filename, code.co_name, code.co_firstlineno)
+    path = os.path.join(_cacheDir,
+                        hashlib.sha1(ident.encode('utf-8')).hexdigest())
+    # the entry holds the values for the current contents only
+    stamp = (digest, code.co_flags)
+    entry = _entries.get(path)
+    if entry is None or entry[0] != stamp:
+        values = _read(path, stamp)
+        entry = _entries[path] = (stamp, values)
+    return path, entry[1]
+
+
+def _read(path, stamp):
+    """ Return the values of an entry file, or {} if it is not valid """
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        return {}
+    if not isinstance(data, tuple) or len(data) != 2 or data[0] != stamp:
+        return {}
+    return data[1]
+
+
+def _load(name, key):
+    path, values = _entry(key)
+    if values is None:
+        return None
+    return values.get((name,) + key[2:])
+
+
+def _store(name, key, value):
+    path, values = _entry(key)
+    if values is None:
+        return
+    stamp = _entries[path][0]
+    values[(name,) + key[2:]] = value
+    # keep what other processes stored since the entry was read
+    for k, v in _read(path, stamp).items():
+        values.setdefault(k, v)
+    # write a temporary file and rename it, so that a reader sees either
+    # the previous or the new contents
+    # the cache is an optimization: failing to write it is not an error
+    try:
+        if not os.path.isdir(_cacheDir):
+            os.makedirs(_cacheDir)
+        fd, tmp = tempfile.mkstemp(dir=_cacheDir, suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((stamp, values), f, pickle.HIGHEST_PROTOCOL)
+        getattr(os, 'replace', os.rename)(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+_setCacheDir(os.environ.get('MYHDL_CACHE_DIR'))
@@ -0,0 +1,211 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the checkpoint and restore functions of Simulation.
+
+A checkpoint is a JSON file with the simulation time, the values of the
+signals of the design, the register variables of always_seq blocks and
+the pending future events. It is restored into a Simulation of the same
+design, that may be a new one or the one that saved it. Only designs
+built from always, always_seq and always_comb blocks and Clock objects
+are supported: the state of generators can not be saved.
+"""
+from __future__ import absolute_import
+
+import json
+
+from myhdl import SimulationError
+from myhdl import _simulator
+from myhdl._compat import integer_types, string_types
+from myhdl._intbv import intbv
+from myhdl._fixbv import fixbv
+from myhdl._enum import EnumItemType
+from myhdl._delay import delay
+from myhdl._simulator import _siglist, _schedule
+from myhdl._always import _Always
+from myhdl._always_seq import _AlwaysSeq
+from myhdl._clock import Clock
+
+
+class _error:
+    pass
+_error.Instance = "Checkpoints are only supported for designs of always, " \
+    "always_seq and always_comb blocks and Clock objects, not"
+_error.MixedDelay = "Checkpoints are not supported for always blocks " \
+    "that wait on a delay and on signals"
+_error.ValueType = "Signal value type not supported in checkpoints"
+_error.Event = "Pending event not supported in checkpoints"
+_error.NotStarted = "Checkpoint requires a simulation that has run"
+_error.Finished = "Simulation has already finished"
+_error.Mismatch = "Checkpoint does not match the design"
+
+_version = 1
+
+
+def _design(sim):
+    """ Return the instances and the signals of a simulation """
+    insts = []
+    sigs = []
+    ids = set()
+    for arg in sim._arglist:
+        if isinstance(arg, Clock):
+            group = [arg.sig]
+        elif isinstance(arg, _Always):
+            if len(arg.senslist) > 1 and \
+                    any(isinstance(s, delay) for s in arg.senslist):
+                raise SimulationError(_error.MixedDelay, arg.name)
+            group = [arg.sigdict[n] for n in sorted(arg.sigdict)]
+            for n in sorted(arg.losdict):
+                group.extend(arg.losdict[n])
+        elif arg is True:
+            continue
+        else:
+            name = getattr(arg, 'name', type(arg).__name__)
+            raise SimulationError(_error.Instance, name)
+        insts.append(arg)
+        for s in group:
+            if id(s) not in ids:
+                ids.add(id(s))
+                sigs.append(s)
+    return insts, sigs
+
+
+def _encode(v):
+    if isinstance(v, (intbv, fixbv)):
+        return v._val
+    if isinstance(v, EnumItemType):
+        return v._name
+    if v is None or isinstance(v, (bool, float) + integer_types +
+                               string_types):
+        return v
+    raise SimulationError(_error.ValueType, type(v).__name__)
+
+
+def _decode(cur, v):
+    """ Return the decoded value, updating mutable values in place """
+    if isinstance(cur, (intbv, fixbv)):
+        cur._val = v
+        return cur
+    if isinstance(cur, EnumItemType):
+        return getattr(cur._type, v)
+    return v
+
+
+def _save(sim, path):
+    if sim._finished:
+        raise SimulationError(_error.Finished)
+    if not sim._started:
+        raise SimulationError(_error.NotStarted)
+    insts, sigs = _design(sim)
+    instindex = {}
+    for i, inst in enumerate(insts):
+        instindex[id(inst)] = i
+        if not isinstance(inst, Clock):
+            instindex[id(inst.gen)] = i
+
+    events = []
+    for t, event in _simulator._futureEvents.items():
+        if isinstance(event, Clock) and id(event) in instindex:
+            events.append([t, instindex[id(event)]])
+        elif getattr(event, 'generator', False) is None:
+            # the stop event of a run
+            continue
+        elif id(getattr(event, 'generator', None)) in instindex:
+            events.append([t, instindex[id(event.generator)]])
+        else:
+            raise SimulationError(_error.Event, type(event).__name__)
+
+    varregs = []
+    for inst in insts:
+        if isinstance(inst, _AlwaysSeq):
+            varregs.append([reg._val for n, reg, init in inst.varregs])
+        else:
+            varregs.append([])
+
+    state = {'version': _version,
+             'design': [inst.name for inst in insts],
+             'time': _simulator._time,
+             'signals': [[_encode(s._val), _encode(s._next), s._dirty]
+                         for s in sigs],
+             'varregs': varregs,
+             'events': events,
+             }
+    with open(path, 'w') as f:
+        json.dump(state, f)
+
+
+def _load(sim, path):
+    if sim._finished:
+        raise SimulationError(_error.Finished)
+    insts, sigs = _design(sim)
+    with open(path) as f:
+        state = json.load(f)
+    if state.get('version') != _version or \
+            state['design'] != [inst.name for inst in insts] or \
+            len(state['signals']) != len(sigs):
+        raise SimulationError(_error.Mismatch, path)
+
+    for s, (val, nextval, dirty) in zip(sigs, state['signals']):
+        s._val = _decode(s._val, val)
+        s._next = _decode(s._next, nextval)
+        if dirty and not s._dirty:
+            s._dirty = True
+            _siglist.append(s)
+    for inst, values in zip(insts, state['varregs']):
+        if values:
+            for (n, reg, init), v in zip(inst.varregs, values):
+                reg._val = v
+
+    # find the waiters of the delay-triggered blocks: in the event queue
+    # once the simulation has started, and in the initial waiters before
+    futureEvents = _simulator._futureEvents
+    waiters = {}
+    for t, event in futureEvents.items():
+        gen = getattr(event, 'generator', None)
+        if gen is not None:
+            waiters[id(gen)] = event
+    if not sim._started:
+        for waiter in sim._waiters:
+            waiters[id(waiter.generator)] = waiter
+
+    _simulator._time = state['time']
+    futureEvents.clear()
+    for inst in insts:
+        if isinstance(inst, Clock):
+            # a lazy clock without a pending edge is suspended
+            inst._suspended = inst.lazy
+    for t, i in state['events']:
+        inst = insts[i]
+        if isinstance(inst, Clock):
+            inst._suspended = False
+            _schedule(t, inst)
+            continue
+        waiter = waiters.get(id(inst.gen))
+        if waiter is None:
+            raise SimulationError(_error.Mismatch, path)
+        if not sim._started and waiter in sim._waiters:
+            # advance the generator to its delay, without the initial run
+            sim._waiters.remove(waiter)
+            next(inst.gen)
+        _schedule(t, waiter)
+
+    if sim._cycle is not None:
+        pending = sim._cycle._pending
+        pending[:] = [True] * len(pending)
@@ -0,0 +1,235 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the Clock class. """
+from __future__ import absolute_import
+
+
+from myhdl import ClockError
+from myhdl import _simulator
+from myhdl._compat import integer_types
+from myhdl._delay import delay
+from myhdl._Signal import _Signal
+from myhdl._simulator import _schedule
+from myhdl._instance import _Instantiator, _getCallInfo
+from myhdl._always import _get_sigdict
+from myhdl._extractHierarchy import _UserVerilogCode, _UserVhdlCode
+
+
+class _error:
+    pass
+_error.SigType = "Clock signal should be a bool Signal"
+_error.Period = "Clock period should be an integer of at least 2"
+_error.Duty = "Clock duty cycle should leave both levels at least 1 time unit"
+_error.Phase = "Clock phase should be a natural integer"
+
+
+_verilogCode = """\
+initial begin
+    $sig <= 1'b$init;
+    #$phase;
+    forever begin
+        #$first $sig <= 1'b$other;
+        #$second $sig <= 1'b$init;
+    end
+end"""
+
+_vhdlCode = """\
+process is
+begin
+    $sig <= '$init';
+    wait for $phase * $unit;
+    loop
+        wait for $first * $unit;
+        $sig <= '$other';
+        wait for $second * $unit;
+        $sig <= '$init';
+    end loop;
+end process;"""
+
+
+class Clock(_Instantiator):
+
+    """ Clock generator.
+
+    A Clock toggles a bool signal with a fixed period. The simulator
+    schedules the edges directly, without a generator resume or a delay
+    object per half period.
+
+    A lazy clock skips the edges that no process waits for. At such an
+    edge, it stops scheduling edges, and the simulator resumes it in phase
+    at the end of a time step in which a process has subscribed to the
+    signal or its edges. While it is suspended, the simulator sets the
+    signal to its level at the start of each time step, without an event.
+    A traced clock is not suspended.
+
+    """
+
+    def __init__(self, sig, period, duty=0.5, phase=0, lazy=False):
+        """ Construct a clock generator.
+
+        sig -- bool signal to drive
+        period -- clock period, in time units
+        duty -- fraction of the period during which the clock is at the
+                opposite level of its initial value (default: 0.5)
+        phase -- delay before the clock starts toggling (default: 0)
+        lazy -- if true, suspend the clock while no process waits on the
+                signal or its edges (default: off)
+
+        The first edge happens at time phase + (1 - duty) * period.
+
+        """
+        if not isinstance(sig, _Signal) or sig._type is not bool:
+            raise ClockError(_error.SigType)
+        if not isinstance(period, integer_types) or period < 2:
+            raise ClockError(_error.Period)
+        first = int(round(period * (1 - duty)))
+        if not 0 < first < period:
+            raise ClockError(_error.Duty)
+        if not isinstance(phase, integer_types) or phase < 0:
+            raise ClockError(_error.Phase)
+        self.sig = sig
+        self.period = period
+        self.duty = duty
+        self.phase = phase
+        self.lazy = lazy
+        self._first = first
+        self._second = period - first
+        self._level = None
+        self._suspended = False
+
+        callinfo = _getCallInfo()
+        self.callinfo = callinfo
+        self.callername = callinfo.name
+        self.modctxt = callinfo.modctxt
+        self.gen = self.genfunc()
+        self.symdict = callinfo.symdict
+        self.sigdict = _get_sigdict([sig], callinfo.symdict)
+        self.losdict = {}
+        self.inputs = set()
+        self.outputs = set(self.sigdict)
+        self.inouts = set()
+        self.embedded_func = None
+        sig._driven = "reg"
+
+    @property
+    def name(self):
+        return 'clock'
+
+    def genfunc(self):
+        """ Equivalent generator, for use outside of the simulator """
+        sig = self.sig
+        first, second = delay(self._first), delay(self._second)
+        yield delay(self.phase)
+        while 1:
+            yield first
+            sig.next = not sig
+            yield second
+            sig.next = not sig
+
+    def _start(self):
+        """ Return the time of the first edge """
+        self._level = bool(self.sig._val)
+        self._suspended = False
+        return self.phase + self._first
+
+    def _toggle(self):
+        """ Schedule the next edge and set the next value of the clock """
+        sig = self.sig
+        if sig._val == self._level:
+            dt = self._second
+        else:
+            dt = self._first
+        _schedule(_simulator._time + dt, self)
+        sig._next = not sig._val
+
+    def apply(self):
+        """ Toggle the clock and schedule the next edge.
+
+        Called by the simulator at edge times, like the events of delayed
+        signals. Returns the waiters of the signal.
+        """
+        if self.lazy and not self.sig._tracing and not self._listened():
+            self._suspended = True
+            return []
+        self._toggle()
+        return self.sig._update()
+
+    def _listened(self):
+        """ Return True if a process waits on the signal or its edges """
+        sig = self.sig
+        return bool(sig._eventWaiters or sig._eventProcs or
+                    sig._posedgeWaiters or sig._posedgeProcs or
+                    sig._negedgeWaiters or sig._negedgeProcs)
+
+    def _phase(self, t):
+        """ Return the level of the clock at time t, and the time to its
+        next edge """
+        start = self.phase + self._first
+        if t < start:
+            return self._level, start - t
+        # time since the last edge away from the initial level
+        u = (t - start) % self.period
+        if u < self._second:
+            return not self._level, self._second - u
+        return self._level, self.period - u
+
+    def _sync(self):
+        """ Set the signal of a suspended clock to its current level.
+
+        No process waits on the signal, so that no event is due.
+        """
+        sig = self.sig
+        level = self._phase(_simulator._time)[0]
+        if sig._val != level:
+            sig._val = sig._next = level
+
+    def _resume(self):
+        """ Resume a suspended clock at the current time.
+
+        The signal takes the level that it would have now, without an
+        event, and the next edge is scheduled at its time in phase.
+        """
+        t = _simulator._time
+        self._sync()
+        self._suspended = False
+        _schedule(t + self._phase(t)[1], self)
+
+    def _namespace(self):
+        init = int(bool(self.sig._init))
+        return {'sig': self.sig,
+                'init': init,
+                'other': 1 - init,
+                'phase': self.phase,
+                'first': self._first,
+                'second': self._second,
+                }
+
+    def _toVerilog(self):
+        self.sig.driven = "reg"
+        return _UserVerilogCode(_verilogCode, self._namespace(), 'Clock',
+                                self.genfunc, __file__, 0)
+
+    def _toVHDL(self, unit="1 ns"):
+        self.sig.driven = "reg"
+        namespace = self._namespace()
+        namespace['unit'] = unit
+        return _UserVhdlCode(_vhdlCode, namespace, 'Clock',
+                             self.genfunc, __file__, 0)
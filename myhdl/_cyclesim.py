@@ -0,0 +1,296 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the cycle-based simulation engine.
+
+The engine handles designs that consist of always_seq, always_comb and
+edge-triggered always blocks, clocked by Clock objects. Instead of the
+event-driven delta loop, it uses a static schedule: on each clock edge,
+the triggered sequential blocks run, and then the combinational blocks
+whose inputs changed run once, in topological order.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+from myhdl import StopSimulation, _SuspendSimulation
+from myhdl import _simulator
+from myhdl._simulator import _siglist
+from myhdl._Signal import _Signal, _PosedgeWaiterList, _NegedgeWaiterList
+from myhdl._always_seq import ResetSignal
+from myhdl._always_comb import _AlwaysComb
+from myhdl._always import _Always
+from myhdl._clock import Clock
+from myhdl._instance import _Instantiator
+from myhdl._levelize import _sigs, _levelize
+
+
+class _error:
+    pass
+_error.ArgType = "unsupported argument type"
+_error.Generator = "generator instance"
+_error.Senslist = "always block not triggered by edges only"
+_error.SigType = "shadow, delayed or tristate signal"
+_error.ClockDriven = "clock signal driven by a block"
+_error.EdgeDriven = "edge trigger on a signal driven by a block"
+_error.CombLoop = "combinational loop"
+_error.Postponed = "postponed block"
+
+
+class _CycleFallback(Exception):
+    """ Raised when a design is not supported by the cycle engine """
+    pass
+
+
+class _CycleEngine(object):
+
+    """ Static schedule of a clocked design.
+
+    The constructor raises _CycleFallback when the design contains
+    constructs that need the event-driven simulator.
+    """
+
+    def __init__(self, arglist):
+        clocks = []
+        seqs = []
+        combs = []
+        for arg in arglist:
+            if getattr(arg, 'postponed', False):
+                raise _CycleFallback("%s: %s" % (_error.Postponed, arg.name))
+            if isinstance(arg, Clock):
+                clocks.append(arg)
+            elif isinstance(arg, _AlwaysComb):
+                combs.append(arg)
+            elif isinstance(arg, _Always):
+                for e in arg.senslist:
+                    if not isinstance(e, (_PosedgeWaiterList,
+                                          _NegedgeWaiterList)):
+                        raise _CycleFallback("%s: %s" %
+                                             (_error.Senslist, arg.name))
+                seqs.append(arg)
+            elif arg is True:
+                pass
+            elif isinstance(arg, _Instantiator):
+                raise _CycleFallback("%s: %s" % (_error.Generator, arg.name))
+            else:
+                raise _CycleFallback("%s: %s" %
+                                     (_error.ArgType, type(arg).__name__))
+
+        driven = {}
+        for inst in seqs + combs:
+            for s in _sigs(inst, inst.outputs | inst.inouts):
+                driven[id(s)] = s
+            sigs = list(inst.sigdict.values())
+            for l in inst.losdict.values():
+                sigs.extend(l)
+            for s in sigs:
+                if type(s) not in (_Signal, ResetSignal):
+                    raise _CycleFallback("%s: %s" %
+                                         (_error.SigType, inst.name))
+        for clock in clocks:
+            if id(clock.sig) in driven:
+                raise _CycleFallback(_error.ClockDriven)
+
+        # edge triggers; edges of undriven signals only happen when the
+        # signals are assigned in between runs
+        posedge = {}
+        negedge = {}
+        for inst in seqs:
+            func = inst._activation()
+            for e in inst.senslist:
+                if id(e.sig) in driven:
+                    raise _CycleFallback("%s: %s" %
+                                         (_error.EdgeDriven, inst.name))
+                if isinstance(e, _PosedgeWaiterList):
+                    table = posedge
+                else:
+                    table = negedge
+                table.setdefault(id(e.sig), []).append(func)
+
+        # rank the combinational blocks in topological order
+        levels, loops = _levelize(combs)
+        if loops:
+            raise _CycleFallback("%s: %s" %
+                                 (_error.CombLoop, ", ".join(loops)))
+        order = sorted(range(len(combs)), key=lambda i: (levels[i], i))
+        rank = {}
+        for r, i in enumerate(order):
+            rank[i] = r
+        # the blocks of a level do not read each other's outputs, so
+        # that their updates are committed once per level
+        bounds = []
+        for r, i in enumerate(order):
+            if r and levels[i] != levels[order[r - 1]]:
+                bounds.append(r)
+        bounds.append(len(order))
+        readers = {}
+        for i, inst in enumerate(combs):
+            for s in inst.senslist:
+                readers.setdefault(id(s), []).append(i)
+
+        fanout = {}
+        for k, l in readers.items():
+            fanout[k] = sorted(set(rank[i] for i in l))
+
+        self.clocks = clocks
+        self._posedge = posedge
+        self._negedge = negedge
+        self._edges = set(posedge) | set(negedge)
+        self._fanout = fanout
+        self._combfuncs = [combs[i].func for i in order]
+        self._bounds = bounds
+        # driven intbv signals without shadows, whose integer values are
+        # compared and transferred directly when they are not traced
+        self._intbvs = set(k for k, s in driven.items()
+                           if s._update == s._updateIntbv and
+                           not s._shadows)
+        self._direct = self._intbvs
+        # all combinational blocks run once at the start, like their
+        # generators in the event-driven simulator
+        self._pending = [True] * len(combs)
+        self.activations = 0
+        self.timesteps = 1
+
+    def _commit(self):
+        """ Update the pending signals.
+
+        Marks the combinational blocks that read changed signals, and
+        returns the sequential functions triggered by their edges.
+        """
+        fanout = self._fanout
+        pending = self._pending
+        edges = self._edges
+        direct = self._direct
+        funcs = None
+        for s in _siglist:
+            k = id(s)
+            if k in direct:
+                cur = s._val
+                val, next = cur._val, s._next._val
+            else:
+                cur = None
+                val, next = s._val, s._next
+            if val == next:
+                s._dirty = False
+                continue
+            if k in fanout:
+                for r in fanout[k]:
+                    pending[r] = True
+            if k in edges:
+                edge = None
+                if not val and next:
+                    edge = self._posedge.get(k)
+                elif val and not next:
+                    edge = self._negedge.get(k)
+                if edge:
+                    if funcs is None:
+                        funcs = edge
+                    else:
+                        funcs = funcs + [f for f in edge if f not in funcs]
+            if cur is None:
+                s._update()
+            else:
+                # no process waits on the signal
+                cur._val = next
+                s._dirty = False
+        del _siglist[:]
+        return funcs
+
+    def _settle(self):
+        """ Run the schedule until no more signals change """
+        funcs = self._commit()
+        while funcs:
+            for func in funcs:
+                func()
+            self.activations += len(funcs)
+            funcs = self._commit()
+        pending = self._pending
+        if True in pending:
+            combfuncs = self._combfuncs
+            r = 0
+            for bound in self._bounds:
+                while r < bound:
+                    if pending[r]:
+                        pending[r] = False
+                        combfuncs[r]()
+                        self.activations += 1
+                    r += 1
+                if _siglist:
+                    self._commit()
+
+    def run(self, duration):
+        """ Run for some duration, or forever if duration is None.
+
+        Like the event-driven simulator, raises _SuspendSimulation when
+        the duration has elapsed, and StopSimulation when there are no
+        more events.
+        """
+        futureEvents = _simulator._futureEvents
+        tracing = _simulator._tracing
+        tracefile = _simulator._tf
+        maxTime = None
+        if duration:
+            maxTime = _simulator._time + duration
+        self._direct = set() if tracing else self._intbvs
+        settle = self._settle
+        fanout = self._fanout
+        pending = self._pending
+        posedge = self._posedge
+        negedge = self._negedge
+
+        # signals may have been assigned in between runs
+        settle()
+        while futureEvents:
+            t = futureEvents.nextTime()
+            if maxTime is not None and t > maxTime:
+                _simulator._time = maxTime
+                if tracing:
+                    print("#%s" % maxTime, file=tracefile)
+                raise _SuspendSimulation("Simulated %s timesteps" % duration)
+            t, events = futureEvents.pop()
+            _simulator._time = t
+            self.timesteps += 1
+            if tracing:
+                print("#%s" % t, file=tracefile)
+            funcs = None
+            for clock in events:
+                clock._toggle()
+                sig = clock.sig
+                k = id(sig)
+                if k in fanout:
+                    for r in fanout[k]:
+                        pending[r] = True
+                if sig._next:
+                    edge = posedge.get(k)
+                else:
+                    edge = negedge.get(k)
+                if edge:
+                    if funcs is None:
+                        funcs = edge
+                    else:
+                        funcs = funcs + [f for f in edge if f not in funcs]
+                sig._update()
+            if funcs:
+                for func in funcs:
+                    func()
+                self.activations += len(funcs)
+            settle()
+            if t == maxTime:
+                raise _SuspendSimulation("Simulated %s timesteps" % duration)
+        raise StopSimulation("No more events")
@@ -0,0 +1,138 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the fork_scenarios function of Simulation.
+
+After a shared preamble, the simulation is duplicated with os.fork: each
+child process continues from the state of the parent with one scenario,
+and sends the result back over a pipe. As the whole process is
+duplicated, generators are forked along with the rest of the design.
+Cosimulations can not be forked: the cosimulator and its pipes would be
+shared by the children.
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+import pickle
+import shutil
+import traceback
+from multiprocessing import cpu_count
+
+from myhdl import SimulationError
+from myhdl import _simulator
+from myhdl._compat import integer_types
+
+
+class _error:
+    pass
+_error.NoFork = "Forking scenarios requires os.fork"
+_error.Cosim = "Forking scenarios is not supported with cosimulation"
+_error.Finished = "Simulation has already finished"
+_error.Workers = "Number of workers should be a positive integer"
+_error.Scenario = "Scenario failed"
+
+
+def _tracePath(path, index):
+    """ Return the trace file path of a scenario """
+    root, ext = os.path.splitext(path)
+    return "%s_%d%s" % (root, index, ext)
+
+
+def _child(sim, scenario, index, wfd):
+    """ Run a scenario in a child process, and send the result """
+    try:
+        tf = None
+        try:
+            if _simulator._tracing:
+                # continue in a copy of the trace of the preamble
+                path = _tracePath(_simulator._tf.name, index)
+                shutil.copyfile(_simulator._tf.name, path)
+                tf = open(path, 'a')
+                _simulator._tf = sim._ctx.tf = tf
+            result = (True, scenario(sim))
+        except BaseException:
+            result = (False, traceback.format_exc())
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            data = pickle.dumps((False, traceback.format_exc()))
+        with os.fdopen(wfd, 'wb') as f:
+            f.write(data)
+        if tf is not None:
+            tf.close()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        # never return into the code of the parent
+        os._exit(0)
+
+
+def _collect(job, results, errors):
+    index, pid, rfd = job
+    with os.fdopen(rfd, 'rb') as f:
+        data = f.read()
+    os.waitpid(pid, 0)
+    if not data:
+        errors.append((index, "no result"))
+        return
+    ok, value = pickle.loads(data)
+    if ok:
+        results[index] = value
+    else:
+        errors.append((index, value))
+
+
+def _forkScenarios(sim, scenarios, workers):
+    if not hasattr(os, 'fork'):
+        raise SimulationError(_error.NoFork)
+    if sim._finished:
+        raise SimulationError(_error.Finished)
+    if sim._cosims:
+        raise SimulationError(_error.Cosim)
+    if workers is None:
+        workers = cpu_count()
+    if not isinstance(workers, integer_types) or workers < 1:
+        raise SimulationError(_error.Workers, repr(workers))
+    scenarios = list(scenarios)
+    results = [None] * len(scenarios)
+    errors = []
+    # don't let the children write out the buffers of the parent
+    if _simulator._tracing:
+        _simulator._tf.flush()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    running = []
+    for index, scenario in enumerate(scenarios):
+        if len(running) == workers:
+            _collect(running.pop(0), results, errors)
+        rfd, wfd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(rfd)
+            _child(sim, scenario, index, wfd)
+        os.close(wfd)
+        running.append((index, pid, rfd))
+    while running:
+        _collect(running.pop(0), results, errors)
+    if errors:
+        index, info = errors[0]
+        raise SimulationError(_error.Scenario, "%d\n%s" % (index, info))
+    return results
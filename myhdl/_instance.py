@@ -21,20 +21,24 @@
 from __future__ import absolute_import
 
 
-import inspect
 from types import FunctionType
 
 from myhdl import InstanceError
-from myhdl._util import _isGenFunc, _makeAST
+from myhdl._util import _isGenFunc, _makeAST, _codeKey, _getFrames
 from myhdl._Waiter import _inferWaiter
-from myhdl._resolverefs import _AttrRefTransformer
+from myhdl._resolverefs import _AttrRefTransformer, _AttrRefRenamer
+from myhdl._resolverefs import _codeNames
 from myhdl._visitors import _SigNameVisitor
+from myhdl._cache import _Cache
+from myhdl._Signal import _Signal, _isListOfSigs
+from myhdl._intbv import intbv
 
 
 class _error:
     pass
 _error.NrOfArgs = "decorated generator function should not have arguments"
 _error.ArgType = "decorated object should be a generator function"
+_error.Postponed = "postponed argument should be an instance"
 
 
 class _CallInfo(object):
@@ -57,16 +61,17 @@ def _getCallInfo():
     3: the caller of the block function, e.g. the BlockInstance.
     """
     from myhdl import _block
-    funcrec = inspect.stack()[2]
-    name = funcrec[3]
-    frame = funcrec[0]
+    stack = _getFrames(4)
+    frame = stack[2]
+    name = frame.f_code.co_name
     symdict = dict(frame.f_globals)
     symdict.update(frame.f_locals)
     modctxt = False
-    callerrec = inspect.stack()[3]
-    f_locals = callerrec[0].f_locals
-    if 'self' in f_locals:
-        modctxt = isinstance(f_locals['self'], _block._Block)
+    # caller may be undefined if instantiation from a Python module
+    if len(stack) > 3:
+        f_locals = stack[3].f_locals
+        if 'self' in f_locals:
+            modctxt = isinstance(f_locals['self'], _block._Block)
     return _CallInfo(name, modctxt, symdict)
 
 
@@ -81,8 +86,77 @@ def instance(genfunc):
     return _Instantiator(genfunc, callinfo=callinfo)
 
 
+def postponed(inst):
+    """ Mark an instance to run in the postponed region of a time step.
+
+    A postponed instance runs at most once per time step, after the delta
+    cycles have settled, like a $strobe or $monitor task in Verilog. It is
+    meant for monitors and checkers, that read signals but do not assign
+    them.
+    """
+    if not isinstance(inst, _Instantiator):
+        raise InstanceError(_error.Postponed)
+    inst.postponed = True
+    return inst
+
+
+_analyses = _Cache('analysis', persistent=True)
+
+
+def _symKind(obj):
+    """ Return the kind of a symbol, as far as _SigNameVisitor is concerned """
+    if isinstance(obj, _Signal):
+        return 1
+    if isinstance(obj, intbv):
+        return 2
+    if _isListOfSigs(obj):
+        return 3
+    return 0
+
+
+def _analyze(inst):
+    """ Resolve the attribute references of an instantiator, and find
+    the signals that it reads and writes.
+
+    The analysis is shared by the instantiators of a code object whose
+    names are bound to the same kinds of objects. Only the resolution
+    of the attribute references, and the lookup of the signals in the
+    symdict, are done per instance.
+    """
+    func = inst.funcobj
+    code = func.__code__
+    names, refs = _codeNames(code)
+    symdict = inst.symdict
+    v = _AttrRefTransformer(inst)
+    new_names = v.bind(refs)
+    get = symdict.get
+    shape = _codeKey(code) + (
+        tuple([_symKind(get(n)) for n in names]),
+        tuple(new_names),
+        tuple([n and _symKind(symdict[n]) for n in new_names]))
+    result = _analyses.lookup(shape)
+    if result is None:
+        tree = _makeAST(func)
+        _AttrRefRenamer(v.name_map).visit(tree)
+        sv = _SigNameVisitor(symdict)
+        sv.visit(tree)
+        result = _analyses[shape] = (
+            frozenset(sv.inputs), frozenset(sv.outputs),
+            frozenset(sv.inouts), sv.embedded_func,
+            tuple(sv.sigdict), tuple(sv.losdict))
+    inputs, outputs, inouts, embedded_func, signames, losnames = result
+    inst.inputs = set(inputs)
+    inst.outputs = set(outputs)
+    inst.inouts = set(inouts)
+    inst.embedded_func = embedded_func
+    inst.sigdict = dict((n, symdict[n]) for n in signames)
+    inst.losdict = dict((n, symdict[n]) for n in losnames)
+
+
 class _Instantiator(object):
 
+    postponed = False
+
     def __init__(self, genfunc, callinfo):
         self.callinfo = callinfo
         self.callername = callinfo.name
@@ -97,20 +171,7 @@ class _Instantiator(object):
             if n not in varnames:
                 symdict[n] = v
         self.symdict = symdict
-
-        # print modname, genfunc.__name__
-        tree = self.ast
-        # print ast.dump(tree)
-        v = _AttrRefTransformer(self)
-        v.visit(tree)
-        v = _SigNameVisitor(self.symdict)
-        v.visit(tree)
-        self.inputs = v.inputs
-        self.outputs = v.outputs
-        self.inouts = v.inouts
-        self.embedded_func = v.embedded_func
-        self.sigdict = v.sigdict
-        self.losdict = v.losdict
+        _analyze(self)
 
     @property
     def name(self):
@@ -127,6 +188,10 @@ class _Instantiator(object):
     def _waiter(self):
         return _inferWaiter
 
+    def _process(self):
+        """ Return the waiter that runs the instance in the simulator """
+        return self.waiter
+
     @property
     def ast(self):
         return _makeAST(self.funcobj)
@@ -0,0 +1,540 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the batched simulation of Simulation.
+
+In a batched simulation, each signal carries a vector of lane values,
+one per independent copy of the design, and each block runs once per
+activation for all lanes. Operators on the values of the signals work
+lane by lane, and the bound checks of the signal types apply to each
+lane.
+
+When a block needs a single value where the lanes differ, for the
+condition of an if statement or for an index, the function of the block
+is run again for each group of lanes with the same value, with the
+other lanes masked. The next values that a run assigns are restored
+before the lanes split, so that read-modify-write updates such as
+s.next = s.next + 1 in the part of the function that ran before the
+split are not applied twice. Generators can not be run again: when the
+lanes diverge in a generator, a SimulationError is raised.
+
+The lane vectors are Python lists of int or bool values, and the
+operators map over them. NumPy arrays would be faster for wide batches,
+but myhdl has no third-party dependencies, and an intbv lane can hold
+more bits than a NumPy integer.
+"""
+from __future__ import absolute_import
+
+import operator
+from itertools import repeat
+
+from myhdl import SimulationError
+from myhdl._Signal import _Signal
+from myhdl._always_seq import ResetSignal, _AlwaysSeq
+from myhdl._intbv import intbv
+from myhdl._modbv import modbv
+from myhdl._fixbv import fixbv
+from myhdl._Waiter import _FuncStarter
+
+
+class _error:
+    pass
+_error.Diverge = "Lanes diverge in a process that can not be split"
+_error.Edge = "Edge on some lanes only of signal"
+_error.SigType = "Batched simulation supports plain signals, not"
+_error.ValType = "Batched simulation does not support values of type"
+_error.Variables = "Batched simulation does not support variables in " \
+    "always_seq block"
+_error.Width = "Number of lane values should be"
+_error.Mix = "Lane vector of another group of lanes"
+
+
+class _Diverge(SimulationError):
+
+    """ Raised when a block needs a single value where lanes differ """
+
+    def __init__(self, groups):
+        SimulationError.__init__(self, _error.Diverge)
+        self.groups = groups
+
+
+# the lanes that a split block runs for, or None for all lanes
+_active = None
+
+# the next values in the active lanes of the vectors assigned by the
+# current run of a block, by vector id, as they were before the run
+_journal = None
+
+
+def _split(keys):
+    """ Raise _Diverge with the groups of the active lanes by key """
+    lanes = _active
+    if lanes is None:
+        lanes = range(len(keys))
+    groups = {}
+    for i, k in zip(lanes, keys):
+        groups.setdefault(k, []).append(i)
+    raise _Diverge([tuple(g) for g in groups.values()])
+
+
+def _record(lanes):
+    """ Save the values of a next vector before a run assigns it """
+    if _journal is not None and id(lanes) not in _journal:
+        vals = lanes._vals
+        if _active is None:
+            _journal[id(lanes)] = (lanes, list(vals))
+        else:
+            _journal[id(lanes)] = (lanes, [vals[i] for i in _active])
+
+
+def _attempt(func):
+    """ Run func, and return the groups of lanes if it diverges, after
+    restoring the next values it assigned """
+    global _journal
+    saved = _journal
+    _journal = {}
+    try:
+        func()
+    except _Diverge as e:
+        for lanes, vals in _journal.values():
+            if _active is None:
+                lanes._vals[:] = vals
+            else:
+                for i, v in zip(_active, vals):
+                    lanes._vals[i] = v
+        return e.groups
+    finally:
+        _journal = saved
+    return ()
+
+
+def _run(func, groups):
+    """ Run func for each group of lanes """
+    global _active
+    saved = _active
+    todo = list(groups)
+    try:
+        while todo:
+            _active = todo.pop()
+            todo.extend(_attempt(func))
+    finally:
+        _active = saved
+
+
+def _batched(func):
+    """ Return the activation function of a block in a batched simulation """
+    def activation():
+        groups = _attempt(func)
+        if groups:
+            _run(func, groups)
+    return activation
+
+
+def _operand(x):
+    """ Return the values of the active lanes of x, or None for a scalar """
+    if isinstance(x, _Lanes):
+        if x._idx is _active:
+            return x._vals
+        if x._idx is None:
+            vals = x._vals
+            return [vals[i] for i in _active]
+        raise SimulationError(_error.Mix)
+    return None
+
+
+def _scalar(x):
+    if isinstance(x, intbv):
+        x = x._val
+    return x
+
+
+def _binary(op, a, b):
+    if isinstance(a, _Signal):
+        a = a._val
+    if isinstance(b, _Signal):
+        b = b._val
+    x, y = _operand(a), _operand(b)
+    if x is None:
+        x = repeat(_scalar(a))
+    elif y is None:
+        y = repeat(_scalar(b))
+    return _Lanes(list(map(op, x, y)), _active)
+
+
+class _Lanes(object):
+
+    """ Vector of the values of a signal, or of an expression, per lane.
+
+    _vals -- the values of the lanes in _idx
+    _idx -- the lanes, or None for all lanes
+    _nrbits -- the bit width of unsigned values, or 0
+
+    """
+
+    __slots__ = ('_vals', '_idx', '_nrbits')
+
+    def __init__(self, vals, idx=None, nrbits=0):
+        self._vals = vals
+        self._idx = idx
+        self._nrbits = nrbits
+
+    def tolist(self):
+        """ Return the list of the values of the lanes """
+        return list(self._vals)
+
+    # conversions to a single value split the active lanes
+
+    def __bool__(self):
+        vals = _operand(self)
+        if all(vals):
+            return True
+        if not any(vals):
+            return False
+        _split([bool(v) for v in vals])
+
+    __nonzero__ = __bool__
+
+    def _single(self):
+        vals = _operand(self)
+        v = vals[0]
+        if vals.count(v) != len(vals):
+            _split(vals)
+        return v
+
+    def __int__(self):
+        return int(self._single())
+
+    __index__ = __long__ = __int__
+
+    def __float__(self):
+        return float(self._single())
+
+    def __len__(self):
+        return self._nrbits
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self._vals)
+
+    def __repr__(self):
+        return "_Lanes(%r)" % (self._vals,)
+
+    # indexing and slicing
+
+    def __getitem__(self, key):
+        vals = _operand(self)
+        if isinstance(key, slice):
+            i, j = key.start, key.stop
+            j = 0 if j is None else int(j)
+            if i is None:
+                return _Lanes([v >> j for v in vals], _active)
+            i = int(i)
+            mask = (1 << (i - j)) - 1
+            return _Lanes([(v >> j) & mask for v in vals], _active, i - j)
+        i = int(key)
+        return _Lanes([bool((v >> i) & 1) for v in vals], _active)
+
+    def __setitem__(self, key, val):
+        # in place, on the next value of a signal
+        lanes = _active
+        if lanes is None:
+            lanes = range(len(self._vals))
+        if isinstance(val, _Signal):
+            val = val._val
+        src = _operand(val)
+        if src is None:
+            src = repeat(_scalar(val))
+        _record(self)
+        vals = self._vals
+        if isinstance(key, slice):
+            i, j = int(key.start), 0 if key.stop is None else int(key.stop)
+            mask = ((1 << (i - j)) - 1) << j
+            for k, v in zip(lanes, src):
+                vals[k] = (vals[k] & ~mask) | ((int(v) << j) & mask)
+        else:
+            i = int(key)
+            for k, v in zip(lanes, src):
+                if v:
+                    vals[k] |= 1 << i
+                else:
+                    vals[k] &= ~(1 << i)
+
+    def signed(self):
+        nrbits = self._nrbits
+        vals = _operand(self)
+        if not nrbits:
+            return _Lanes(vals, _active)
+        msb, span = 1 << (nrbits - 1), 1 << nrbits
+        return _Lanes([v - span if v & msb else v for v in vals], _active)
+
+    # operators
+
+    def __add__(self, other):
+        return _binary(operator.add, self, other)
+
+    def __radd__(self, other):
+        return _binary(operator.add, other, self)
+
+    def __sub__(self, other):
+        return _binary(operator.sub, self, other)
+
+    def __rsub__(self, other):
+        return _binary(operator.sub, other, self)
+
+    def __mul__(self, other):
+        return _binary(operator.mul, self, other)
+
+    def __rmul__(self, other):
+        return _binary(operator.mul, other, self)
+
+    def __truediv__(self, other):
+        return _binary(operator.truediv, self, other)
+
+    def __rtruediv__(self, other):
+        return _binary(operator.truediv, other, self)
+
+    def __floordiv__(self, other):
+        return _binary(operator.floordiv, self, other)
+
+    def __rfloordiv__(self, other):
+        return _binary(operator.floordiv, other, self)
+
+    def __mod__(self, other):
+        return _binary(operator.mod, self, other)
+
+    def __rmod__(self, other):
+        return _binary(operator.mod, other, self)
+
+    def __pow__(self, other):
+        return _binary(operator.pow, self, other)
+
+    def __rpow__(self, other):
+        return _binary(operator.pow, other, self)
+
+    def __lshift__(self, other):
+        return _binary(operator.lshift, self, other)
+
+    def __rlshift__(self, other):
+        return _binary(operator.lshift, other, self)
+
+    def __rshift__(self, other):
+        return _binary(operator.rshift, self, other)
+
+    def __rrshift__(self, other):
+        return _binary(operator.rshift, other, self)
+
+    def __and__(self, other):
+        return _binary(operator.and_, self, other)
+
+    def __rand__(self, other):
+        return _binary(operator.and_, other, self)
+
+    def __or__(self, other):
+        return _binary(operator.or_, self, other)
+
+    def __ror__(self, other):
+        return _binary(operator.or_, other, self)
+
+    def __xor__(self, other):
+        return _binary(operator.xor, self, other)
+
+    def __rxor__(self, other):
+        return _binary(operator.xor, other, self)
+
+    def __neg__(self):
+        return _Lanes([-v for v in _operand(self)], _active)
+
+    def __pos__(self):
+        return _Lanes(list(_operand(self)), _active)
+
+    def __abs__(self):
+        return _Lanes([abs(v) for v in _operand(self)], _active)
+
+    def __invert__(self):
+        vals = _operand(self)
+        if self._nrbits:
+            mask = (1 << self._nrbits) - 1
+            return _Lanes([~v & mask for v in vals], _active, self._nrbits)
+        return _Lanes([~v for v in vals], _active)
+
+    # comparisons
+
+    def __eq__(self, other):
+        return _binary(operator.eq, self, other)
+
+    def __ne__(self, other):
+        return _binary(operator.ne, self, other)
+
+    def __lt__(self, other):
+        return _binary(operator.lt, self, other)
+
+    def __le__(self, other):
+        return _binary(operator.le, self, other)
+
+    def __gt__(self, other):
+        return _binary(operator.gt, self, other)
+
+    def __ge__(self, other):
+        return _binary(operator.ge, self, other)
+
+
+def _element(val):
+    """ Return the lane value of a scalar signal value """
+    if isinstance(val, intbv):
+        return val._val
+    return val
+
+
+_bits = frozenset((0, 1))
+
+
+def _checker(sig):
+    """ Return a function that checks and returns the lane values """
+    lo, hi = sig._min, sig._max
+    if sig._type is bool:
+        def check(vals):
+            for v in set(vals) - _bits:
+                raise ValueError("Expected boolean value, got %s (%s)" %
+                                 (repr(v), type(v)))
+            return vals
+    elif sig._type is intbv and lo is not None:
+        wrap = isinstance(sig._init, modbv)
+        span = hi - lo
+        mask = None
+        if lo == 0 and span & (span - 1) == 0:
+            mask = repeat(span - 1)
+
+        def check(vals):
+            if min(vals) < lo or max(vals) >= hi:
+                if mask is not None and wrap:
+                    return list(map(operator.and_, vals, mask))
+                if not wrap:
+                    for v in vals:
+                        if v >= hi:
+                            raise ValueError("intbv value %s >= maximum %s" %
+                                             (v, hi))
+                        if v < lo:
+                            raise ValueError("intbv value %s < minimum %s" %
+                                             (v, lo))
+                vals = [(v - lo) % span + lo for v in vals]
+            return vals
+    else:
+        def check(vals):
+            return vals
+    return check
+
+
+class _Batch(object):
+
+    """ The lane vectors of the signals of a batched simulation """
+
+    def __init__(self, n, arglist, signals, clocks, waiters):
+        self.n = n
+        scalars = set(id(clock.sig) for clock in clocks)
+        for arg in arglist:
+            if isinstance(arg, _AlwaysSeq) and arg.varregs:
+                raise SimulationError(_error.Variables, arg.name)
+        sigs = []
+        for s in signals:
+            if id(s) in scalars:
+                continue
+            if type(s) not in (_Signal, ResetSignal):
+                raise SimulationError(_error.SigType, type(s).__name__)
+            if s._type is fixbv or isinstance(s._val, (list, tuple)):
+                raise SimulationError(_error.ValType,
+                                      type(s._val).__name__)
+            sigs.append(s)
+        self.signals = sigs
+        self._saved = []
+        for s in sigs:
+            self._saved.append((s, s._setNextVal, s._update))
+            self._convert(s)
+        for w in waiters:
+            if isinstance(w, _FuncStarter):
+                w.waiter.func = _batched(w.waiter.func)
+
+    def _convert(self, sig):
+        n = self.n
+        v = _element(sig._val)
+        nrbits = 0
+        if sig._type is intbv and sig._min is not None and sig._min >= 0:
+            nrbits = sig._nrbits
+        sig._val = _Lanes([v] * n, None, nrbits)
+        sig._next = _Lanes([v] * n, None, nrbits)
+        check = _checker(sig)
+
+        def setNext(val):
+            lanes = _active
+            vals = sig._next._vals
+            src = _operand(val)
+            if src is None:
+                if isinstance(val, (list, tuple)):
+                    if len(val) != n:
+                        raise SimulationError(_error.Width, "%d, not %d" %
+                                              (n, len(val)))
+                    if lanes is not None:
+                        val = [val[i] for i in lanes]
+                    src = [_element(v) for v in val]
+                else:
+                    src = [_scalar(val)] * (n if lanes is None
+                                            else len(lanes))
+            src = check(src)
+            _record(sig._next)
+            if lanes is None:
+                vals[:] = src
+            else:
+                for i, v in zip(lanes, src):
+                    vals[i] = v
+
+        def update():
+            sig._dirty = False
+            cur, next = sig._val._vals, sig._next._vals
+            if cur == next:
+                return []
+            waiters = sig._eventWaiters + sig._eventProcs
+            del sig._eventWaiters[:]
+            for edge, procs, rising in (
+                    (sig._posedgeWaiters, sig._posedgeProcs, True),
+                    (sig._negedgeWaiters, sig._negedgeProcs, False)):
+                if not (edge or procs):
+                    continue
+                k = 0
+                for a, b in zip(cur, next):
+                    if (not a and b) if rising else (a and not b):
+                        k += 1
+                if k == n:
+                    waiters.extend(edge)
+                    waiters.extend(procs)
+                    del edge[:]
+                elif k:
+                    raise SimulationError(_error.Edge, sig._name or repr(sig))
+            cur[:] = next
+            return waiters
+
+        sig._setNextVal = setNext
+        sig._update = update
+
+    def release(self):
+        """ Restore the scalar behavior of the signals """
+        for s, setNext, update in self._saved:
+            s._setNextVal = setNext
+            s._update = update
+        self._saved = []
@@ -0,0 +1,89 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the levelization of combinational blocks. """
+from __future__ import absolute_import
+
+from myhdl._Signal import _Signal, _isListOfSigs
+
+
+def _sigs(inst, names):
+    """ Return the signals that an instantiator refers to by names """
+    sigs = []
+    for n in names:
+        obj = inst.symdict[n]
+        if isinstance(obj, _Signal):
+            sigs.append(obj)
+        elif _isListOfSigs(obj):
+            sigs.extend(obj)
+    return sigs
+
+
+def _levelize(combs):
+    """ Rank always_comb blocks in topological order.
+
+    Block b depends on block a when b reads an output of a. Returns a
+    list with the level of each block: 0 for blocks that depend on no
+    other block, and one more than the highest level of its predecessors
+    otherwise. Blocks in or behind a combinational loop have level None.
+    Also returns the names of the blocks that form loops.
+    """
+    n = len(combs)
+    readers = {}
+    for i, inst in enumerate(combs):
+        for s in inst.senslist:
+            readers.setdefault(id(s), []).append(i)
+    succs = []
+    npreds = [0] * n
+    for inst in combs:
+        succ = set()
+        for s in _sigs(inst, inst.outputs):
+            succ.update(readers.get(id(s), ()))
+        for j in succ:
+            npreds[j] += 1
+        succs.append(succ)
+
+    levels = [None] * n
+    ready = [i for i in range(n) if not npreds[i]]
+    for i in ready:
+        levels[i] = 0
+    while ready:
+        i = ready.pop()
+        for j in succs[i]:
+            if levels[j] is None or levels[j] <= levels[i]:
+                levels[j] = levels[i] + 1
+            npreds[j] -= 1
+            if not npreds[j]:
+                ready.append(j)
+
+    # the unranked blocks are in a loop, or downstream of one; prune
+    # the ones that do not lead back into the unranked set
+    left = set(i for i in range(n) if npreds[i])
+    for i in left:
+        levels[i] = None
+    pruned = True
+    while pruned:
+        pruned = False
+        for i in list(left):
+            if not succs[i] & left:
+                left.discard(i)
+                pruned = True
+    loops = sorted(set(combs[i].name for i in left))
+    return levels, loops
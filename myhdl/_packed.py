@@ -0,0 +1,438 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the packed simulation of Simulation.
+
+A packed simulation is a batched simulation of single-bit logic. A bool
+signal holds an integer whose bit k is its value in lane k, and an
+intbv signal holds such an integer per bit, a bit plane. The bitwise
+operators, shifts, indexing and slicing then evaluate all lanes with a
+few integer operations. Addition, subtraction and comparisons are
+evaluated as ripple-carry logic on the bit planes.
+
+The lanes can not take different branches: a condition, or a single
+value such as an index, should be the same in all lanes, or a
+SimulationError is raised.
+"""
+from __future__ import absolute_import
+
+import operator
+
+from myhdl import SimulationError
+from myhdl._compat import integer_types
+from myhdl._Signal import _Signal
+from myhdl._always_seq import ResetSignal, _AlwaysSeq
+from myhdl._intbv import intbv
+from myhdl._modbv import modbv
+from myhdl._fixbv import fixbv
+
+
+class _error:
+    pass
+_error.Branch = "Lanes differ where a single value is needed, " \
+    "not supported in packed simulation"
+_error.Edge = "Edge on some lanes only of signal"
+_error.SigType = "Packed simulation supports plain signals, not"
+_error.ValType = "Packed simulation supports bool and unsigned intbv " \
+    "values with a power of 2 range, not"
+_error.Variables = "Packed simulation does not support variables in " \
+    "always_seq block"
+_error.Operator = "Operator not supported in packed simulation"
+_error.Operand = "Operand not supported in packed simulation"
+_error.Width = "Number of lane values should be"
+
+
+def _planes(x, ones):
+    """ Return the bit planes of an operand """
+    if isinstance(x, _Signal):
+        x = x._val
+    if isinstance(x, _Packed):
+        if x._signed:
+            raise SimulationError(_error.Operand, "negative value")
+        return x._planes
+    if isinstance(x, intbv) or isinstance(x, integer_types):
+        v = int(x)
+        if v < 0:
+            raise SimulationError(_error.Operand, "negative value")
+        return [ones if (v >> i) & 1 else 0 for i in range(v.bit_length())]
+    raise SimulationError(_error.Operand, type(x).__name__)
+
+
+def _pair(a, b):
+    """ Return the bit planes of two operands, of equal width, and the
+    lane mask """
+    if isinstance(a, _Signal):
+        a = a._val
+    if isinstance(b, _Signal):
+        b = b._val
+    ones = a._ones if isinstance(a, _Packed) else b._ones
+    pa, pb = _planes(a, ones), _planes(b, ones)
+    n = max(len(pa), len(pb))
+    if len(pa) < n:
+        pa = pa + [0] * (n - len(pa))
+    if len(pb) < n:
+        pb = pb + [0] * (n - len(pb))
+    return pa, pb, ones
+
+
+def _bitwise(op, a, b):
+    pa, pb, ones = _pair(a, b)
+    return _Packed(list(map(op, pa, pb)), ones)
+
+
+def _add(pa, pb, carry):
+    """ Return the sum planes of a ripple-carry adder, and the carry """
+    out = []
+    for x, y in zip(pa, pb):
+        t = x ^ y
+        out.append(t ^ carry)
+        carry = (x & y) | (carry & t)
+    return out, carry
+
+
+def _sub(a, b):
+    """ Return the difference planes, and the lanes in which a < b """
+    pa, pb, ones = _pair(a, b)
+    out, carry = _add(pa, [ones ^ y for y in pb], ones)
+    return out, ones ^ carry, ones
+
+
+def _equal(a, b):
+    pa, pb, ones = _pair(a, b)
+    eq = ones
+    for x, y in zip(pa, pb):
+        eq &= ~(x ^ y)
+    return eq, ones
+
+
+def _unsupported(name):
+    def method(self, *args):
+        raise SimulationError(_error.Operator, name)
+    return method
+
+
+class _Packed(object):
+
+    """ Bit planes of the values of the lanes.
+
+    _planes -- the bit planes, least significant first
+    _ones -- the mask of all lanes
+    _bool -- True for the value of a bool signal or a single bit
+    _signed -- True if the most significant plane is a sign bit
+
+    """
+
+    __slots__ = ('_planes', '_ones', '_bool', '_signed')
+
+    def __init__(self, planes, ones, isbool=False, signed=False):
+        self._planes = planes
+        self._ones = ones
+        self._bool = isbool
+        self._signed = signed
+
+    def tolist(self):
+        """ Return the list of the values of the lanes """
+        planes = self._planes
+        n = self._ones.bit_length()
+        vals = []
+        for k in range(n):
+            v = 0
+            for i, p in enumerate(planes):
+                v |= ((p >> k) & 1) << i
+            if self._signed and v >> (len(planes) - 1):
+                v -= 1 << len(planes)
+            vals.append(bool(v) if self._bool else v)
+        return vals
+
+    # conversions to a single value need equal lanes
+
+    def __bool__(self):
+        nonzero = 0
+        for p in self._planes:
+            nonzero |= p
+        if nonzero == self._ones:
+            return True
+        if not nonzero:
+            return False
+        raise SimulationError(_error.Branch)
+
+    __nonzero__ = __bool__
+
+    def __int__(self):
+        ones = self._ones
+        v = 0
+        for i, p in enumerate(self._planes):
+            if p == ones:
+                v |= 1 << i
+            elif p:
+                raise SimulationError(_error.Branch)
+        if self._signed and v >> (len(self._planes) - 1):
+            v -= 1 << len(self._planes)
+        return v
+
+    __index__ = __long__ = __int__
+
+    def __len__(self):
+        return len(self._planes)
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.tolist())
+
+    def __repr__(self):
+        return "_Packed(%r)" % (self._planes,)
+
+    # indexing and slicing
+
+    def __getitem__(self, key):
+        planes = self._planes
+        if isinstance(key, slice):
+            i, j = key.start, key.stop
+            j = 0 if j is None else int(j)
+            if i is None:
+                return _Packed(planes[j:], self._ones)
+            i = int(i)
+            sub = planes[j:i]
+            return _Packed(sub + [0] * (i - j - len(sub)), self._ones)
+        i = int(key)
+        p = planes[i] if i < len(planes) else 0
+        return _Packed([p], self._ones, True)
+
+    def __setitem__(self, key, val):
+        # in place, on the next value of a signal
+        planes = self._planes
+        src = _planes(val, self._ones)
+        if isinstance(key, slice):
+            i, j = int(key.start), 0 if key.stop is None else int(key.stop)
+            src = src[:i - j] + [0] * (i - j - len(src))
+            planes[j:i] = src
+        else:
+            if len(src) > 1 and any(src[1:]):
+                raise ValueError("Expected boolean value")
+            planes[int(key)] = src[0] if src else 0
+
+    # bitwise operators
+
+    def __and__(self, other):
+        return _bitwise(operator.and_, self, other)
+
+    def __rand__(self, other):
+        return _bitwise(operator.and_, other, self)
+
+    def __or__(self, other):
+        return _bitwise(operator.or_, self, other)
+
+    def __ror__(self, other):
+        return _bitwise(operator.or_, other, self)
+
+    def __xor__(self, other):
+        return _bitwise(operator.xor, self, other)
+
+    def __rxor__(self, other):
+        return _bitwise(operator.xor, other, self)
+
+    def __invert__(self):
+        ones = self._ones
+        return _Packed([ones ^ p for p in _planes(self, ones)], ones,
+                       self._bool)
+
+    def __lshift__(self, other):
+        return _Packed([0] * int(other) + _planes(self, self._ones),
+                       self._ones)
+
+    def __rshift__(self, other):
+        return _Packed(_planes(self, self._ones)[int(other):], self._ones)
+
+    # arithmetic as ripple-carry logic
+
+    def __add__(self, other):
+        pa, pb, ones = _pair(self, other)
+        out, carry = _add(pa, pb, 0)
+        return _Packed(out + [carry], ones)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        out, borrow, ones = _sub(self, other)
+        return _Packed(out + [borrow], ones, signed=True)
+
+    def __rsub__(self, other):
+        out, borrow, ones = _sub(other, self)
+        return _Packed(out + [borrow], ones, signed=True)
+
+    __mul__ = __rmul__ = _unsupported('*')
+    __truediv__ = __rtruediv__ = _unsupported('/')
+    __floordiv__ = __rfloordiv__ = _unsupported('//')
+    __mod__ = __rmod__ = _unsupported('%')
+    __pow__ = __rpow__ = _unsupported('**')
+    __neg__ = _unsupported('-')
+    __rlshift__ = __rrshift__ = _unsupported('shift by a signal')
+
+    # comparisons
+
+    def __eq__(self, other):
+        eq, ones = _equal(self, other)
+        return _Packed([eq], ones, True)
+
+    def __ne__(self, other):
+        eq, ones = _equal(self, other)
+        return _Packed([ones ^ eq], ones, True)
+
+    def __lt__(self, other):
+        out, lt, ones = _sub(self, other)
+        return _Packed([lt], ones, True)
+
+    def __gt__(self, other):
+        out, gt, ones = _sub(other, self)
+        return _Packed([gt], ones, True)
+
+    def __le__(self, other):
+        out, gt, ones = _sub(other, self)
+        return _Packed([ones ^ gt], ones, True)
+
+    def __ge__(self, other):
+        out, lt, ones = _sub(self, other)
+        return _Packed([ones ^ lt], ones, True)
+
+
+def _pack(vals):
+    """ Return the bit planes of a list of lane values """
+    vals = [int(v) for v in vals]
+    if min(vals) < 0:
+        raise ValueError("Negative value %s in packed simulation" %
+                         min(vals))
+    width = max(vals).bit_length()
+    rev = vals[::-1]
+    if width == 1:
+        return [int(''.join(map(str, rev)), 2)]
+    return [int(''.join(['1' if (v >> i) & 1 else '0' for v in rev]), 2)
+            for i in range(width)]
+
+
+class _PackedBatch(object):
+
+    """ The bit planes of the signals of a packed simulation """
+
+    def __init__(self, n, arglist, signals, clocks):
+        self.n = n
+        scalars = set(id(clock.sig) for clock in clocks)
+        for arg in arglist:
+            if isinstance(arg, _AlwaysSeq) and arg.varregs:
+                raise SimulationError(_error.Variables, arg.name)
+        sigs = []
+        for s in signals:
+            if id(s) in scalars:
+                continue
+            if type(s) not in (_Signal, ResetSignal):
+                raise SimulationError(_error.SigType, type(s).__name__)
+            if s._type is intbv:
+                lo, hi = s._min, s._max
+                if isinstance(s._val, fixbv) or lo != 0 or \
+                        hi is None or hi & (hi - 1):
+                    raise SimulationError(_error.ValType, repr(s._val))
+            elif s._type is not bool:
+                raise SimulationError(_error.ValType, repr(s._val))
+            sigs.append(s)
+        self.signals = sigs
+        self._saved = []
+        for s in sigs:
+            self._saved.append((s, s._setNextVal, s._update))
+            self._convert(s)
+
+    def _convert(self, sig):
+        n = self.n
+        ones = (1 << n) - 1
+        isbool = sig._type is bool
+        width = 1 if isbool else sig._nrbits
+        wrap = isinstance(sig._init, modbv)
+        init = _planes(sig._val, ones)
+        init = init + [0] * (width - len(init))
+        sig._val = _Packed(init, ones, isbool)
+        sig._next = _Packed(list(init), ones, isbool)
+
+        def setNext(val):
+            signed = False
+            if isinstance(val, _Packed):
+                planes = val._planes
+                signed = val._signed
+            elif isinstance(val, (list, tuple)):
+                if len(val) != n:
+                    raise SimulationError(_error.Width, "%d, not %d" %
+                                          (n, len(val)))
+                planes = _pack(val)
+            else:
+                planes = _planes(val, ones)
+            if signed:
+                sign = planes[-1]
+                if sign and not wrap:
+                    raise ValueError("intbv value < minimum 0 in lanes %s" %
+                                     bin(sign))
+                planes = planes + [sign] * (width - len(planes))
+            elif len(planes) > width:
+                high = 0
+                for p in planes[width:]:
+                    high |= p
+                if high and not wrap:
+                    if isbool:
+                        raise ValueError("Expected boolean value")
+                    raise ValueError("intbv value >= maximum %s in lanes %s"
+                                     % (sig._max, bin(high)))
+            else:
+                planes = planes + [0] * (width - len(planes))
+            sig._next._planes[:] = planes[:width]
+
+        def update():
+            sig._dirty = False
+            cur, next = sig._val._planes, sig._next._planes
+            if cur == next:
+                return []
+            waiters = sig._eventWaiters + sig._eventProcs
+            del sig._eventWaiters[:]
+            before = after = 0
+            for p in cur:
+                before |= p
+            for p in next:
+                after |= p
+            for edge, procs, lanes in (
+                    (sig._posedgeWaiters, sig._posedgeProcs,
+                     ~before & after),
+                    (sig._negedgeWaiters, sig._negedgeProcs,
+                     before & ~after)):
+                if not (edge or procs) or not lanes:
+                    continue
+                if lanes != ones:
+                    raise SimulationError(_error.Edge, sig._name or repr(sig))
+                waiters.extend(edge)
+                waiters.extend(procs)
+                del edge[:]
+            cur[:] = next
+            return waiters
+
+        sig._setNextVal = setNext
+        sig._update = update
+
+    def release(self):
+        """ Restore the scalar behavior of the signals """
+        for s, setNext, update in self._saved:
+            s._setNextVal = setNext
+            s._update = update
+        self._saved = []
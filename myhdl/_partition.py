@@ -0,0 +1,572 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2016 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Module with the partitioned simulation of Simulation.
+
+A partitioned simulation runs groups of instances, the partitions, in
+separate processes. The calling process runs the first partition, and
+coordinates the time steps of all of them in a conservative way: the
+next time step is the earliest event of any partition, and the
+partitions with work at that time take the step at the same time.
+
+Partitions communicate through boundary signals, driven in one partition
+and read in others. A boundary signal should be driven by blocks that
+are triggered by the edges of Clock objects only. Its new value is then
+known after the first delta cycle of a time step, and it is updated in
+the second delta cycle in the reading partitions, as in a single
+process. The clock edges also tell which partitions can change boundary
+signals at a time step, so that values are only exchanged at those
+steps. The Clock objects are replicated in the partitions that use their
+signals.
+"""
+from __future__ import absolute_import
+
+import os
+import sys
+import pickle
+import traceback
+
+from myhdl import SimulationError, StopSimulation
+from myhdl import _simulator
+from myhdl._simulator import _siglist, _activate
+from myhdl._Signal import _Signal, _PosedgeWaiterList, _NegedgeWaiterList
+from myhdl._always_seq import ResetSignal
+from myhdl._always_comb import _AlwaysComb
+from myhdl._always import _Always
+from myhdl._instance import _Instantiator
+from myhdl._clock import Clock
+from myhdl._levelize import _sigs
+from myhdl._checkpoint import _encode, _decode
+
+
+class _error:
+    pass
+_error.ArgType = "Partitioned simulation supports blocks and Clock " \
+    "objects, not"
+_error.Member = "Partition member is not an instance of the simulation"
+_error.Duplicate = "Instance assigned to more than one partition"
+_error.MultiDriven = "Signal driven in more than one partition"
+_error.SigType = "Boundary signal should be a plain Signal"
+_error.Driver = "Boundary signal should be driven by blocks triggered " \
+    "by Clock edges only"
+_error.Child = "Partition process failed"
+
+
+def _used(inst):
+    """ Return the signals that an instance refers to """
+    sigs = list(inst.sigdict.values())
+    for l in inst.losdict.values():
+        sigs.extend(l)
+    for e in getattr(inst, 'senslist', ()):
+        s = getattr(e, 'sig', e)
+        if isinstance(s, _Signal):
+            sigs.append(s)
+    return sigs
+
+
+def _clockEdges(inst, clocks):
+    """ Return the (clock, posedge) pairs that trigger a block, or None
+    if it is not triggered by the edges of Clock objects only """
+    if isinstance(inst, _AlwaysComb) or not isinstance(inst, _Always):
+        return None
+    edges = []
+    for e in inst.senslist:
+        if not isinstance(e, (_PosedgeWaiterList, _NegedgeWaiterList)) or \
+                id(e.sig) not in clocks:
+            return None
+        edges.append((clocks[id(e.sig)], isinstance(e, _PosedgeWaiterList)))
+    return edges
+
+
+def _isEdge(clock, posedge, t):
+    """ Return True if a clock has an edge of the polarity at time t """
+    base = clock.phase + clock._first
+    if posedge == bool(clock.sig._init):
+        # the edges back to the initial level
+        base += clock._second
+    return t >= base and (t - base) % clock.period == 0
+
+
+def _autoGroups(insts, clocks):
+    """ Group instances in clock domains.
+
+    The blocks triggered by the edges of the same clock are in the same
+    domain. Signals driven by other instances are not registered: their
+    drivers are in the domain of the instances that use them, and other
+    instances are in the domain of the drivers of the signals they use.
+    Returns the groups of instances, in the order of their first
+    instance.
+    """
+    roots = list(range(len(insts)))
+
+    def find(i):
+        while roots[i] != i:
+            roots[i] = roots[roots[i]]
+            i = roots[i]
+        return i
+
+    def union(i, j):
+        roots[find(i)] = find(j)
+
+    domains = {}
+    drivers = {}
+    users = {}
+    clocked = []
+    for i, inst in enumerate(insts):
+        edges = _clockEdges(inst, clocks)
+        clocked.append(edges is not None)
+        if edges:
+            for clock, posedge in edges:
+                union(i, domains.setdefault(id(clock.sig), i))
+        for s in _used(inst):
+            users.setdefault(id(s), []).append(i)
+        for s in _sigs(inst, inst.outputs | inst.inouts):
+            drivers.setdefault(id(s), []).append(i)
+    for k, l in drivers.items():
+        if len(l) > 1 or not all(clocked[i] for i in l):
+            for i in l + users.get(k, []):
+                union(l[0], i)
+    for i, inst in enumerate(insts):
+        if not clocked[i]:
+            for s in _used(inst):
+                for j in drivers.get(id(s), ()):
+                    union(i, j)
+    groups = {}
+    order = []
+    for i, inst in enumerate(insts):
+        r = find(i)
+        if r not in groups:
+            groups[r] = []
+            order.append(r)
+        groups[r].append(inst)
+    return [groups[r] for r in order]
+
+
+class _Plan(object):
+
+    """ Assignment of the instances of a design to partitions.
+
+    groups -- the instance groups of the partitions in child processes,
+              or 'auto' to group the instances in clock domains. The
+              instances that are in no group form the first partition.
+
+    """
+
+    def __init__(self, arglist, groups, **options):
+        insts = []
+        clocks = {}
+        for arg in arglist:
+            if isinstance(arg, Clock):
+                clocks[id(arg.sig)] = arg
+            elif isinstance(arg, _Instantiator):
+                insts.append(arg)
+            elif arg is True:
+                pass
+            else:
+                raise SimulationError(_error.ArgType, type(arg).__name__)
+        part = {}
+        if groups == 'auto':
+            groups = _autoGroups(insts, clocks)[1:]
+        ids = set(id(inst) for inst in insts)
+        for p, group in enumerate(groups):
+            for inst in group:
+                if isinstance(inst, Clock) or inst is True:
+                    continue
+                if id(inst) not in ids:
+                    raise SimulationError(_error.Member,
+                                          getattr(inst, 'name', repr(inst)))
+                if id(inst) in part:
+                    raise SimulationError(_error.Duplicate, inst.name)
+                part[id(inst)] = p + 1
+        n = len(groups) + 1
+        self.options = options
+        self.args = [[] for p in range(n)]
+        self.driven = [[] for p in range(n)]
+        self.outputs = [[] for p in range(n)]
+        self.consumers = [set() for p in range(n)]
+        self.edges = [[] for p in range(n)]
+        self.sigs = []
+        self.readers = []
+
+        used = [set() for p in range(n)]
+        drivers = {}
+        for inst in insts:
+            p = part.get(id(inst), 0)
+            self.args[p].append(inst)
+            used[p].update(id(s) for s in _used(inst))
+            for s in _sigs(inst, inst.outputs | inst.inouts):
+                if id(s) not in drivers:
+                    drivers[id(s)] = (p, s, [])
+                q, s, l = drivers[id(s)]
+                if q != p:
+                    raise SimulationError(_error.MultiDriven, "%s, %s" %
+                                          (l[0].name, inst.name))
+                l.append(inst)
+        # a clock runs in each partition that uses its signal
+        for k, clock in clocks.items():
+            users = [p for p in range(n) if k in used[p]] or [0]
+            for p in users:
+                self.args[p].append(clock)
+
+        for k, (p, s, l) in drivers.items():
+            self.driven[p].append(s)
+            readers = [q for q in range(n) if q != p and k in used[q]]
+            if not readers:
+                continue
+            if type(s) not in (_Signal, ResetSignal):
+                raise SimulationError(_error.SigType, l[0].name)
+            _encode(s._val)
+            for inst in l:
+                edges = _clockEdges(inst, clocks)
+                if edges is None:
+                    raise SimulationError(_error.Driver, inst.name)
+                for e in edges:
+                    if e not in self.edges[p]:
+                        self.edges[p].append(e)
+            self.outputs[p].append((len(self.sigs), s))
+            self.sigs.append(s)
+            self.readers.append(readers)
+            self.consumers[p].update(readers)
+
+    def writes(self, p, t):
+        """ Return True if partition p can change boundary signals at t """
+        for clock, posedge in self.edges[p]:
+            if _isEdge(clock, posedge, t):
+                return True
+        return False
+
+    def written(self, p):
+        """ Return the new values of the boundary signals of partition p """
+        return [(i, _encode(s._next)) for i, s in self.outputs[p]
+                if s._dirty]
+
+    def inject(self, updates):
+        """ Schedule the updates of boundary signals from other partitions """
+        sigs = self.sigs
+        for i, v in updates:
+            s = sigs[i]
+            s._next = _decode(s._next, v)
+            if not s._dirty:
+                s._dirty = True
+                _siglist.append(s)
+
+    def values(self, p):
+        """ Return the values of the signals driven in partition p """
+        values = []
+        for j, s in enumerate(self.driven[p]):
+            try:
+                values.append((j, _encode(s._val)))
+            except SimulationError:
+                pass
+        return values
+
+    def load(self, p, values):
+        """ Set the values of the signals driven in partition p """
+        driven = self.driven[p]
+        for j, v in values:
+            s = driven[j]
+            s._val = _decode(s._val, v)
+            s._next = _decode(s._next, v)
+
+
+class _Channel(object):
+
+    """ Pickled messages over a pair of pipes """
+
+    def __init__(self, rfd, wfd):
+        self._rf = os.fdopen(rfd, 'rb')
+        self._wf = os.fdopen(wfd, 'wb')
+
+    def send(self, msg):
+        pickle.dump(msg, self._wf, pickle.HIGHEST_PROTOCOL)
+        self._wf.flush()
+
+    def recv(self):
+        return pickle.load(self._rf)
+
+    def close(self):
+        for f in (self._wf, self._rf):
+            try:
+                f.close()
+            except (IOError, OSError):
+                pass
+
+
+class _Coordinator(object):
+
+    """ Link of the first partition to the partitions in child processes.
+
+    The simulator calls _exchange after the first delta cycle of a time
+    step when _getMode is set, collect when a time step is over, and
+    advance to get the next time step of the first partition.
+    """
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.children = {}
+        self._next = {}
+        self._pending = []
+        self._writers = []
+        self._readers = set()
+        self._stops = []
+        self._stopped = set()
+        self._started = False
+        self._getMode = 0
+
+    def start(self, sim):
+        """ Fork a child process for each partition but the first """
+        if self._started:
+            return
+        self._started = True
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if _simulator._tracing:
+            _simulator._tf.flush()
+        for p in range(1, len(self.plan.args)):
+            r1, w1 = os.pipe()
+            r2, w2 = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(w1)
+                os.close(r2)
+                for q, (qpid, channel) in self.children.items():
+                    channel.close()
+                _member(sim, self.plan, p, _Channel(r1, w2))
+            os.close(r1)
+            os.close(w2)
+            self.children[p] = (pid, _Channel(r2, w1))
+            self._next[p] = None
+        # the children start with the time step at time 0
+        self._pending = sorted(self.children)
+
+    def quit(self):
+        """ End the child processes """
+        for pid, channel in self.children.values():
+            channel.close()
+        for pid, channel in self.children.values():
+            os.waitpid(pid, 0)
+        self.children = {}
+
+    def _recv(self, p):
+        try:
+            msg = self.children[p][1].recv()
+        except EOFError:
+            raise SimulationError(_error.Child, "partition %d" % p)
+        if msg[0] == 'error':
+            if isinstance(msg[1], BaseException):
+                raise msg[1]
+            raise SimulationError(_error.Child,
+                                  "partition %d\n%s" % (p, msg[1]))
+        return msg
+
+    def _stop(self, e):
+        # the child processes are ended when the simulation finalizes
+        pass
+
+    def collect(self):
+        """ Wait until the child processes have finished the time step """
+        for p in self._pending[:]:
+            self._receive(p)
+        stops = self._stops
+        if stops:
+            self._stops = []
+            raise StopSimulation(stops[0])
+
+    def _receive(self, p):
+        """ Return the next message of a child process that has not
+        stopped, or None """
+        msg = self._recv(p)
+        if msg[0] == 'stop':
+            self._next[p] = None
+            self._stops.append(msg[1])
+            self._stopped.add(p)
+            self._pending.remove(p)
+            return None
+        if msg[0] == 'done':
+            self._next[p] = msg[1]
+            self._pending.remove(p)
+        return msg
+
+    def advance(self):
+        """ Return the next time step of the first partition.
+
+        The time steps in which the first partition has nothing to do
+        are taken by the child processes in the meantime.
+        """
+        plan = self.plan
+        futureEvents = _simulator._futureEvents
+        while 1:
+            own = None
+            if futureEvents:
+                own = futureEvents.nextTime()
+            times = [u for u in self._next.values() if u is not None]
+            if own is not None:
+                times.append(own)
+            if not times:
+                raise StopSimulation("No more events")
+            t = min(times)
+            active = [p for p, u in self._next.items() if u == t]
+            if own == t:
+                active.append(0)
+            writers = [p for p in active if plan.writes(p, t)]
+            readers = set()
+            for p in writers:
+                readers.update(plan.consumers[p])
+            pending = sorted(set(active) | readers)
+            for p in pending:
+                if p:
+                    self.children[p][1].send(
+                        ('step', t, p in writers, p in readers))
+            self._pending = [p for p in pending if p]
+            self._writers = writers
+            self._readers = readers
+            if own == t or 0 in readers:
+                self._getMode = bool(writers)
+                if own == t:
+                    return futureEvents.pop()
+                return t, []
+            _simulator._time = t
+            if writers:
+                self._exchange()
+            self.collect()
+
+    def _exchange(self):
+        """ Pass the new values of boundary signals to their readers """
+        self._getMode = 0
+        plan = self.plan
+        values = []
+        for p in self._writers:
+            if p:
+                msg = self._receive(p)
+                if msg is not None:
+                    values.extend(msg[1])
+            else:
+                values.extend(plan.written(0))
+        updates = dict((p, []) for p in self._readers)
+        for i, v in values:
+            for q in plan.readers[i]:
+                updates[q].append((i, v))
+        for p, l in updates.items():
+            if not p:
+                plan.inject(l)
+            elif p in self._pending:
+                # a stopped process takes no more updates
+                self.children[p][1].send(('updates', l))
+
+    def suspend(self):
+        """ Bring the signals of the child partitions up to date.
+
+        A watchpoint can suspend the run before the time step is over:
+        the child processes finish it first. A child that stopped keeps
+        its stop for the next run.
+        """
+        if self._getMode:
+            self._exchange()
+        for p in self._pending[:]:
+            self._receive(p)
+        active = [p for p in sorted(self.children) if p not in self._stopped]
+        for p in active:
+            self.children[p][1].send(('sync',))
+        for p in active:
+            self.plan.load(p, self._recv(p)[1])
+
+
+class _Member(object):
+
+    """ Link of a partition in a child process to the coordinator """
+
+    def __init__(self, plan, p, channel):
+        self.plan = plan
+        self.p = p
+        self.channel = channel
+        self.stopped = None
+        self._write = self._read = False
+        self._getMode = 0
+
+    def start(self, sim):
+        pass
+
+    def quit(self):
+        pass
+
+    def _stop(self, e):
+        self.stopped = e
+
+    def collect(self):
+        pass
+
+    def advance(self):
+        """ Report the next event, and wait for the next time step """
+        futureEvents = _simulator._futureEvents
+        own = None
+        if futureEvents:
+            own = futureEvents.nextTime()
+        channel = self.channel
+        channel.send(('done', own))
+        while 1:
+            msg = channel.recv()
+            if msg[0] == 'step':
+                t, self._write, self._read = msg[1:]
+                self._getMode = self._write or self._read
+                if own == t:
+                    return futureEvents.pop()
+                return t, []
+            channel.send(('values', self.plan.values(self.p)))
+
+    def _exchange(self):
+        self._getMode = 0
+        if self._write:
+            self.channel.send(('writes', self.plan.written(self.p)))
+        if self._read:
+            self.plan.inject(self.channel.recv()[1])
+
+
+def _member(sim, plan, p, channel):
+    """ Run partition p in a child process """
+    try:
+        try:
+            # the trace file belongs to the calling process
+            for s in sim._ctx.signals:
+                s._tracing = 0
+            sim._release()
+            part = type(sim)(*plan.args[p], **plan.options)
+            link = part._link = _Member(plan, p, channel)
+            _activate(part._ctx)
+            if part._runEvents(None, 1, None) == 0:
+                channel.send(('stop', str(link.stopped)))
+            # wait until the coordinator closes the channel
+            while 1:
+                channel.recv()
+        except EOFError:
+            pass
+        except BaseException as e:
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = traceback.format_exc()
+            try:
+                channel.send(('error', e))
+            except (IOError, OSError):
+                pass
+    finally:
+        # never return into the code of the calling process
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
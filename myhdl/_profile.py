@@ -0,0 +1,212 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Activation profiler of the simulation kernel """
+from __future__ import absolute_import
+from __future__ import print_function
+
+import json
+import sys
+from timeit import default_timer as _timer
+from types import GeneratorType
+
+from myhdl._block import _Block
+from myhdl._getHierarchy import _getHierarchy
+from myhdl._instance import _Instantiator
+
+
+class _Profile(object):
+
+    """ Profile of a simulation.
+
+    Methods:
+    report -- write a text report
+    dump -- write the profile to a file as JSON
+    dumpStacks -- write the process times as collapsed stacks
+
+    Attributes:
+    processes -- {name: [activations, seconds]} per process
+    updates -- {name: count} of signal updates per signal
+    deltas -- {n: count} of time steps with n delta cycles
+    depth -- [(time, depth)] of the future event queue, at the
+             time steps where the depth changed
+
+    """
+
+    def __init__(self, args, arglist):
+        self._paths, self._signames = _hierarchyNames(args, arglist)
+        self._procs = {}
+        self._sigs = {}
+        self.deltas = {}
+        self.depth = []
+        self._ndeltas = 0
+
+    def next(self, waiter, waiters, exc):
+        """ Call waiter.next, and account its time to its process """
+        gen = waiter.generator
+        if gen is None:
+            # the waiter that ends a run
+            return waiter.next(waiters, exc)
+        stat = self._procs.get(id(gen))
+        if stat is None:
+            stat = self._procs[id(gen)] = [self._path(waiter), 0, 0.0]
+        t0 = _timer()
+        try:
+            waiter.next(waiters, exc)
+            stat[1] += 1
+        finally:
+            stat[2] += _timer() - t0
+
+    def update(self, siglist):
+        """ Count the updates of the signals in siglist """
+        sigs = self._sigs
+        for s in siglist:
+            stat = sigs.get(id(s))
+            if stat is None:
+                sigs[id(s)] = [self._signames.get(id(s)) or
+                               s._name or repr(s), 1]
+            else:
+                stat[1] += 1
+
+    def delta(self):
+        """ Count a delta cycle """
+        self._ndeltas += 1
+
+    def step(self, t, depth):
+        """ Close a time step, and start the one at time t """
+        n = self._ndeltas
+        self.deltas[n] = self.deltas.get(n, 0) + 1
+        self._ndeltas = 0
+        if not self.depth or self.depth[-1][1] != depth:
+            self.depth.append((t, depth))
+
+    def _path(self, waiter):
+        gen = waiter.generator
+        path = self._paths.get(id(gen))
+        if path is None:
+            path = (getattr(gen, '__name__', None) or
+                    type(waiter).__name__,)
+        return path
+
+    @property
+    def processes(self):
+        procs = {}
+        for path, n, secs in self._procs.values():
+            name = ".".join(path)
+            if name in procs:
+                procs[name][0] += n
+                procs[name][1] += secs
+            else:
+                procs[name] = [n, secs]
+        return procs
+
+    @property
+    def updates(self):
+        updates = {}
+        for name, n in self._sigs.values():
+            updates[name] = updates.get(name, 0) + n
+        return updates
+
+    def report(self, f=None, limit=20):
+        """ Write a text report, with the processes by decreasing time.
+
+        f -- file to write to (default: sys.stdout)
+        limit -- number of processes and signals to list
+
+        """
+        f = f or sys.stdout
+        procs = sorted(self.processes.items(),
+                       key=lambda item: (-item[1][1], item[0]))
+        total = sum(secs for n, secs in self.processes.values())
+        print("%12s %10s %8s %10s  %s" %
+              ("activations", "time (s)", "%", "us/act", "process"), file=f)
+        for name, (n, secs) in procs[:limit]:
+            print("%12d %10.4f %8.1f %10.2f  %s" %
+                  (n, secs, 100.0 * secs / total if total else 0,
+                   1e6 * secs / n if n else 0, name), file=f)
+        print(file=f)
+        updates = sorted(self.updates.items(),
+                         key=lambda item: (-item[1], item[0]))
+        print("%12s  %s" % ("updates", "signal"), file=f)
+        for name, n in updates[:limit]:
+            print("%12d  %s" % (n, name), file=f)
+        print(file=f)
+        nsteps = sum(self.deltas.values())
+        if nsteps:
+            ndeltas = sum(n * c for n, c in self.deltas.items())
+            print("time steps: %d, delta cycles: %d (%.2f per step, max %d)" %
+                  (nsteps, ndeltas, float(ndeltas) / nsteps,
+                   max(self.deltas)), file=f)
+        if self.depth:
+            print("future events: max %d" %
+                  max(d for t, d in self.depth), file=f)
+
+    def dump(self, path):
+        """ Write the profile to the file path as JSON """
+        data = {'processes': self.processes,
+                'updates': self.updates,
+                'deltas': dict((str(n), c) for n, c in self.deltas.items()),
+                'depth': self.depth}
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    def dumpStacks(self, path):
+        """ Write the process times in microseconds to the file path,
+        in the collapsed stack format of flame graph tools.
+        """
+        stacks = {}
+        for p, n, secs in self._procs.values():
+            stack = ";".join(p)
+            stacks[stack] = stacks.get(stack, 0) + secs
+        with open(path, 'w') as f:
+            for stack in sorted(stacks):
+                print("%s %d" % (stack, round(1e6 * stacks[stack])), file=f)
+
+
+def _hierarchyNames(args, arglist):
+    """ Return the hierarchical paths of the processes, by generator id,
+    and the hierarchical names of the signals, by signal id.
+    """
+    paths = {}
+    signames = {}
+    tops = []
+    todo = list(args)
+    while todo:
+        arg = todo.pop(0)
+        if isinstance(arg, _Block):
+            tops.append(arg)
+        elif isinstance(arg, (list, tuple, set)):
+            todo.extend(arg)
+    for top in tops:
+        h = _getHierarchy(top.name, top)
+        blockpaths = {id(top): (top.name,)}
+        for inst in h.hierarchy:
+            path = blockpaths[id(inst.obj)]
+            for name, s in inst.sigdict.items():
+                signames.setdefault(id(s), ".".join(path + (name,)))
+            for name, sub in inst.subs:
+                blockpaths[id(sub)] = path + (name,)
+                if isinstance(sub, _Instantiator):
+                    paths[id(sub.gen)] = path + (name,)
+    for arg in arglist:
+        if isinstance(arg, _Instantiator):
+            paths.setdefault(id(arg.gen), (arg.name,))
+        elif isinstance(arg, GeneratorType):
+            paths.setdefault(id(arg), (arg.__name__,))
+    return paths, signames
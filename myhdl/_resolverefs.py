@@ -3,7 +3,8 @@ import ast
 import itertools
 from types import FunctionType
 
-from myhdl._util import _flatten
+from myhdl._cache import _Cache
+from myhdl._util import _flatten, _parse, _codeKey
 from myhdl._enum import EnumType
 from myhdl._Signal import SignalType
 
@@ -31,6 +32,10 @@ def _suffixer(name, used_names):
     return next(s for s in new_names if s not in used_names)
 
 
+_reserved = ('next', 'posedge', 'negedge', 'max', 'min', 'val', 'signed',
+             'verilog_code', 'vhdl_code')
+
+
 class _AttrRefTransformer(ast.NodeTransformer):
 
     def __init__(self, data):
@@ -42,42 +47,127 @@ class _AttrRefTransformer(ast.NodeTransformer):
     def visit_Attribute(self, node):
         self.generic_visit(node)
 
-        reserved = ('next', 'posedge', 'negedge', 'max', 'min', 'val', 'signed',
-                    'verilog_code', 'vhdl_code')
-        if node.attr in reserved:
+        if node.attr in _reserved:
             return node
 
         # Don't handle subscripts for now.
         if not isinstance(node.value, ast.Name):
             return node
 
-        # Don't handle locals
-        if node.value.id not in self.data.symdict:
+        new_name = self._resolve(node.value.id, node.attr)
+        if new_name is None:
             return node
 
-        obj = self.data.symdict[node.value.id]
+        new_node = ast.Name(id=new_name, ctx=node.value.ctx)
+        return ast.copy_location(new_node, node)
+
+    def _resolve(self, name, attr):
+        """ Resolve the reference name.attr to a new name in the symdict.
+
+        Return the new name, or None if the reference is not resolved.
+        """
+        # Don't handle locals
+        if name not in self.data.symdict:
+            return None
+
+        obj = self.data.symdict[name]
         # Don't handle enums and functions, handle signals as long as it is a new attribute
         if isinstance(obj, (EnumType, FunctionType)):
-            return node
+            return None
         elif isinstance(obj, SignalType):
-            if hasattr(SignalType, node.attr):
-                return node
+            if hasattr(SignalType, attr):
+                return None
 
-        attrobj = getattr(obj, node.attr)
+        attrobj = getattr(obj, attr)
 
-        orig_name = node.value.id + '.' + node.attr
+        orig_name = name + '.' + attr
         if orig_name not in self.name_map:
-            base_name = node.value.id + '_' + node.attr
+            base_name = name + '_' + attr
             self.name_map[orig_name] = _suffixer(base_name, self.data.symdict)
         new_name = self.name_map[orig_name]
         self.data.symdict[new_name] = attrobj
         self.data.objlist.append(new_name)
-
-        new_node = ast.Name(id=new_name, ctx=node.value.ctx)
-        return ast.copy_location(new_node, node)
+        return new_name
+
+    def bind(self, refs):
+        """ Resolve the references collected by _AttrRefCollector, in
+        the order of a visit, without visiting the tree.
+
+        Return the new names, with None for the unresolved references.
+        """
+        new_names = []
+        for name, attr in refs:
+            if not isinstance(name, str):
+                # a reference to the attribute of an earlier reference
+                name = new_names[name]
+                if name is None:
+                    new_names.append(None)
+                    continue
+            new_names.append(self._resolve(name, attr))
+        return new_names
 
     def visit_FunctionDef(self, node):
         nodes = _flatten(node.body, node.args)
         for n in nodes:
             self.visit(n)
         return node
+
+
+class _AttrRefRenamer(_AttrRefTransformer):
+
+    """ Transformer that renames the references resolved by the bind
+    method of an _AttrRefTransformer.
+    """
+
+    def __init__(self, name_map):
+        self.name_map = name_map
+
+    def _resolve(self, name, attr):
+        return self.name_map.get(name + '.' + attr)
+
+
+class _AttrRefCollector(_AttrRefTransformer):
+
+    """ Collect the attribute references that an _AttrRefTransformer
+    may resolve, in the order of its visit.
+
+    A reference is a (name, attr) pair, or an (index, attr) pair for the
+    attribute of the reference at that index in the list.
+    """
+
+    def __init__(self):
+        self.refs = []
+
+    def visit_Attribute(self, node):
+        self.generic_visit(node)
+        if node.attr in _reserved:
+            return node
+        value = node.value
+        if isinstance(value, ast.Name):
+            name = value.id
+        elif hasattr(value, 'ref'):
+            name = value.ref
+        else:
+            return node
+        node.ref = len(self.refs)
+        self.refs.append((name, node.attr))
+        return node
+
+
+_codenames = _Cache('names', persistent=True)
+
+
+def _codeNames(code):
+    """ Return the names and the attribute references in the source of
+    a code object.
+    """
+    key = _codeKey(code)
+    info = _codenames.lookup(key)
+    if info is None:
+        tree = _parse(code)
+        names = sorted(set(n.id for n in ast.walk(tree)
+                           if isinstance(n, ast.Name)))
+        v = _AttrRefCollector()
+        v.visit(tree)
+        info = _codenames[key] = (tuple(names), tuple(v.refs))
+    return info
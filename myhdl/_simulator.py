@@ -23,17 +23,282 @@ This module provides the following objects:
 now -- function that returns the current simulation time
 
 """
+from __future__ import absolute_import
+
+from heapq import heappush, heappop
+
+
+class _EventQueue(object):
+
+    """ Future event queue.
+
+    Events are kept in a FIFO bucket per time point, and the distinct
+    time points are kept in a heap. Scheduling and popping a time point
+    are O(log m), with m the number of distinct pending time points,
+    and events at the same time are returned in scheduling order.
+
+    """
+
+    __slots__ = ('_times', '_buckets', '_size')
+
+    def __init__(self):
+        self._times = []
+        self._buckets = {}
+        self._size = 0
+
+    def schedule(self, t, event):
+        """ Schedule event at time t """
+        bucket = self._buckets.get(t)
+        if bucket is None:
+            self._buckets[t] = [event]
+            heappush(self._times, t)
+        else:
+            bucket.append(event)
+        self._size += 1
+
+    def nextTime(self):
+        """ Return the earliest pending time """
+        return self._times[0]
+
+    def pop(self):
+        """ Remove and return the earliest time and its list of events """
+        t = heappop(self._times)
+        events = self._buckets.pop(t)
+        self._size -= len(events)
+        return t, events
+
+    def items(self):
+        """ Return the pending (time, event) pairs in dispatch order """
+        buckets = self._buckets
+        return [(t, e) for t in sorted(buckets) for e in buckets[t]]
+
+    def clear(self):
+        del self._times[:]
+        self._buckets.clear()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    __nonzero__ = __bool__
+
+
+class _WheelQueue(object):
+
+    """ Timing wheel future event queue.
+
+    Events within a window of nrslots time units from the current time
+    are stored in the slot of their time point, so that scheduling and
+    popping them is O(1) for the common case of near-future events, such
+    as clock half-periods. Events beyond the window are kept in an
+    _EventQueue and moved into the wheel when the window reaches them.
+
+    """
+
+    __slots__ = ('_slots', '_mask', '_span', '_now', '_used',
+                 '_overflow', '_size')
+
+    def __init__(self, nrslots=1024):
+        span = 1
+        while span < nrslots:
+            span <<= 1
+        self._slots = [None] * span
+        self._mask = span - 1
+        self._span = span
+        self._now = 0
+        self._used = 0
+        self._overflow = _EventQueue()
+        self._size = 0
+
+    def schedule(self, t, event):
+        """ Schedule event at time t """
+        if t - self._now < self._span:
+            i = t & self._mask
+            bucket = self._slots[i]
+            if bucket is None:
+                self._slots[i] = [event]
+                self._used += 1
+            else:
+                bucket.append(event)
+        else:
+            self._overflow.schedule(t, event)
+        self._size += 1
+
+    def nextTime(self):
+        """ Return the earliest pending time """
+        if not self._used:
+            return self._overflow.nextTime()
+        slots, mask = self._slots, self._mask
+        t = self._now
+        while slots[t & mask] is None:
+            t += 1
+        return t
+
+    def pop(self):
+        """ Remove and return the earliest time and its list of events """
+        slots, mask = self._slots, self._mask
+        overflow = self._overflow
+        if self._used:
+            t = self._now
+            while slots[t & mask] is None:
+                t += 1
+        else:
+            t = overflow.nextTime()
+        self._now = t
+        # move overflow events that are now within the window
+        if overflow._size:
+            limit = t + self._span
+            while overflow._size and overflow._times[0] < limit:
+                ot, events = overflow.pop()
+                slots[ot & mask] = events
+                self._used += 1
+        i = t & mask
+        events = slots[i]
+        slots[i] = None
+        self._used -= 1
+        self._size -= len(events)
+        return t, events
+
+    def items(self):
+        """ Return the pending (time, event) pairs in dispatch order """
+        slots, mask = self._slots, self._mask
+        items = []
+        for t in range(self._now, self._now + self._span):
+            bucket = slots[t & mask]
+            if bucket is not None:
+                items.extend((t, e) for e in bucket)
+        items.extend(self._overflow.items())
+        return items
+
+    def clear(self):
+        self._slots = [None] * self._span
+        self._now = 0
+        self._used = 0
+        self._overflow.clear()
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    __nonzero__ = __bool__
+
+
+_schedulers = {'heap': _EventQueue,
+               'wheel': _WheelQueue,
+               }
+
+class _Context(object):
+
+    """ Kernel state of a simulation.
+
+    The state of the active simulation lives in the module globals
+    below, that the kernel accesses directly. _activate saves the state
+    of the previously active simulation in its context and loads the
+    state of the new one. The list of pending signal updates is shared,
+    as it is bound at import time in the modules that append to it: the
+    updates of the signals of other simulations are moved in and out.
+
+    A simulation claims the signals of the default registry at
+    construction, and returns them when it finishes.
+    """
+
+    __slots__ = ('time', 'futureEvents', 'tracing', 'tf', 'siglist',
+                 'signals', 'sigids', 'mark')
+
+    def __init__(self, futureEvents, signals, tracing, tf):
+        self.time = 0
+        self.futureEvents = futureEvents
+        self.tracing = tracing
+        self.tf = tf
+        self.siglist = []
+        self.signals = signals
+        self.sigids = set(id(s) for s in signals)
+        self.mark = 0
+
+    def claim(self, signals):
+        self.signals.extend(signals)
+        self.sigids.update(id(s) for s in signals)
 
 
 _signals = []
 _blocks = []
 _siglist = []
-_futureEvents = []
+_rearms = []
+_futureEvents = _EventQueue()
 _time = 0
 _tracing = 0
 _tf = None
 
+_defaultEvents = _futureEvents
+_contexts = []
+_context = None
+
+
+def _activate(ctx):
+    """ Make ctx the context of the kernel globals """
+    global _context, _time, _futureEvents, _tracing, _tf
+    if _context is ctx:
+        return
+    _deactivate()
+    # keep the pending updates of signals that no other simulation owns
+    pending = _siglist[:]
+    del _siglist[:]
+    _siglist.extend(ctx.siglist)
+    del ctx.siglist[:]
+    sigids = ctx.sigids
+    for s in pending:
+        k = id(s)
+        if k not in sigids:
+            for other in _contexts:
+                if k in other.sigids:
+                    other.siglist.append(s)
+                    break
+            else:
+                _siglist.append(s)
+        else:
+            _siglist.append(s)
+    _time = ctx.time
+    _futureEvents = ctx.futureEvents
+    _tracing = ctx.tracing
+    _tf = ctx.tf
+    ctx.mark = len(_signals)
+    _context = ctx
+
+
+def _deactivate():
+    """ Save the active context, and return to the default context.
+
+    The time is kept, so that now() returns the time of the simulation
+    that ran last.
+    """
+    global _context, _futureEvents, _tracing
+    ctx = _context
+    if ctx is None:
+        return
+    ctx.time = _time
+    ctx.futureEvents = _futureEvents
+    ctx.tracing = _tracing
+    ctx.tf = _tf
+    # signals created while the simulation was active belong to it
+    if len(_signals) > ctx.mark:
+        ctx.claim(_signals[ctx.mark:])
+        del _signals[ctx.mark:]
+    _futureEvents = _defaultEvents
+    _tracing = 0
+    _context = None
+
 
 def now():
     """ Return the current simulation time """
     return _time
+
+
+def _schedule(t, event):
+    """ Schedule event at time t in the future event queue """
+    _futureEvents.schedule(t, event)
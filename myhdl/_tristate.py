@@ -27,6 +27,7 @@ class _Tristate(_Signal):
         self._drivers = []
         super(Tristate, self).__init__(val)
         self._val = None
+        self._update = self._updateResolved
 
     def driver(self):
         d = _TristateDriver(self)
@@ -44,9 +45,9 @@ class _Tristate(_Signal):
                 break
         self._next = next
 
-    def _update(self):
+    def _updateResolved(self):
         self._resolve()
-        return super(Tristate, self)._update()
+        return self._updateMutable()
 
 
 class _TristateDriver(_Signal):
@@ -54,6 +55,7 @@ class _TristateDriver(_Signal):
     def __init__(self, bus):
         _Signal.__init__(self, bus._val)
         self._val = None
+        self._update = self._updateMutable
         self._bus = bus
 
     @_Signal.next.setter
@@ -64,7 +66,10 @@ class _TristateDriver(_Signal):
             self._next = None
         else:
             self._setNextVal(val)
-        _siglist.append(self._bus)
+        bus = self._bus
+        if not bus._dirty:
+            bus._dirty = True
+            _siglist.append(bus)
 
 
 class _DelayedTristate(_DelayedSignal, _Tristate):
@@ -73,7 +78,10 @@ class _DelayedTristate(_DelayedSignal, _Tristate):
         self._drivers = []
         super(_DelayedTristate, self).__init__(val, delay)
         self._val = None
+        self._inplace = False
+        self._copied = True
+        self._update = self._updateResolved
 
-    def _update(self):
+    def _updateResolved(self):
         self._resolve()
-        return super(_DelayedTristate, self)._update()
+        return self._updateDelayed()
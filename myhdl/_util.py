@@ -31,6 +31,7 @@ import inspect
 from tokenize import generate_tokens, untokenize, INDENT
 
 from myhdl._compat import integer_types, StringIO
+from myhdl._cache import _Cache
 
 
 def _printExcInfo():
@@ -55,6 +56,21 @@ def _flatten(*args):
     return arglist
 
 
+def _getFrames(depth):
+    """ Return the frames of the call stack, starting at the caller,
+    up to depth frames.
+
+    Unlike inspect.stack, this does not look up the source files and
+    lines of the frames.
+    """
+    frames = []
+    f = sys._getframe(1)
+    while f is not None and len(frames) < depth:
+        frames.append(f)
+        f = f.f_back
+    return frames
+
+
 def _isTupleOfInts(obj):
     if not isinstance(obj, tuple):
         return False
@@ -74,29 +90,57 @@ def _dedent(s):
     return untokenize(result)
 
 
-def _makeAST(f):
-    # Need to look at the flags used to compile the original function f and
+# compiler flags of the __future__ features, that compile() accepts
+_futureFlags = 0
+for _feature in __future__.all_feature_names:
+    _futureFlags |= getattr(__future__, _feature).compiler_flag
+
+_sources = _Cache('source', persistent=True)
+
+
+def _codeKey(code):
+    """ Return the cache key of a code object.
+
+    Code objects compare equal when their code and line numbers are
+    equal, so the key includes the file name.
+    """
+    return code.co_filename, code
+
+
+def _getSource(code):
+    """ Return the dedented source, source file and line offset of a
+    code object.
+    """
+    key = _codeKey(code)
+    src = _sources.lookup(key)
+    if src is None:
+        s = _dedent(inspect.getsource(code))
+        src = _sources[key] = (s, inspect.getsourcefile(code),
+                               inspect.getsourcelines(code)[1] - 1)
+    return src
+
+
+def _parse(code):
+    """ Return a fresh AST of the source of a code object """
+    s, sourcefile, lineoffset = _getSource(code)
+    # Need to look at the flags used to compile the original code and
     # pass these same flags to the compile() function. This ensures that
     # syntax-changing __future__ imports like print_function work correctly.
-    orig_f_co_flags = f.__code__.co_flags
     # co_flags can contain various internal flags that we can't pass to
     # compile(), so strip them out here
-    valid_flags = 0
-    for future_feature in __future__.all_feature_names:
-        feature = getattr(__future__, future_feature)
-        valid_flags |= feature.compiler_flag
-    s = inspect.getsource(f)
-    s = _dedent(s)
     # use compile instead of ast.parse so that additional flags can be passed
-    flags = ast.PyCF_ONLY_AST | (orig_f_co_flags & valid_flags)
+    flags = ast.PyCF_ONLY_AST | (code.co_flags & _futureFlags)
     tree = compile(s, filename='<unknown>', mode='exec',
         flags=flags, dont_inherit=True)
-    # tree = ast.parse(s)
-    tree.sourcefile = inspect.getsourcefile(f)
-    tree.lineoffset = inspect.getsourcelines(f)[1] - 1
+    tree.sourcefile = sourcefile
+    tree.lineoffset = lineoffset
     return tree
 
 
+def _makeAST(f):
+    return _parse(f.__code__)
+
+
 def _genfunc(gen):
     from myhdl._always_comb import _AlwaysComb
     from myhdl._always_seq import _AlwaysSeq
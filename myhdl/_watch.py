@@ -0,0 +1,83 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Watchpoints of the simulation kernel """
+from __future__ import absolute_import
+
+from myhdl import StopSimulation, _SuspendSimulation
+from myhdl import _simulator
+
+
+class _Watchpoint(object):
+
+    """ Watchpoint on a signal.
+
+    The watchpoint stays subscribed to the procs list of the event waiter
+    list of the signal, like the process of an always block. The kernel
+    runs it in the delta cycles in which the signal changes only, so that
+    it costs nothing while the signal is idle. Its runs are not counted as
+    process activations.
+
+    Attributes:
+    sig -- the watched signal
+    predicate -- callable on the new value, or None for any change
+    action -- 'suspend', 'stop' or a callable on the signal
+    hits -- number of changes for which the predicate was true
+
+    """
+
+    __slots__ = ('generator', 'hasRun', 'sig', 'predicate', 'action',
+                 'hits')
+
+    def __init__(self, sig, predicate, action):
+        self.generator = None
+        self.hasRun = 0
+        self.sig = sig
+        self.predicate = predicate
+        self.action = action
+        self.hits = 0
+
+    def next(self, waiters, exc):
+        sig = self.sig
+        if self.predicate is None or self.predicate(sig._val):
+            self.hits += 1
+            action = self.action
+            if action == 'suspend':
+                # at the end of the time step, like the end of a duration
+                if not exc:
+                    exc.append(_SuspendSimulation(self._message()))
+            elif action == 'stop':
+                if not exc:
+                    exc.append(StopSimulation(self._message()))
+            else:
+                action(sig)
+        raise StopIteration
+
+    def _message(self):
+        name = self.sig._name or "signal"
+        return "Watchpoint on %s at time %s: %s" % \
+            (name, _simulator._time, self.sig._val)
+
+    def subscribe(self):
+        self.sig._eventWaiters.procs.append(self)
+
+    def unsubscribe(self):
+        procs = self.sig._eventWaiters.procs
+        if self in procs:
+            procs.remove(self)
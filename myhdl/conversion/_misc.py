@@ -71,6 +71,7 @@ class _error(object):
     PortInList = "Port in list is not supported"
     ListAsPort = "List of signals as a port is not supported"
     SignalInMultipleLists = "Signal in multiple list is not supported"
+    Timescale = "Timescale should be of the form '1ns/10ps'"
 
 
 class _access(object):
@@ -25,6 +25,7 @@ from __future__ import print_function
 
 import sys
 import math
+import re
 import os
 
 import inspect
@@ -45,6 +46,7 @@ from myhdl._extractHierarchy import (_HierExtr, _isMem, _getMemInfo,
                                      _UserVhdlCode, _userCodeMap)
 
 from myhdl._instance import _Instantiator
+from myhdl._clock import Clock
 from myhdl._Signal import _Signal, _WaiterList, posedge, negedge
 from myhdl._enum import EnumType, EnumItemType
 from myhdl._intbv import intbv
@@ -72,6 +74,19 @@ _shortversion = _version.replace('dev', '')
 _converting = 0
 _profileFunc = None
 _enumPortTypeSet = set()
+_timeunit = "1 ns"
+
+# time units of a Verilog timescale, as VHDL physical units
+_vhdlUnits = {'s': 'sec', 'ms': 'ms', 'us': 'us', 'ns': 'ns', 'ps': 'ps',
+              'fs': 'fs'}
+
+
+def _timeUnit(timescale):
+    """ Return the VHDL time of the unit of a timescale like '1ns/10ps' """
+    m = re.match(r"\s*(1|10|100)\s*([a-z]+)\s*/", timescale)
+    if m is None or m.group(2) not in _vhdlUnits:
+        raise ToVHDLError(_error.Timescale, timescale)
+    return "%s %s" % (m.group(1), _vhdlUnits[m.group(2)])
 
 
 def _checkArgs(arglist):
@@ -91,6 +106,8 @@ def _flatten(*args):
                 arg = arg.subs
         if id(arg) in _userCodeMap['vhdl']:
             arglist.append(_userCodeMap['vhdl'][id(arg)])
+        elif isinstance(arg, Clock):
+            arglist.append(arg._toVHDL(_timeunit))
         elif isinstance(arg, (list, tuple, set)):
             for item in arg:
                 arglist.extend(_flatten(item))
@@ -121,7 +138,8 @@ class _ToVHDLConvertor(object):
                  "use_clauses",
                  "architecture",
                  "std_logic_ports",
-                 "initial_values"
+                 "initial_values",
+                 "timescale"
                  )
 
     def __init__(self):
@@ -136,9 +154,11 @@ class _ToVHDLConvertor(object):
         self.architecture = "MyHDL"
         self.std_logic_ports = False
         self.initial_values = False
+        self.timescale = "1ns/10ps"
 
     def __call__(self, func, *args, **kwargs):
         global _converting
+        global _timeunit
         if _converting:
             return func(*args, **kwargs)  # skip
         else:
@@ -150,6 +170,7 @@ class _ToVHDLConvertor(object):
         if not isinstance(func, _Block):
             if not callable(func):
                 raise ToVHDLError(_error.FirstArgType, "got %s" % type(func))
+        _timeunit = _timeUnit(self.timescale)
 
         # clear out the list of user declared Signal (and other?) names
         del _usedNames[:]
@@ -1145,7 +1166,7 @@ class _ConvertVisitor(ast.NodeVisitor, _ConversionMixin):
             self.write(f.__name__)
         elif f is delay:
             self.visit(node.args[0])
-            self.write(" * 1 ns")
+            self.write(" * %s" % _timeunit)
             return
         elif f is concat:
             pre, suf = self.inferCast(node.vhd, node.vhdOri)
@@ -46,6 +46,7 @@ from myhdl._extractHierarchy import (_HierExtr, _isMem, _getMemInfo,
                                      _UserVerilogCode, _userCodeMap)
 
 from myhdl._instance import _Instantiator
+from myhdl._clock import Clock
 from myhdl.conversion._misc import (_error, _kind, _context,
                                     _ConversionMixin, _Label, _genUniqueSuffix, _isConstant)
 from myhdl.conversion._analyze import (_analyzeSigs, _analyzeGens, _analyzeTopFunc,
@@ -77,6 +78,8 @@ def _flatten(*args):
                 arg = arg.subs
         if id(arg) in _userCodeMap['verilog']:
             arglist.append(_userCodeMap['verilog'][id(arg)])
+        elif isinstance(arg, Clock):
+            arglist.append(arg._toVerilog())
         elif isinstance(arg, (list, tuple, set)):
             for item in arg:
                 arglist.extend(_flatten(item))
@@ -4,6 +4,7 @@ from __future__ import print_function
 import platform
 
 from . import __version__
+from ._cache import _cacheStats
 
 
 def print_versions():
@@ -21,5 +22,22 @@ def print_versions():
         print("{}: {}".format(k, v))
 
 
+def cache_stats():
+    """ Return {name: (hits, misses, size, loads)} of the elaboration
+    caches, where loads counts the hits read from the on-disk cache.
+    """
+    return _cacheStats()
+
+
+def print_cache_stats():
+    print()
+    print("ELABORATION CACHES")
+    print("------------------")
+    print("{:10} {:>10} {:>10} {:>10} {:>10}".format("cache", "hits", "misses",
+                                                     "size", "loads"))
+    for name, stats in sorted(cache_stats().items()):
+        print("{:10} {:>10} {:>10} {:>10} {:>10}".format(name, *stats))
+
+
 if __name__ == "__main__":
     print_versions()
@@ -0,0 +1,343 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Parallel regression runner
+
+This module provides the following objects:
+Job -- a testbench run: a block factory with a parameter set
+regress -- run jobs in a process pool and return a report
+
+It can also be run as a script:
+
+    python -m myhdl.regress [-j N] [--timeout T] [-o report.json] jobs.json
+
+The jobs file is a JSON list of objects with a "factory" entry of the form
+"module:name", and optional "params", "duration" and "name" entries.
+When "params" is a list, there is one job per parameter set.
+
+The runner uses concurrent.futures, which Python 2 provides with the
+futures backport only.
+
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import importlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait, FIRST_COMPLETED
+try:
+    from queue import Empty
+except ImportError:
+    from Queue import Empty
+
+from myhdl import _simulator
+from myhdl._compat import StringIO
+from myhdl._simulator import now
+from myhdl._Simulation import Simulation
+from myhdl._cache import _setCacheDir
+
+# time that a worker gets beyond the job timeout to stop by itself
+_grace = 2.0
+
+
+class _JobTimeout(Exception):
+    pass
+
+
+class Job(object):
+
+    """ A testbench run.
+
+    factory -- a block factory, or its "module:name" reference. The
+               factory is imported by name in the worker processes, so
+               it should be defined at module level.
+    params -- keyword arguments for the factory
+    duration -- simulation duration (default: until the simulation stops)
+    name -- name in the report (default: derived from factory and params)
+
+    """
+
+    def __init__(self, factory, params=None, duration=None, name=None):
+        if not isinstance(factory, str):
+            factory = "%s:%s" % (factory.__module__, factory.__name__)
+        self.factory = factory
+        self.params = dict(params or {})
+        self.duration = duration
+        if name is None:
+            args = ", ".join("%s=%r" % item
+                             for item in sorted(self.params.items()))
+            name = "%s(%s)" % (factory.rpartition(':')[2], args)
+        self.name = name
+
+    def __repr__(self):
+        return "Job(%r)" % self.name
+
+
+def _resolve(ref):
+    modname, _, attr = ref.partition(':')
+    obj = importlib.import_module(modname)
+    for part in attr.split('.'):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _alarm(signum, frame):
+    raise _JobTimeout("Job timed out")
+
+
+def _runJob(job, timeout, started=None, key=None):
+    """ Run a job in a worker process, and return its result.
+
+    When started is given, the worker puts key and the start time of
+    the job in that queue when the job starts.
+    """
+    if started is not None:
+        started.put((key, time.time()))
+    result = {'name': job.name,
+              'factory': job.factory,
+              'params': job.params,
+              'status': 'pass',
+              'time': None,
+              'wall': None,
+              'stdout': '',
+              'error': None}
+    stdout = sys.stdout
+    out = StringIO()
+    timed = timeout and hasattr(signal, 'setitimer')
+    sim = None
+    start = time.time()
+    sys.stdout = out
+    try:
+        if timed:
+            signal.signal(signal.SIGALRM, _alarm)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            top = _resolve(job.factory)(**job.params)
+            sim = Simulation(top)
+            sim.run(job.duration)
+        finally:
+            if timed:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except _JobTimeout:
+        result['status'] = 'timeout'
+        result['error'] = "Job timed out after %s s" % timeout
+    except AssertionError:
+        result['status'] = 'fail'
+        result['error'] = traceback.format_exc()
+    except Exception:
+        result['status'] = 'error'
+        result['error'] = traceback.format_exc()
+    finally:
+        sys.stdout = stdout
+        result['wall'] = time.time() - start
+        result['stdout'] = out.getvalue()
+    if sim is not None:
+        result['time'] = now()
+        if not sim._finished:
+            sim.quit()
+    # the worker is reused: drop the signals of this job
+    del _simulator._signals[:]
+    return result
+
+
+def _kill(executor):
+    """ Terminate the worker processes of a pool """
+    processes = getattr(executor, '_processes', None) or {}
+    for p in list(processes.values()):
+        p.terminate()
+    executor.shutdown(wait=False)
+
+
+def regress(jobs, workers=None, timeout=None, report=None):
+    """ Run jobs in a process pool, and return a report.
+
+    jobs -- sequence of Job objects, or (factory, params) tuples
+    workers -- number of worker processes (default: number of CPUs)
+    timeout -- per-job timeout in seconds (default: none)
+    report -- if given, path of a file to write the report to as JSON
+
+    The workers are reused across jobs. A job that exceeds the timeout
+    is interrupted in its worker. When a job runs past the timeout
+    because its worker does not stop by itself, the workers are
+    terminated, and the pool is restarted for the other jobs that did
+    not finish.
+
+    The report is a dict with the results of the jobs in order, under
+    "jobs", and the "passed" and "failed" counts and total "wall" time.
+    Each result has the job "name", "factory" and "params", a "status"
+    of 'pass', 'fail' (assertion error), 'error' or 'timeout', the
+    simulated "time", the "wall" time, the captured "stdout" and the
+    "error" traceback, if any.
+
+    """
+    jobs = [job if isinstance(job, Job) else Job(*job) for job in jobs]
+    results = [None] * len(jobs)
+    start = time.time()
+    manager = started = None
+    if timeout:
+        # the workers report the jobs that they start
+        manager = multiprocessing.Manager()
+        started = manager.Queue()
+    starts = {}
+    attempt = 0
+    todo = list(range(len(jobs)))
+    while todo:
+        attempt += 1
+        executor = ProcessPoolExecutor(workers)
+        futures = dict((executor.submit(_runJob, jobs[i], timeout, started,
+                                        (attempt, i)), i)
+                       for i in todo)
+        todo = []
+        pending = set(futures)
+        while pending:
+            limit = None
+            if timeout:
+                limit = _limit(pending, futures, starts, timeout)
+            done, pending = wait(pending, limit, FIRST_COMPLETED)
+            for f in done:
+                i = futures[f]
+                try:
+                    results[i] = f.result()
+                except Exception as e:
+                    results[i] = _failed(jobs[i], 'error', repr(e))
+            if not timeout:
+                continue
+            _drain(started, starts, attempt)
+            now_ = time.time()
+            hung = [f for f in pending if futures[f] in starts and
+                    now_ - starts[futures[f]] > timeout + _grace]
+            if hung:
+                # report the hung jobs, rerun the others
+                for f in pending:
+                    i = futures[f]
+                    if f in hung:
+                        results[i] = _failed(
+                            jobs[i], 'timeout',
+                            "Job killed after %s s" % timeout)
+                    else:
+                        todo.append(i)
+                _kill(executor)
+                starts.clear()
+                break
+        else:
+            executor.shutdown()
+        todo.sort()
+    if manager is not None:
+        manager.shutdown()
+    passed = sum(r['status'] == 'pass' for r in results)
+    rep = {'jobs': results,
+           'passed': passed,
+           'failed': len(results) - passed,
+           'wall': time.time() - start}
+    if report is not None:
+        with open(report, 'w') as f:
+            json.dump(rep, f, indent=2)
+    return rep
+
+
+def _drain(started, starts, attempt):
+    """ Record the start times of the jobs of the current attempt """
+    while 1:
+        try:
+            (n, i), t = started.get_nowait()
+        except Empty:
+            break
+        if n == attempt:
+            starts[i] = t
+
+
+def _limit(pending, futures, starts, timeout):
+    """ Return the time to wait until a pending job may be hung """
+    now_ = time.time()
+    limit = _grace
+    for f in pending:
+        t = starts.get(futures[f])
+        if t is not None:
+            limit = min(limit, t + timeout + _grace - now_)
+    return max(limit, 0)
+
+
+def _failed(job, status, error):
+    return {'name': job.name,
+            'factory': job.factory,
+            'params': job.params,
+            'status': status,
+            'time': None,
+            'wall': None,
+            'stdout': '',
+            'error': error}
+
+
+def _loadJobs(path):
+    with open(path) as f:
+        specs = json.load(f)
+    jobs = []
+    for spec in specs:
+        paramsets = spec.get('params', {})
+        if not isinstance(paramsets, list):
+            paramsets = [paramsets]
+        for params in paramsets:
+            name = spec.get('name')
+            if name is not None and len(paramsets) > 1:
+                name = "%s[%d]" % (name, len(jobs))
+            jobs.append(Job(spec['factory'], params,
+                            spec.get('duration'), name))
+    return jobs
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="python -m myhdl.regress",
+        description="Run MyHDL testbenches in a process pool")
+    parser.add_argument('jobfiles', nargs='+', metavar='jobs.json',
+                        help="JSON list of jobs")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="number of worker processes")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="per-job timeout in seconds")
+    parser.add_argument('-o', '--output', default=None,
+                        help="JSON report file")
+    parser.add_argument('--cache-dir', default=None,
+                        help="directory of the elaboration cache")
+    args = parser.parse_args(argv)
+    if args.cache_dir:
+        # for the workers, whether they are forked or spawned
+        os.environ['MYHDL_CACHE_DIR'] = args.cache_dir
+        _setCacheDir(args.cache_dir)
+    jobs = []
+    for path in args.jobfiles:
+        jobs.extend(_loadJobs(path))
+    rep = regress(jobs, args.workers, args.timeout, args.output)
+    for r in rep['jobs']:
+        print("%-8s %s" % (r['status'].upper(), r['name']))
+    print("%d passed, %d failed in %.2f s" %
+          (rep['passed'], rep['failed'], rep['wall']))
+    return 1 if rep['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
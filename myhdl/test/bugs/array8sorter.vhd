@@ -0,0 +1,533 @@
+-- File: array8sorter.vhd
+-- Generated by MyHDL 0.11
+-- Date: Sat Oct 17 00:01:00 2026
+
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+use std.textio.all;
+
+use work.pck_myhdl_011.all;
+
+entity array8sorter is
+    port (
+        a_0: in unsigned(3 downto 0);
+        a_1: in unsigned(3 downto 0);
+        a_2: in unsigned(3 downto 0);
+        a_3: in unsigned(3 downto 0);
+        a_4: in unsigned(3 downto 0);
+        a_5: in unsigned(3 downto 0);
+        a_6: in unsigned(3 downto 0);
+        a_7: in unsigned(3 downto 0);
+        z_0: out unsigned(3 downto 0);
+        z_1: out unsigned(3 downto 0);
+        z_2: out unsigned(3 downto 0);
+        z_3: out unsigned(3 downto 0);
+        z_4: out unsigned(3 downto 0);
+        z_5: out unsigned(3 downto 0);
+        z_6: out unsigned(3 downto 0);
+        z_7: out unsigned(3 downto 0)
+    );
+end entity array8sorter;
+-- Sort Array with 8 values 
+
+architecture MyHDL of array8sorter is
+
+
+
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare36_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare36_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare37_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare37_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare38_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare38_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare39_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_compare39_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_2: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_1: unsigned(3 downto 0);
+signal bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_2: unsigned(3 downto 0);
+
+begin
+
+
+
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z <= a_0;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z <= a_1;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_SORT17_BITONIC_MERGE41_COMPARE24_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z, bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z > bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z)) then
+        bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort18_feedthru32_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_sort19_feedthru33_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_SORT17_BITONIC_MERGE41_COMPARE24_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_compare24_z_2;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z <= a_2;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z <= a_3;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_SORT20_BITONIC_MERGE44_COMPARE25_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z, bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z > bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z)) then
+        bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort21_feedthru36_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_sort22_feedthru37_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_SORT20_BITONIC_MERGE44_COMPARE25_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_compare25_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_COMPARE26_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z, bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z > bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z)) then
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge42_feedthru34_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge45_feedthru38_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_COMPARE26_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_COMPARE27_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z, bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z > bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z)) then
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_sort17_bitonic_merge41_bitonic_merge43_feedthru35_out_z;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_sort20_bitonic_merge44_bitonic_merge46_feedthru39_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_COMPARE27_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_BITONIC_MERGE48_COMPARE28_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1, bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1 > bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1)) then
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_1;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_BITONIC_MERGE48_COMPARE28_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_compare28_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_BITONIC_MERGE51_COMPARE29_LOGIC: process (bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2, bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2 > bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2)) then
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2;
+    else
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare26_z_2;
+        bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_compare27_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT16_BITONIC_MERGE47_BITONIC_MERGE51_COMPARE29_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_compare29_z_2;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z <= a_4;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z <= a_5;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_SORT24_BITONIC_MERGE54_COMPARE30_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z, bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z > bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z)) then
+        bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort25_feedthru44_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_sort26_feedthru45_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_SORT24_BITONIC_MERGE54_COMPARE30_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_compare30_z_2;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z <= a_6;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z <= a_7;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_SORT27_BITONIC_MERGE57_COMPARE31_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z, bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z > bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z)) then
+        bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort28_feedthru48_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_sort29_feedthru49_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_SORT27_BITONIC_MERGE57_COMPARE31_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_compare31_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_COMPARE32_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z, bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z > bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z)) then
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge55_feedthru46_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge58_feedthru50_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_COMPARE32_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_COMPARE33_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z, bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z > bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z)) then
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_sort24_bitonic_merge54_bitonic_merge56_feedthru47_out_z;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_sort27_bitonic_merge57_bitonic_merge59_feedthru51_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_COMPARE33_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_BITONIC_MERGE61_COMPARE34_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1, bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1 > bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1)) then
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_1;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_BITONIC_MERGE61_COMPARE34_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_compare34_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_BITONIC_MERGE64_COMPARE35_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2, bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2) is
+begin
+    if ('0' = stdl(bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2 > bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2)) then
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2;
+    else
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare32_z_2;
+        bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_compare33_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_SORT23_BITONIC_MERGE60_BITONIC_MERGE64_COMPARE35_LOGIC;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_1;
+
+-- Combinatorial logic 
+
+bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_compare35_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE36_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z, bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z > bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z)) then
+        bitonic_sort15_bitonic_merge67_compare36_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z;
+        bitonic_sort15_bitonic_merge67_compare36_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z;
+    else
+        bitonic_sort15_bitonic_merge67_compare36_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge49_feedthru40_out_z;
+        bitonic_sort15_bitonic_merge67_compare36_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge62_feedthru52_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE36_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE37_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z, bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z > bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z)) then
+        bitonic_sort15_bitonic_merge67_compare37_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z;
+        bitonic_sort15_bitonic_merge67_compare37_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z;
+    else
+        bitonic_sort15_bitonic_merge67_compare37_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge48_bitonic_merge50_feedthru41_out_z;
+        bitonic_sort15_bitonic_merge67_compare37_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge61_bitonic_merge63_feedthru53_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE37_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE38_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z, bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z > bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z)) then
+        bitonic_sort15_bitonic_merge67_compare38_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z;
+        bitonic_sort15_bitonic_merge67_compare38_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z;
+    else
+        bitonic_sort15_bitonic_merge67_compare38_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge52_feedthru42_out_z;
+        bitonic_sort15_bitonic_merge67_compare38_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge65_feedthru54_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE38_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE39_LOGIC: process (bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z, bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z > bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z)) then
+        bitonic_sort15_bitonic_merge67_compare39_z_1 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z;
+        bitonic_sort15_bitonic_merge67_compare39_z_2 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z;
+    else
+        bitonic_sort15_bitonic_merge67_compare39_z_1 <= bitonic_sort15_bitonic_sort16_bitonic_merge47_bitonic_merge51_bitonic_merge53_feedthru43_out_z;
+        bitonic_sort15_bitonic_merge67_compare39_z_2 <= bitonic_sort15_bitonic_sort23_bitonic_merge60_bitonic_merge64_bitonic_merge66_feedthru55_out_z;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_COMPARE39_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_COMPARE40_LOGIC: process (bitonic_sort15_bitonic_merge67_compare38_z_1, bitonic_sort15_bitonic_merge67_compare36_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_compare36_z_1 > bitonic_sort15_bitonic_merge67_compare38_z_1)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1 <= bitonic_sort15_bitonic_merge67_compare38_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2 <= bitonic_sort15_bitonic_merge67_compare36_z_1;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1 <= bitonic_sort15_bitonic_merge67_compare36_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2 <= bitonic_sort15_bitonic_merge67_compare38_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_COMPARE40_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_COMPARE41_LOGIC: process (bitonic_sort15_bitonic_merge67_compare39_z_1, bitonic_sort15_bitonic_merge67_compare37_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_compare37_z_1 > bitonic_sort15_bitonic_merge67_compare39_z_1)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1 <= bitonic_sort15_bitonic_merge67_compare39_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2 <= bitonic_sort15_bitonic_merge67_compare37_z_1;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1 <= bitonic_sort15_bitonic_merge67_compare37_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2 <= bitonic_sort15_bitonic_merge67_compare39_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_COMPARE41_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_BITONIC_MERGE69_COMPARE42_LOGIC: process (bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1, bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1 > bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_BITONIC_MERGE69_COMPARE42_LOGIC;
+
+-- Combinatorial logic 
+
+z_0 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_1;
+
+-- Combinatorial logic 
+
+z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge69_compare42_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_BITONIC_MERGE72_COMPARE43_LOGIC: process (bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2, bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2 > bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare40_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_compare41_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE68_BITONIC_MERGE72_COMPARE43_LOGIC;
+
+-- Combinatorial logic 
+
+z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_1;
+
+-- Combinatorial logic 
+
+z_3 <= bitonic_sort15_bitonic_merge67_bitonic_merge68_bitonic_merge72_compare43_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_COMPARE44_LOGIC: process (bitonic_sort15_bitonic_merge67_compare38_z_2, bitonic_sort15_bitonic_merge67_compare36_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_compare36_z_2 > bitonic_sort15_bitonic_merge67_compare38_z_2)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1 <= bitonic_sort15_bitonic_merge67_compare38_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2 <= bitonic_sort15_bitonic_merge67_compare36_z_2;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1 <= bitonic_sort15_bitonic_merge67_compare36_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2 <= bitonic_sort15_bitonic_merge67_compare38_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_COMPARE44_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_COMPARE45_LOGIC: process (bitonic_sort15_bitonic_merge67_compare39_z_2, bitonic_sort15_bitonic_merge67_compare37_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_compare37_z_2 > bitonic_sort15_bitonic_merge67_compare39_z_2)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1 <= bitonic_sort15_bitonic_merge67_compare39_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2 <= bitonic_sort15_bitonic_merge67_compare37_z_2;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1 <= bitonic_sort15_bitonic_merge67_compare37_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2 <= bitonic_sort15_bitonic_merge67_compare39_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_COMPARE45_LOGIC;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_BITONIC_MERGE76_COMPARE46_LOGIC: process (bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1, bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1 > bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_1;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_1;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_BITONIC_MERGE76_COMPARE46_LOGIC;
+
+-- Combinatorial logic 
+
+z_4 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_1;
+
+-- Combinatorial logic 
+
+z_5 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge76_compare46_z_2;
+
+-- Combinatorial logic 
+ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_BITONIC_MERGE79_COMPARE47_LOGIC: process (bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2, bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2) is
+begin
+    if ('1' = stdl(bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2 > bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2)) then
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2;
+    else
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_1 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare44_z_2;
+        bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_2 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_compare45_z_2;
+    end if;
+end process ARRAY8SORTER_BITONIC_SORT15_BITONIC_MERGE67_BITONIC_MERGE75_BITONIC_MERGE79_COMPARE47_LOGIC;
+
+-- Combinatorial logic 
+
+z_6 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_1;
+
+-- Combinatorial logic 
+
+z_7 <= bitonic_sort15_bitonic_merge67_bitonic_merge75_bitonic_merge79_compare47_z_2;
+
+end architecture MyHDL;
@@ -0,0 +1,252 @@
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from myhdl import *
+from myhdl import ClockError, ToVHDLError
+from myhdl._clock import _error
+from helpers import raises_kind
+
+
+def edges(clock, period, duty=0.5, phase=0, init=False, ncycles=10):
+    """ Return the (time, value) pairs seen at each event on the clock """
+
+    clk = Signal(bool(init))
+    seen = []
+
+    @instance
+    def monitor():
+        while 1:
+            yield clk
+            seen.append((now(), bool(clk)))
+
+    if clock:
+        clkgen = Clock(clk, period, duty=duty, phase=phase)
+    else:
+        first = int(round(period * (1 - duty)))
+
+        @instance
+        def clkgen():
+            yield delay(phase)
+            while 1:
+                yield delay(first)
+                clk.next = not clk
+                yield delay(period - first)
+                clk.next = not clk
+
+    sim = Simulation(monitor, clkgen)
+    sim.run(phase + ncycles * period, quiet=1)
+    sim.quit()
+    return seen
+
+
+@pytest.mark.parametrize('period, duty, phase, init', [
+    (10, 0.5, 0, False),
+    (10, 0.5, 0, True),
+    (7, 0.5, 3, False),
+    (20, 0.25, 5, False),
+    (2, 0.5, 1, True),
+])
+def test_waveform(period, duty, phase, init):
+    expected = edges(False, period, duty, phase, init)
+    assert len(expected) > 10
+    assert edges(True, period, duty, phase, init) == expected
+
+
+def test_args():
+    clk = Signal(bool(0))
+    with raises_kind(ClockError, _error.SigType):
+        Clock(Signal(intbv(0)[2:]), 10)
+    with raises_kind(ClockError, _error.Period):
+        Clock(clk, 1)
+    with raises_kind(ClockError, _error.Duty):
+        Clock(clk, 10, duty=1.0)
+    with raises_kind(ClockError, _error.Phase):
+        Clock(clk, 10, phase=-1)
+
+
+@block
+def counter(count, clk):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + 1
+
+    return logic
+
+
+@block
+def tb_counter(count):
+
+    clk = Signal(bool(0))
+    clkgen = Clock(clk, 10)
+    dut = counter(count, clk)
+
+    return dut, clkgen
+
+
+def test_block():
+    count = Signal(intbv(0)[16:])
+    tb = tb_counter(count)
+    tb.run_sim(1000, quiet=1)
+    assert count == 100
+    tb.quit_sim()
+
+
+@block
+def tb_convert():
+
+    clk = Signal(bool(0))
+    count = Signal(intbv(0)[8:])
+    clkgen = Clock(clk, 10, phase=5)
+    dut = counter(count, clk)
+
+    @instance
+    def check():
+        yield clk.posedge
+        yield delay(100)
+        print(count)
+        raise StopSimulation()
+
+    return clkgen, dut, check
+
+
+@pytest.mark.parametrize('hdl, timescale, expected', [
+    ('Verilog', '1ns/10ps',
+     ["#5;", "forever begin", "#5 clk <= 1'b1;", "#5 clk <= 1'b0;"]),
+    ('Verilog', '10ps/1ps', ["`timescale 10ps/1ps", "#5 clk <= 1'b1;"]),
+    ('VHDL', '1ns/10ps', ["wait for 5 * 1 ns;", "clk <= '1';", "clk <= '0';"]),
+    ('VHDL', '10ps/1ps', ["wait for 5 * 10 ps;", "wait for 100 * 10 ps;"]),
+])
+def test_convert(tmpdir, hdl, timescale, expected):
+    tb = tb_convert()
+    tb.convert(hdl=hdl, path=str(tmpdir), name='tb_clock',
+               timescale=timescale)
+    ext = '.v' if hdl == 'Verilog' else '.vhd'
+    with open(os.path.join(str(tmpdir), 'tb_clock' + ext)) as f:
+        code = f.read()
+    for line in expected:
+        assert line in code
+
+
+def test_convert_timescale(tmpdir):
+    tb = tb_convert()
+    with pytest.raises(ToVHDLError):
+        tb.convert(hdl='VHDL', path=str(tmpdir), name='tb_clock',
+                   timescale='2ns/1ps')
+
+
+def bursts(lazy, period, duty, phase, init):
+    """ Return the edges that a bursty process sees, and the timesteps """
+
+    clk = Signal(bool(init))
+    seen = []
+
+    @instance
+    def monitor():
+        for gap in (3, 100, 1, 250):
+            yield delay(gap)
+            for i in range(3):
+                yield clk.posedge
+                seen.append((now(), bool(clk)))
+            yield clk.negedge
+            seen.append((now(), bool(clk)))
+            yield clk
+            seen.append((now(), bool(clk)))
+
+    clkgen = Clock(clk, period, duty=duty, phase=phase, lazy=lazy)
+    sim = Simulation(monitor, clkgen)
+    sim.run(1000, quiet=1)
+    timesteps = sim.timesteps
+    sim.quit()
+    return seen, timesteps
+
+
+@pytest.mark.parametrize('period, duty, phase, init', [
+    (10, 0.5, 0, False),
+    (10, 0.5, 0, True),
+    (7, 0.5, 3, False),
+    (20, 0.25, 5, False),
+    (2, 0.5, 1, True),
+])
+def test_lazy(period, duty, phase, init):
+    expected, timesteps = bursts(False, period, duty, phase, init)
+    assert len(expected) == 20
+    seen, lazySteps = bursts(True, period, duty, phase, init)
+    assert seen == expected
+    assert lazySteps < timesteps
+
+
+def test_lazy_always():
+    count = Signal(intbv(0)[16:])
+    clk = Signal(bool(0))
+    # an always block waits on the clock all the time
+    sim = Simulation(counter(count, clk), Clock(clk, 10, lazy=True))
+    sim.run(1000, quiet=1)
+    assert count == 100
+    sim.quit()
+
+
+def test_lazy_idle():
+    clk = Signal(bool(0))
+    sim = Simulation(Clock(clk, 10, lazy=True))
+    # nothing waits on the clock: no more events after the first edge
+    assert sim.run(quiet=1) == 0
+    assert now() == 5
+
+
+def samples(lazy, period, phase):
+    """ Return the levels that a process woken by delays reads """
+    clk = Signal(bool(0))
+    seen = []
+
+    @instance
+    def sampler():
+        for t in (4, 7, 100, 300, 411, 412, 508, 999):
+            yield delay(t - now())
+            seen.append((now(), bool(clk)))
+
+    sim = Simulation(sampler, Clock(clk, period, phase=phase, lazy=lazy))
+    sim.run(1000, quiet=1)
+    steps = sim.timesteps
+    sim.quit()
+    return seen, steps
+
+
+def test_lazy_level():
+    expected, steps = samples(False, 10, 3)
+    assert (411, True) in expected
+    seen, lazySteps = samples(True, 10, 3)
+    assert seen == expected
+    assert lazySteps < steps
+
+
+@block
+def traced_bursts(clk, lazy):
+
+    @instance
+    def monitor():
+        yield delay(100)
+        for i in range(3):
+            yield clk.posedge
+
+    return monitor, Clock(clk, 10, phase=3, lazy=lazy)
+
+
+def test_lazy_trace(tmpdir):
+    dumps = []
+    with tmpdir.as_cwd():
+        for lazy in (False, True):
+            clk = Signal(bool(0))
+            top = traced_bursts(clk, lazy)
+            top.config_sim(trace=True)
+            sim = Simulation(top)
+            sim.run(300, quiet=1)
+            sim.quit()
+            with open('traced_bursts.vcd') as f:
+                dumps.append([l for l in f if 'date' not in l.lower() and
+                              not l.startswith(' ')])
+    # a traced clock is not suspended
+    assert dumps[1] == dumps[0]
@@ -200,6 +200,36 @@ def bench_ConcatConcatedSignal():
 def test_ConcatConcatedSignal():
     Simulation(bench_ConcatConcatedSignal()).run()
 
+def bench_ShadowDelta():
+
+    s = Signal(intbv(0)[8:])
+    hi, bit = s(8, 4), s(0)
+    c = ConcatSignal(hi, s(4, 0), hi)
+    seen = []
+
+    @instance
+    def stimulus():
+        for i in (0x12, 0x35, 0x35, 0xf7):
+            s.next = i
+            yield delay(10)
+
+    @always(s, hi, bit, c)
+    def monitor():
+        # the shadow signals change in the delta cycle of their source
+        assert hi == s[8:4]
+        assert bit == s[0]
+        assert c == s[8:4] << 8 | s[4:0] << 4 | s[8:4]
+        seen.append(int(c))
+
+    return stimulus, monitor, seen
+
+
+def test_ShadowDelta():
+    stimulus, monitor, seen = bench_ShadowDelta()
+    Simulation(stimulus, monitor).run()
+    assert seen == [0x121, 0x353, 0xf7f]
+
+
 def bench_TristateSignal():
     s = TristateSignal(intbv(0)[8:])
     a = s.driver()
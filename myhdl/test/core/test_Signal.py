@@ -28,7 +28,8 @@ from random import randrange
 
 import pytest
 
-from myhdl import Signal, intbv
+from myhdl import Signal, Simulation, intbv, delay, now
+from myhdl._fixbv import fixbv
 from myhdl._compat import long
 from myhdl._simulator import _siglist
 
@@ -208,7 +209,7 @@ class TestSig:
         assert s1._negedgeWaiters == self.negedgeWaiters
 
     def testNextAccess(self):
-        """ each next attribute access puts a sig in a global siglist """
+        """ next attribute access puts a sig once in a global siglist """
         del _siglist[:]
         s = [None] * 4
         for i in range(len(s)):
@@ -220,7 +221,55 @@ class TestSig:
         s[3].next = 1
         s[3].next = 3
         for i in range(len(s)):
-            assert _siglist.count(s[i]) == i
+            assert _siglist.count(s[i]) == min(i, 1)
+
+    def testNextAccessAfterUpdate(self):
+        """ after an update, next attribute access puts a sig back """
+        del _siglist[:]
+        s = Signal(intbv(0)[8:])
+        for i in range(len(s)):
+            s.next[i] = 1
+        assert _siglist.count(s) == 1
+        s._update()
+        del _siglist[:]
+        s.next = 0
+        assert _siglist.count(s) == 1
+
+    def testUpdateFixbv(self):
+        """ update of a fixbv signal should keep its bounds """
+        s = Signal(fixbv(0, shift=-4, min=-2**7, max=2**7))
+        s.next = fixbv(24, shift=-4)
+        s._update()
+        assert s.val._val == 24
+        s.next = fixbv(2, shift=-2)
+        s._update()
+        assert s.val._val == 8
+        assert (s.val._min, s.val._max) == (-2**7, 2**7)
+        assert s.val is not s.next
+        with pytest.raises(ValueError):
+            s.next = fixbv(2**7, shift=-4)
+
+    def testDelayedUpdate(self):
+        """ delayed signal should apply the next values after the delay """
+        s = Signal(intbv(0)[8:], delay=3)
+        changes = []
+
+        def stimulus():
+            s.next = 5
+            yield delay(10)
+            s.next[0] = 0
+            yield delay(1)
+            # a change within the delay cancels the earlier one, also
+            # when the next value is modified in place
+            s.next[1] = 1
+
+        def monitor():
+            while 1:
+                yield s
+                changes.append((now(), int(s.val)))
+
+        Simulation(stimulus(), monitor()).run(20, quiet=1)
+        assert changes == [(3, 5), (14, 6)]
 
 
 class TestSignalAsNum:
@@ -24,9 +24,13 @@ import random
 from random import randrange
 from unittest import TestCase
 
-from myhdl import (Signal, Simulation, SimulationError, StopSimulation, delay,
-                   intbv, join, now)
+import pytest
+
+from myhdl import (BlockError, Clock, Signal, Simulation, SimulationError,
+                   StopSimulation, always, block, delay, intbv, join, modbv,
+                   now)
 from myhdl._Simulation import _error
+from myhdl._simulator import _EventQueue, _WheelQueue
 from helpers import raises_kind
 
 random.seed(1)  # random, but deterministic
@@ -53,6 +57,29 @@ class SimArgs(TestCase):
         with raises_kind(SimulationError, _error.DuplicatedArg):
             Simulation(i, i)
 
+    def testRunSim(self):
+        @block
+        def bench(count):
+            clk = Signal(bool(0))
+
+            @always(clk.posedge)
+            def logic():
+                count.next = count + 1
+
+            return logic, Clock(clk, 10)
+
+        count = Signal(modbv(0)[16:])
+        top = bench(count)
+        top.run_sim(50, quiet=QUIET, scheduler='wheel')
+        # later calls continue the simulation, with the same arguments only
+        top.run_sim(50, quiet=QUIET)
+        top.run_sim(50, quiet=QUIET, scheduler='wheel')
+        with pytest.raises(BlockError) as e:
+            top.run_sim(50, quiet=QUIET, scheduler='heap')
+        assert 'scheduler' in str(e.value)
+        assert count == 15
+        top.quit_sim()
+
 
 class YieldNone(TestCase):
     """ Basic test of yield None behavior """
@@ -710,6 +737,8 @@ class Waveform(TestCase):
     def setUp(self):
         self.sig = initSignal(self.waveform)
 
+    scheduler = 'heap'
+
     def runSim(self, sim):
         sim.run(quiet=QUIET)
 
@@ -719,7 +748,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isPosedge)
         response = self.response(clause=s.posedge, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testNegedge(self):
@@ -728,7 +758,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isNegedge)
         response = self.response(clause=s.negedge, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testEdge(self):
@@ -738,7 +769,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEdge)
         response = self.response(clause=(s.negedge, s.posedge),
                                  expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testEvent(self):
@@ -748,7 +780,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEvent)
         # print expected
         response = self.response(clause=s, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantEvents(self):
@@ -757,7 +790,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isEvent)
         response = self.response(clause=(s,) * 6, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantEventAndEdges(self):
@@ -767,7 +801,8 @@ class Waveform(TestCase):
         expected = getExpectedTimes(self.waveform, isEvent)
         response = self.response(clause=(s, s.negedge, s.posedge),
                                  expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantPosedges(self):
@@ -776,7 +811,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isPosedge)
         response = self.response(clause=(s.posedge,) * 3, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
     def testRedundantNegedges(self):
@@ -785,7 +821,8 @@ class Waveform(TestCase):
         stimulus = self.stimulus()
         expected = getExpectedTimes(self.waveform, isNegedge)
         response = self.response(clause=(s.negedge,) * 9, expected=expected)
-        self.runSim(Simulation(stimulus, response))
+        self.runSim(Simulation(stimulus, response,
+                               scheduler=self.scheduler))
         assert self.duration <= now()
 
 
@@ -834,6 +871,20 @@ class WaveformInertialDelayStress(Waveform):
         duration += interval
 
 
+class WaveformWheel(Waveform):
+
+    """ Repeat waveform tests with the timing wheel scheduler """
+
+    scheduler = 'wheel'
+
+
+class WaveformSigDelayWheel(WaveformSigDelay):
+
+    """ Repeat delayed signal waveform tests with the timing wheel """
+
+    scheduler = 'wheel'
+
+
 class SimulationRunMethod(Waveform):
 
     """ Basic test of run method of Simulation object """
@@ -878,3 +929,64 @@ class TimeZeroEvents(TestCase):
         s = Signal(1)
         testBench = self.bench(sig=s, next=0, clause=s.negedge)
         Simulation(testBench).run(quiet=QUIET)
+
+
+class EventQueue(TestCase):
+
+    """ Check the future event queue """
+
+    queue = _EventQueue
+
+    def testOrder(self):
+        """ Events are returned in time order, FIFO within a time """
+        q = self.queue()
+        times = [randrange(100) for i in range(1000)]
+        for i, t in enumerate(times):
+            q.schedule(t, i)
+        assert len(q) == len(times)
+        expected = sorted(range(len(times)), key=lambda i: times[i])
+        result = []
+        while q:
+            t, events = q.pop()
+            for e in events:
+                assert times[e] == t
+            result.extend(events)
+        assert result == expected
+        assert len(q) == 0
+
+    def testInterleaved(self):
+        """ Events scheduled while draining are returned in order """
+        q = self.queue()
+        now = 0
+        q.schedule(0, 0)
+        popped = []
+        for i in range(1, 2000):
+            t, events = q.pop()
+            assert t >= now
+            now = t
+            popped.extend(events)
+            q.schedule(now + randrange(0, 3000), i)
+            q.schedule(now + randrange(0, 5), -i)
+        assert len(popped) + len(q) == 2 * 2000 - 1
+
+    def testSchedulerArg(self):
+        with raises_kind(SimulationError, _error.SchedulerType):
+            Simulation(scheduler='calendar')
+
+    def testSameTimeOrder(self):
+        """ Processes waiting on the same time resume in order """
+        order = []
+
+        def proc(i):
+            yield delay(10)
+            order.append(i)
+        Simulation([proc(i) for i in range(10)]).run(quiet=QUIET)
+        assert sorted(order) == list(range(10))
+        assert now() == 10
+
+
+class WheelQueue(EventQueue):
+
+    """ Check the timing wheel event queue, with a small window """
+
+    queue = lambda self: _WheelQueue(16)
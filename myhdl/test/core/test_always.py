@@ -23,10 +23,11 @@ from __future__ import absolute_import
 from random import randrange
 
 from myhdl import (AlwaysError, Signal, Simulation, StopSimulation, delay,
-                   instances, intbv, now)
+                   intbv)
 from myhdl._always import _error, always
 from myhdl._Waiter import (_DelayWaiter, _EdgeTupleWaiter, _EdgeWaiter,
-                           _SignalTupleWaiter, _SignalWaiter, _Waiter)
+                           _SignalTupleWaiter, _SignalWaiter, _Waiter,
+                           _FuncStarter, _FuncWaiter, _FuncTupleWaiter)
 from helpers import raises_kind
 
 # random.seed(3) # random, but deterministic
@@ -179,3 +180,42 @@ class TestInferWaiter:
     def testGeneral(self):
         sim = Simulation(self.bench(GeneralFunc, _Waiter))
         sim.run()
+
+
+class TestProcess:
+
+    def testProcessType(self):
+        a, b, c, d, r = [Signal(intbv(0)) for i in range(5)]
+        p = SignalFunc1(a, b, c, d, r)._process()
+        assert type(p) is _FuncStarter
+        assert type(p.waiter) is _FuncWaiter
+        p = EdgeTupleFunc1(a, b, c, d, r)._process()
+        assert type(p.waiter) is _FuncTupleWaiter
+        p = GeneralFunc(a, b, c, d, r)._process()
+        assert type(p.waiter) is _FuncTupleWaiter
+        # delays wait in the generator
+        p = DelayFunc(a, b, c, d, r)._process()
+        assert type(p) is _DelayWaiter
+
+    def testSimultaneousTriggers(self):
+        a, b = [Signal(bool(0)) for i in range(2)]
+        count = Signal(intbv(0)[8:])
+
+        @always(a.posedge, b.posedge, a)
+        def logic():
+            count.next = count + 1
+
+        def stimulus():
+            for i in range(10):
+                yield delay(10)
+                a.next = not a
+                b.next = not b
+            raise StopSimulation
+
+        def check():
+            yield delay(105)
+            # one activation per change of a
+            assert count == 10
+
+        sim = Simulation(logic, stimulus(), check())
+        sim.run(quiet=QUIET)
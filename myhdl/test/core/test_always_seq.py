@@ -47,3 +47,39 @@ def test_reset():
             pass
     except:
         assert False
+
+
+def test_async_reset():
+    """ check the reset and clock branches """
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=1, isasync=True)
+    count = Signal(intbv(0)[8:])
+
+    @always_seq(clock.posedge, reset=reset)
+    def logic():
+        count.next = count + 1
+
+    @instance
+    def stimulus():
+        for i in range(5):
+            yield delay(10)
+            clock.next = 1
+            yield delay(10)
+            clock.next = 0
+        assert count == 5
+        # reset without a clock edge
+        reset.next = 1
+        yield delay(10)
+        assert count == 0
+        clock.next = 1
+        yield delay(10)
+        assert count == 0
+        reset.next = 0
+        clock.next = 0
+        yield delay(10)
+        clock.next = 1
+        yield delay(10)
+        assert count == 1
+        raise StopSimulation
+
+    Simulation(logic, stimulus).run(quiet=1)
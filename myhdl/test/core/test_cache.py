@@ -0,0 +1,173 @@
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+import myhdl
+from myhdl import *
+from myhdl.debug import cache_stats
+from myhdl._cache import _clearCaches, _setCacheDir
+from myhdl._Waiter import _SignalWaiter, _Waiter
+
+
+@pytest.fixture(autouse=True)
+def no_disk_cache():
+    # the counts below are those of the in-memory caches
+    _setCacheDir(None)
+    yield
+    _setCacheDir(os.environ.get('MYHDL_CACHE_DIR'))
+
+
+class Bus(object):
+
+    def __init__(self):
+        self.data = Signal(intbv(0)[8:])
+        self.valid = Signal(bool(0))
+
+
+@block
+def reg(dout, din, clk):
+
+    @always(clk.posedge)
+    def logic():
+        dout.next = din
+
+    return logic
+
+
+@block
+def busreg(dout, bus, clk):
+
+    @always(clk.posedge)
+    def logic():
+        if bus.valid:
+            dout.next = bus.data
+
+    return logic
+
+
+@block
+def comb(dout, a, b):
+
+    @always_comb
+    def logic():
+        dout.next = a + b
+
+    return logic
+
+
+def test_shared_analysis():
+    _clearCaches()
+    clk = Signal(bool(0))
+    sigs = [Signal(intbv(0)[8:]) for i in range(11)]
+    insts = [reg(sigs[i + 1], sigs[i], clk) for i in range(10)]
+    stats = cache_stats()
+    assert stats['analysis'][:2] == (9, 1)
+    assert stats['source'][1] == 1
+    for i, inst in enumerate(insts):
+        logic = inst.subs[0]
+        assert logic.inputs == set(['din'])
+        assert logic.outputs == set(['dout'])
+        assert logic.sigdict['din'] is sigs[i]
+        assert logic.sigdict['dout'] is sigs[i + 1]
+
+
+def test_binding_kinds():
+    _clearCaches()
+    a = Signal(intbv(0)[8:])
+    b = Signal(intbv(0)[8:])
+    s1 = Signal(intbv(0)[9:])
+    s2 = Signal(intbv(0)[9:])
+    i1 = comb(s1, a, b).subs[0]
+    # b is a constant here: same code, other analysis
+    i2 = comb(s2, a, 3).subs[0]
+    assert i1.senslist == (a, b) or i1.senslist == (b, a)
+    assert i2.senslist == (a,)
+    assert cache_stats()['analysis'][:2] == (0, 2)
+
+
+def test_attribute_refs():
+    _clearCaches()
+    clk = Signal(bool(0))
+    buses = [Bus() for i in range(3)]
+    outs = [Signal(intbv(0)[8:]) for i in range(3)]
+    insts = [busreg(outs[i], buses[i], clk).subs[0] for i in range(3)]
+    assert cache_stats()['analysis'][:2] == (2, 1)
+    for bus, out, inst in zip(buses, outs, insts):
+        assert inst.sigdict['bus_data'] is bus.data
+        assert inst.sigdict['bus_valid'] is bus.valid
+        assert inst.symdict['bus_data'] is bus.data
+        assert inst.inputs == set(['bus_data', 'bus_valid'])
+        assert inst.outputs == set(['dout'])
+        assert sorted(inst.objlist) == ['bus_data', 'bus_valid']
+
+
+def test_infer_waiter():
+    _clearCaches()
+    a = Signal(bool(0))
+
+    def gen(s):
+        while 1:
+            yield s
+    waiters = [myhdl._Waiter._inferWaiter(gen(a)) for i in range(5)]
+    assert all(isinstance(w, _SignalWaiter) for w in waiters)
+    # s bound to another kind of object
+    w = myhdl._Waiter._inferWaiter(gen(1))
+    assert type(w) is _Waiter
+    assert cache_stats()['waiter'][:2] == (4, 2)
+
+
+_design = """
+from myhdl import block, always
+
+@block
+def reg(dout, din, clk):
+
+    @always(clk.posedge)
+    def logic():
+        dout.next = %s
+
+    return logic
+"""
+
+
+def test_disk_cache(tmpdir):
+    path = str(tmpdir.join('design.py'))
+    cachedir = str(tmpdir.join('cache'))
+
+    def elaborate(expr):
+        # a new run of a design in a source file
+        src = _design % expr
+        with open(path, 'w') as f:
+            f.write(src)
+        ns = {}
+        exec(compile(src, path, 'exec'), ns)
+        _clearCaches()
+        clk, din, dout = [Signal(bool(0)) for i in range(3)]
+        return ns['reg'](dout, din, clk).subs[0]
+
+    _setCacheDir(cachedir)
+    inst = elaborate('din')
+    assert cache_stats()['analysis'][1:] == (1, 1, 0)
+    assert os.listdir(cachedir)
+    inst = elaborate('din')
+    stats = cache_stats()
+    assert stats['analysis'] == (1, 0, 1, 1)
+    # the source is not read again
+    assert stats['source'][:2] == (0, 0)
+    assert inst.inputs == set(['din'])
+    # a change of the source invalidates the entry
+    inst = elaborate('din and clk')
+    assert cache_stats()['analysis'][3] == 0
+    assert inst.inputs == set(['din', 'clk'])
+    # a corrupt entry is ignored
+    for root, dirs, files in os.walk(cachedir):
+        for name in files:
+            with open(os.path.join(root, name), 'wb') as f:
+                f.write(b'garbage')
+    inst = elaborate('din and clk')
+    assert cache_stats()['analysis'][3] == 0
+    assert inst.inputs == set(['din', 'clk'])
+    inst = elaborate('din and clk')
+    assert cache_stats()['analysis'][3] == 1
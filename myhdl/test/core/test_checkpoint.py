@@ -0,0 +1,143 @@
+from __future__ import absolute_import
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError
+from myhdl._checkpoint import _error
+from helpers import raises_kind
+
+t_state = enum('IDLE', 'RUN', 'DONE')
+
+
+@block
+def design(count, acc, state, strobe, total, clk, reset):
+
+    word = modbv(0)[12:]
+
+    @always_seq(clk.posedge, reset=reset)
+    def fsm():
+        if state == t_state.IDLE:
+            state.next = t_state.RUN
+        elif state == t_state.RUN:
+            count.next = count + 1
+            word[:] = word + count
+            acc.next = word
+            if count == 200:
+                state.next = t_state.DONE
+        else:
+            state.next = t_state.IDLE
+
+    @always(delay(7))
+    def pulse():
+        strobe.next = not strobe
+
+    @always_comb
+    def adder():
+        total.next = acc + count
+
+    return fsm, pulse, adder
+
+
+def signals():
+    return dict(count=Signal(modbv(0)[8:]),
+                acc=Signal(intbv(0)[12:]),
+                state=Signal(t_state.IDLE),
+                strobe=Signal(bool(0)),
+                total=Signal(intbv(0)[13:]),
+                clk=Signal(bool(0)),
+                reset=ResetSignal(0, active=1, isasync=False))
+
+
+def build(engine='event'):
+    sigs = signals()
+    dut = design(**sigs)
+    clkgen = Clock(sigs['clk'], 10)
+    if engine == 'cycle':
+        # the delay-triggered block needs the event-driven engine
+        dut = dut.subs[0], dut.subs[2]
+    return Simulation(dut, clkgen, engine=engine), sigs
+
+
+def sample(sim, sigs, duration, steps=30):
+    seen = []
+    for i in range(steps):
+        sim.run(duration, quiet=1)
+        seen.append((now(), int(sigs['count']), int(sigs['acc']),
+                     str(sigs['state']), bool(sigs['strobe']),
+                     int(sigs['total'])))
+    return seen
+
+
+@pytest.mark.parametrize('engine', ['event', 'cycle'])
+def test_restore(tmpdir, engine):
+    path = str(tmpdir.join('warm.json'))
+    sim, sigs = build(engine)
+    sim.run(1003, quiet=1)
+    sim.checkpoint(path)
+    expected = sample(sim, sigs, 13)
+
+    # rewind the same simulation
+    sim.restore(path)
+    assert now() == 1003
+    assert sample(sim, sigs, 13) == expected
+    sim.quit()
+
+    # warm start a new simulation of the same design
+    sim, sigs = build(engine)
+    sim.restore(path)
+    assert sample(sim, sigs, 13) == expected
+    sim.quit()
+
+
+def test_pending_assignment(tmpdir):
+    path = str(tmpdir.join('warm.json'))
+    sim, sigs = build()
+    sim.run(100, quiet=1)
+    sigs['reset'].next = 1
+    sim.checkpoint(path)
+    expected = sample(sim, sigs, 10, 5)
+    sim.quit()
+
+    sim, sigs = build()
+    sim.restore(path)
+    assert sample(sim, sigs, 10, 5) == expected
+    assert expected[-1][1] == 0
+    sim.quit()
+
+
+def test_instance(tmpdir):
+    clk = Signal(bool(0))
+
+    @instance
+    def clkgen():
+        while 1:
+            yield delay(10)
+            clk.next = not clk
+
+    sim = Simulation(clkgen)
+    sim.run(100, quiet=1)
+    with raises_kind(SimulationError, _error.Instance):
+        sim.checkpoint(str(tmpdir.join('warm.json')))
+    sim.quit()
+
+
+def test_not_started(tmpdir):
+    sim, sigs = build()
+    with raises_kind(SimulationError, _error.NotStarted):
+        sim.checkpoint(str(tmpdir.join('warm.json')))
+    sim.quit()
+
+
+def test_mismatch(tmpdir):
+    path = str(tmpdir.join('warm.json'))
+    sim, sigs = build()
+    sim.run(100, quiet=1)
+    sim.checkpoint(path)
+    sim.quit()
+
+    clk = Signal(bool(0))
+    sim = Simulation(Clock(clk, 10))
+    with raises_kind(SimulationError, _error.Mismatch):
+        sim.restore(path)
+    sim.quit()
@@ -0,0 +1,220 @@
+from __future__ import absolute_import
+
+import warnings
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError, SimulationWarning
+from myhdl._Simulation import _error
+from helpers import raises_kind
+
+W = 8
+
+
+@block
+def decoder(y, x):
+    # declared before the block that drives its input, to check the ranking
+
+    @always_comb
+    def high():
+        y.next = x[W:W // 2]
+
+    return high
+
+
+@block
+def datapath(count, total, flag, y, enable, clk, reset):
+
+    x = Signal(intbv(0)[W:])
+    lfsr = Signal(intbv(1)[16:])
+
+    dec = decoder(y, x)
+
+    @always_comb
+    def mix():
+        x.next = lfsr[W:] ^ count
+
+    @always_seq(clk.posedge, reset=reset)
+    def counter():
+        if enable:
+            count.next = count + 1
+
+    @always_seq(clk.posedge, reset=reset)
+    def shift():
+        lfsr.next = concat(lfsr[15:], lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10])
+
+    @always(clk.negedge)
+    def accumulate():
+        total.next = total + y
+
+    @always_comb
+    def compare():
+        flag.next = y > count[4:]
+
+    return dec, mix, counter, shift, accumulate, compare
+
+
+def sample(engine, isasync=False, ncycles=50):
+    """ Return the signal values at each clock edge, and the engine used """
+    count = Signal(modbv(0)[W:])
+    total = Signal(modbv(0)[2 * W:])
+    flag = Signal(bool(0))
+    y = Signal(intbv(0)[W // 2:])
+    enable = Signal(bool(0))
+    clk = Signal(bool(0))
+    reset = ResetSignal(1, active=1, isasync=isasync)
+
+    dut = datapath(count, total, flag, y, enable, clk, reset)
+    clkgen = Clock(clk, 10)
+
+    sim = Simulation(dut, clkgen, engine=engine)
+    seen = []
+    for i in range(ncycles):
+        if i == 3:
+            reset.next = 0
+        if i == 7:
+            enable.next = 1
+        if i == 30:
+            reset.next = 1
+        if i == 31:
+            reset.next = 0
+        sim.run(5, quiet=1)
+        seen.append((now(), int(clk), int(count), int(total), int(flag),
+                     int(y)))
+    engine = sim.engine
+    sim.quit()
+    return seen, engine
+
+
+@pytest.mark.parametrize('isasync', [False, True])
+def test_identical(isasync):
+    expected, engine = sample('event', isasync)
+    assert engine == 'event'
+    result, engine = sample('cycle', isasync)
+    assert engine == 'cycle'
+    assert result == expected
+    assert len(set(r[2] for r in result)) > 10
+
+
+@block
+def counter_tb(count, clk, stop_at):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + 1
+        if count == stop_at:
+            raise StopSimulation()
+
+    return logic
+
+
+def test_stop():
+    count = Signal(intbv(0, min=0, max=100))
+    clk = Signal(bool(0))
+    sim = Simulation(counter_tb(count, clk, 10), Clock(clk, 10),
+                     engine='cycle')
+    assert sim.engine == 'cycle'
+    assert sim.run(1000, quiet=1) == 0
+    assert now() == 105
+    with pytest.raises(StopSimulation):
+        sim.run()
+
+
+def test_no_clock():
+    a = Signal(intbv(3)[4:])
+    b = Signal(intbv(0)[4:])
+    seen = []
+
+    @always_comb
+    def logic():
+        b.next = a + 1
+        seen.append(int(a))
+
+    sim = Simulation(logic, engine='cycle')
+    assert sim.run(quiet=1) == 0
+    assert seen == [3]
+
+
+def fallback(*args):
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        sim = Simulation(*args, engine='cycle')
+    sim.quit()
+    assert sim.engine == 'event'
+    assert len(w) == 1
+    assert w[0].category is SimulationWarning
+    return str(w[0].message)
+
+
+def test_fallback_instance():
+    clk = Signal(bool(0))
+
+    @instance
+    def clkgen():
+        while 1:
+            yield delay(10)
+            clk.next = not clk
+
+    assert 'generator instance: clkgen' in fallback(clkgen)
+
+
+def test_fallback_level():
+    a = Signal(bool(0))
+    b = Signal(bool(0))
+
+    @always(a)
+    def logic():
+        b.next = a
+
+    assert 'edges only' in fallback(logic)
+
+
+def test_fallback_derived_clock():
+    clk = Signal(bool(0))
+    div = Signal(bool(0))
+    count = Signal(intbv(0)[4:])
+
+    @always(clk.posedge)
+    def divider():
+        div.next = not div
+
+    @always(div.posedge)
+    def logic():
+        count.next = count + 1
+
+    msg = fallback(divider, logic, Clock(clk, 10))
+    assert 'driven by a block' in msg
+
+
+def test_fallback_comb_loop():
+    a = Signal(bool(0))
+    b = Signal(bool(0))
+
+    @always_comb
+    def first():
+        a.next = not b
+
+    @always_comb
+    def second():
+        b.next = a
+
+    assert 'combinational loop' in fallback(first, second)
+
+
+def test_fallback_shadow():
+    a = Signal(intbv(0)[8:])
+    b = Signal(intbv(0)[4:])
+    low = a(4, 0)
+
+    @always_comb
+    def logic():
+        b.next = low
+
+    assert 'shadow' in fallback(logic)
+
+
+def test_engine_arg():
+    clk = Signal(bool(0))
+    with raises_kind(SimulationError, _error.EngineType):
+        Simulation(Clock(clk, 10), engine='fast')
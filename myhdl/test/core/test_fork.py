@@ -0,0 +1,128 @@
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError
+from myhdl._fork import _error
+from helpers import raises_kind
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'),
+                                reason="requires os.fork")
+
+
+@block
+def accumulator(acc, step, clk):
+
+    @always(clk.posedge)
+    def logic():
+        acc.next = acc + step
+
+    return logic
+
+
+def build():
+    acc = Signal(intbv(0)[16:])
+    step = Signal(intbv(1)[8:])
+    clk = Signal(bool(0))
+    sim = Simulation(accumulator(acc, step, clk), Clock(clk, 10))
+    return sim, acc, step
+
+
+def test_scenarios():
+    sim, acc, step = build()
+    sim.run(100, quiet=1)
+    assert acc == 10
+
+    def scenario(n):
+        def run(sim):
+            step.next = n
+            sim.run(100, quiet=1)
+            return now(), int(acc)
+        return run
+
+    results = sim.fork_scenarios([scenario(n) for n in range(1, 6)],
+                                 workers=2)
+    # each scenario continues from the preamble
+    assert results == [(200, 10 + 10 * n) for n in range(1, 6)]
+    # the parent is not affected
+    assert acc == 10
+    sim.run(100, quiet=1)
+    assert acc == 20
+    sim.quit()
+
+
+def test_generator():
+    acc = Signal(intbv(0)[16:])
+    seen = []
+
+    @instance
+    def stimulus():
+        while 1:
+            yield delay(10)
+            acc.next = acc + 1
+            seen.append(int(acc))
+
+    sim = Simulation(stimulus)
+    sim.run(50, quiet=1)
+
+    def scenario(sim):
+        sim.run(50, quiet=1)
+        return seen
+
+    results = sim.fork_scenarios([scenario, scenario])
+    assert results == [list(range(10)), list(range(10))]
+    assert seen == list(range(5))
+    sim.quit()
+
+
+def test_failure():
+    sim, acc, step = build()
+    sim.run(100, quiet=1)
+
+    def ok(sim):
+        return 1
+
+    def fail(sim):
+        raise ValueError("bad scenario")
+
+    with raises_kind(SimulationError, _error.Scenario):
+        sim.fork_scenarios([ok, fail])
+    sim.quit()
+
+
+def test_args():
+    sim, acc, step = build()
+    with raises_kind(SimulationError, _error.Workers):
+        sim.fork_scenarios([], workers=0)
+    sim.quit()
+    with raises_kind(SimulationError, _error.Finished):
+        sim.fork_scenarios([])
+
+
+@block
+def top(acc, step, clk):
+    return traceSignals(accumulator(acc, step, clk))
+
+
+def test_trace(tmpdir):
+    with tmpdir.as_cwd():
+        acc = Signal(intbv(0)[16:])
+        step = Signal(intbv(1)[8:])
+        clk = Signal(bool(0))
+        sim = Simulation(top(acc, step, clk), Clock(clk, 10))
+        sim.run(100, quiet=1)
+
+        def scenario(sim):
+            sim.run(100, quiet=1)
+
+        sim.fork_scenarios([scenario, scenario])
+        sim.quit()
+        size = os.path.getsize('accumulator.vcd')
+        for i in range(2):
+            p = 'accumulator_%d.vcd' % i
+            assert os.path.getsize(p) > size
+            with open(p) as f:
+                assert f.read().startswith(open('accumulator.vcd').read())
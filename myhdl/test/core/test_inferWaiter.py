@@ -29,6 +29,7 @@ from myhdl import *
 from myhdl._Waiter import (_DelayWaiter, _EdgeTupleWaiter, _EdgeWaiter,
                            _inferWaiter, _SignalTupleWaiter, _SignalWaiter,
                            _Waiter)
+from myhdl._Signal import _staleMargin
 
 random.seed(1)  # random, but deterministic
 
@@ -208,3 +209,125 @@ class TestInferWaiter:
     def testGeneral(self):
         sim = Simulation(self.bench(GeneralFunc, _Waiter))
         sim.run()
+
+    def testEdgeTupleSimultaneous(self):
+        a, b = [Signal(bool(0)) for i in range(2)]
+        count = [0]
+
+        def logic():
+            while 1:
+                yield a.posedge, b.posedge
+                count[0] += 1
+
+        def stimulus():
+            for i in range(10):
+                yield delay(10)
+                a.next = not a
+                b.next = not b
+            raise StopSimulation()
+
+        waiter = _EdgeTupleWaiter(logic())
+        sim = Simulation(waiter, _Waiter(stimulus()))
+        sim.run(quiet=QUIET)
+        # one activation per simultaneous rising edge of a and b
+        assert count[0] == 5
+
+    def testTupleTriggersReused(self):
+        a, b, c = [Signal(intbv(0)[8:]) for i in range(3)]
+
+        def logic():
+            while 1:
+                yield a, b, c
+
+        def stimulus():
+            for i in range(100):
+                yield delay(10)
+                a.next = randrange(256)
+                if randrange(2):
+                    b.next = randrange(256)
+
+        waiter = _SignalTupleWaiter(logic())
+        sim = Simulation(waiter, _Waiter(stimulus()))
+        sim.run(5, quiet=QUIET)
+        triggers = waiter.triggers
+        sim.run(500, quiet=QUIET)
+        assert waiter.triggers is triggers
+        # each list holds the waiter's subscription once
+        for sig, trigger in zip((a, b, c), triggers):
+            assert list(sig._eventWaiters) == [trigger]
+        sim.quit()
+
+    def testTupleTriggersReleased(self):
+        a, b = [Signal(intbv(0)[8:]) for i in range(2)]
+
+        def logic():
+            yield a, b
+
+        def stimulus():
+            yield delay(10)
+            a.next = 1
+            yield delay(100)
+
+        waiter = _SignalTupleWaiter(logic())
+        sim = Simulation(waiter, _Waiter(stimulus()))
+        sim.run(50, quiet=QUIET)
+        # the process has ended: its trigger on b is stale
+        assert [t.hasRun for t in b._eventWaiters] == [1]
+        assert b._eventWaiters.stale == 1
+        sim.quit()
+
+    def testStaleCount(self):
+        a, b = [Signal(intbv(0)[8:]) for i in range(2)]
+        counts = []
+
+        def logic():
+            while 1:
+                yield a, b
+                yield delay(100)
+
+        def stimulus():
+            yield delay(10)
+            a.next = 1
+            yield delay(10)
+            # after the waiter has run through another list
+            counts.append((a._eventWaiters.stale, b._eventWaiters.stale))
+            yield delay(100)
+            a.next = 2
+            b.next = 2
+            yield delay(10)
+            counts.append((a._eventWaiters.stale, b._eventWaiters.stale))
+
+        sim = Simulation(_Waiter(logic()), _Waiter(stimulus()))
+        sim.run(quiet=QUIET)
+        # the lists that triggered the waiter hold no stale entry
+        assert counts == [(0, 1), (0, 0)]
+
+    def testStaleWaitersPurged(self):
+        a, b = [Signal(intbv(0)[8:]) for i in range(2)]
+        sizes = []
+
+        def logic():
+            while 1:
+                yield a, b
+
+        def idle():
+            while 1:
+                yield b
+
+        def stimulus():
+            for i in range(100):
+                yield delay(10)
+                a.next = i + 1
+                wl = b._eventWaiters
+                live = [w for w in wl if not w.hasRun]
+                sizes.append((len(live), len(wl)))
+
+        idlers = [_SignalWaiter(idle()) for i in range(10)]
+        sim = Simulation(_Waiter(logic()), _Waiter(stimulus()), *idlers)
+        sim.run(quiet=QUIET)
+        # a stale waiter is left on b at each activation of logic; they
+        # are removed before they outnumber the live waiters by a margin
+        for live, size in sizes:
+            assert live == 11
+            assert size <= 2 * live + _staleMargin
+        assert max(size for live, size in sizes) > live
@@ -0,0 +1,259 @@
+from __future__ import absolute_import
+
+import random
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError
+from myhdl._lanes import _error
+from myhdl._Simulation import _error as _simerror
+from helpers import raises_kind
+
+
+@block
+def gcd(a, b, start, res, done, clk, rst):
+    x = Signal(intbv(0)[16:])
+    y = Signal(intbv(0)[16:])
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        if start:
+            x.next = a
+            y.next = b
+            done.next = 0
+        elif x != y:
+            if x > y:
+                x.next = x - y
+            else:
+                y.next = y - x
+        else:
+            res.next = x
+            done.next = 1
+
+    return logic
+
+
+def run_gcd(av, bv, lanes=None):
+    a, b, res = [Signal(intbv(0)[16:]) for i in range(3)]
+    start, done, clk = [Signal(bool(0)) for i in range(3)]
+    rst = ResetSignal(0, active=1, isasync=False)
+
+    @instance
+    def stimulus():
+        rst.next = 1
+        yield clk.negedge
+        rst.next = 0
+        a.next = av
+        b.next = bv
+        start.next = 1
+        yield clk.negedge
+        start.next = 0
+
+    sim = Simulation(gcd(a, b, start, res, done, clk, rst), stimulus,
+                     Clock(clk, 10), lanes=lanes)
+    sim.run(2000, quiet=1)
+    if lanes is None:
+        result = [int(res)], [bool(done)]
+    else:
+        result = res.val.tolist(), done.val.tolist()
+    sim.quit()
+    return result
+
+
+def test_gcd():
+    random.seed(3)
+    av = [random.randrange(1, 100) for i in range(16)]
+    bv = [random.randrange(1, 100) for i in range(16)]
+    res, done = run_gcd(av, bv, lanes=16)
+    expected = [run_gcd(x, y) for x, y in zip(av, bv)]
+    assert res == [r[0][0] for r in expected]
+    assert done == [d[1][0] for d in expected]
+    assert all(done)
+
+
+def test_scalar_assignment():
+    q = Signal(modbv(0)[4:])
+    d = Signal(intbv(0)[4:])
+    clk = Signal(bool(0))
+
+    @block
+    def reg(q, d, clk):
+
+        @always(clk.posedge)
+        def logic():
+            q.next = q + d
+
+        return logic
+
+    sim = Simulation(reg(q, d, clk), Clock(clk, 10), lanes=4)
+    d.next = [1, 2, 3, 4]
+    sim.run(50, quiet=1)
+    assert q.val.tolist() == [5, 10, 15, 4]
+    d.next = 0
+    sim.run(50, quiet=1)
+    assert q.val.tolist() == [5, 10, 15, 4]
+    sim.quit()
+    assert q == 0
+
+
+def test_bounds():
+    q = Signal(intbv(0)[4:])
+    clk = Signal(bool(0))
+
+    @block
+    def counter(q, clk):
+
+        @always(clk.posedge)
+        def logic():
+            q.next = q + 1
+
+        return logic
+
+    sim = Simulation(counter(q, clk), Clock(clk, 10), lanes=3)
+    q.next = [0, 10, 14]
+    with pytest.raises(ValueError):
+        sim.run(100, quiet=1)
+
+
+def test_index():
+    mem = [Signal(intbv(i * 3)[8:]) for i in range(8)]
+    addr = Signal(intbv(0)[3:])
+    dout = Signal(intbv(0)[8:])
+
+    @block
+    def rom(dout, addr):
+
+        @always_comb
+        def logic():
+            dout.next = mem[addr]
+
+        return logic
+
+    sim = Simulation(rom(dout, addr), Clock(Signal(bool(0)), 10), lanes=8)
+    addr.next = [7, 6, 5, 4, 3, 2, 1, 0]
+    sim.run(10, quiet=1)
+    assert dout.val.tolist() == [21, 18, 15, 12, 9, 6, 3, 0]
+    sim.quit()
+
+
+def run_update(selv, lanes=None):
+    n = Signal(modbv(0)[8:])
+    flip = Signal(intbv(0)[2:])
+    sel = Signal(bool(0))
+    clk = Signal(bool(0))
+
+    @block
+    def update(n, flip, sel, clk):
+
+        @always(clk.posedge)
+        def logic():
+            # read-modify-write updates of the next values, before and
+            # after the lanes split on sel
+            n.next = n.next + 2
+            flip.next[0] = not flip.next[0]
+            if sel:
+                n.next = n.next + 1
+                flip.next[1] = not flip.next[1]
+
+        return logic
+
+    sim = Simulation(update(n, flip, sel, clk), Clock(clk, 10), lanes=lanes)
+    sel.next = selv
+    sim.run(25, quiet=1)
+    if lanes is None:
+        result = [int(n)], [int(flip)]
+    else:
+        result = n.val.tolist(), flip.val.tolist()
+    sim.quit()
+    return result
+
+
+def test_split_update():
+    n, flip = run_update([0, 1], lanes=2)
+    expected = [run_update(v) for v in (0, 1)]
+    assert n == [e[0][0] for e in expected] == [6, 9]
+    assert flip == [e[1][0] for e in expected] == [1, 3]
+
+
+def test_generator_diverge():
+    s = Signal(bool(0))
+    t = Signal(bool(0))
+
+    @instance
+    def check():
+        s.next = [0, 1]
+        yield delay(10)
+        if s:
+            t.next = 1
+
+    sim = Simulation(check, lanes=2)
+    with raises_kind(SimulationError, _error.Diverge):
+        sim.run(20, quiet=1)
+
+
+def test_edge():
+    s = Signal(bool(0))
+    n = Signal(intbv(0)[4:])
+
+    @block
+    def edge(n, s):
+
+        @always(s.posedge)
+        def logic():
+            n.next = n + 1
+
+        return logic
+
+    @instance
+    def stimulus():
+        yield delay(10)
+        s.next = 1
+        yield delay(10)
+        s.next = 0
+        yield delay(10)
+        s.next = [0, 1]
+
+    sim = Simulation(edge(n, s), stimulus, lanes=2)
+    sim.run(25, quiet=1)
+    assert n.val.tolist() == [1, 1]
+    with raises_kind(SimulationError, _error.Edge):
+        sim.run(15, quiet=1)
+
+
+def test_args():
+    clk = Signal(bool(0))
+    with raises_kind(SimulationError, _simerror.LaneCount):
+        Simulation(Clock(clk, 10), lanes=0)
+    with raises_kind(SimulationError, _simerror.CycleLanes):
+        Simulation(Clock(clk, 10), lanes=2, engine='cycle')
+    s = Signal(intbv(0)[8:])
+    t = Signal(bool(0))
+
+    @block
+    def shadow(t, s):
+        b = s(3)
+
+        @always_comb
+        def logic():
+            t.next = b
+
+        return logic
+
+    with raises_kind(SimulationError, _error.SigType):
+        Simulation(shadow(t, s), lanes=2)
+
+    @block
+    def copy(t, s):
+
+        @always_comb
+        def logic():
+            t.next = s
+
+        return logic
+
+    u = Signal(bool(0))
+    sim = Simulation(copy(u, Signal(bool(0))), lanes=2)
+    with raises_kind(SimulationError, _error.Width):
+        u.next = [1, 0, 1]
+    sim.quit()
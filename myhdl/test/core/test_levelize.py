@@ -0,0 +1,139 @@
+from __future__ import absolute_import
+
+import warnings
+
+from myhdl import *
+from myhdl import SimulationWarning
+from myhdl._levelize import _levelize
+
+N = 6
+
+
+def chain(log):
+    """ A chain of always_comb blocks, declared from the last to the first,
+    and a counter that drives its input and one side input of each block """
+
+    clk = Signal(bool(0))
+    count = Signal(modbv(0)[8:])
+    sigs = [Signal(modbv(0)[8:]) for i in range(N + 1)]
+    blocks = []
+    for i in reversed(range(N)):
+        a, b = sigs[i], sigs[i + 1]
+
+        def stage(a=a, b=b, i=i):
+            @always_comb
+            def logic():
+                b.next = a + count
+                log.append((now(), i))
+            return logic
+        blocks.append(stage())
+
+    @always(clk.posedge)
+    def counter():
+        count.next = count + 1
+        sigs[0].next = count
+
+    return blocks, counter, Clock(clk, 10), sigs
+
+
+def sample(levelize):
+    log = []
+    blocks, counter, clock, sigs = chain(log)
+    sim = Simulation(blocks, counter, clock, levelize=levelize)
+    seen = []
+    for i in range(20):
+        sim.run(5, quiet=1)
+        seen.append([int(s) for s in sigs])
+    counters = sim.activations, sim.timesteps
+    sim.quit()
+    return seen, log, counters
+
+
+def test_levelize():
+    expected, log, (eact, esteps) = sample(False)
+    result, llog, (lact, lsteps) = sample(True)
+    assert result == expected
+    assert lsteps == esteps
+    assert lact < eact
+    # each block runs once per time step, in chain order
+    for t in set(t for t, i in llog):
+        assert [i for s, i in llog if s == t] == list(range(N))
+    # without levelization, some blocks run more than once
+    assert len(log) > len(set(log))
+
+
+def test_levels():
+    a, b, c, d = [Signal(bool(0)) for i in range(4)]
+
+    @always_comb
+    def ab():
+        b.next = a
+
+    @always_comb
+    def bc():
+        c.next = b
+
+    @always_comb
+    def abcd():
+        d.next = a and b and c
+
+    assert _levelize([abcd, bc, ab]) == ([2, 1, 0], [])
+
+
+def test_loop():
+    a, b, c = [Signal(bool(0)) for i in range(3)]
+
+    @always_comb
+    def first():
+        a.next = not b
+
+    @always_comb
+    def second():
+        b.next = a
+
+    @always_comb
+    def after():
+        c.next = b
+
+    assert _levelize([after, first, second]) == \
+        ([None, None, None], ['first', 'second'])
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        sim = Simulation(after, first, second, levelize=True)
+    sim.quit()
+    assert len(w) == 1
+    assert w[0].category is SimulationWarning
+    assert 'first, second' in str(w[0].message)
+
+
+def test_queued_once(monkeypatch):
+    from myhdl._Waiter import _FuncTupleWaiter
+    calls = []
+    orig = _FuncTupleWaiter.next
+
+    def counted(self, waiters, exc):
+        calls.append(now())
+        return orig(self, waiters, exc)
+    monkeypatch.setattr(_FuncTupleWaiter, 'next', counted)
+
+    clk = Signal(bool(0))
+    a, b, c = [Signal(modbv(0)[8:]) for i in range(3)]
+    runs = []
+
+    @always(clk.posedge)
+    def driver():
+        a.next = a + 1
+        b.next = b + 2
+
+    @always_comb
+    def logic():
+        c.next = a + b
+        runs.append(now())
+
+    sim = Simulation(driver, logic, Clock(clk, 10), levelize=True)
+    sim.run(100, quiet=1)
+    value = int(c)
+    sim.quit()
+    # both inputs change in the same delta: the block is queued once
+    assert value == 30
+    assert calls == runs[1:]
@@ -0,0 +1,91 @@
+from __future__ import absolute_import
+
+from myhdl import *
+
+
+@block
+def counter(count, clk, step):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + step
+
+    return logic
+
+
+@block
+def bench(count, period, step):
+    clk = Signal(bool(0))
+    dut = counter(count, clk, step)
+    clkgen = Clock(clk, period)
+    return dut, clkgen
+
+
+def alone(period, step, duration):
+    count = Signal(modbv(0)[16:])
+    sim = Simulation(bench(count, period, step))
+    sim.run(duration, quiet=1)
+    val = int(count)
+    sim.quit()
+    return val
+
+
+def test_interleaved():
+    a = Signal(modbv(0)[16:])
+    b = Signal(modbv(0)[16:])
+    sima = Simulation(bench(a, 10, 1))
+    simb = Simulation(bench(b, 6, 3))
+    for i in range(20):
+        sima.run(50, quiet=1)
+        assert now() == 50 * (i + 1)
+        simb.run(70, quiet=1)
+        assert now() == 70 * (i + 1)
+    va, vb = int(a), int(b)
+    sima.quit()
+    assert int(b) == vb
+    simb.quit()
+    assert va == alone(10, 1, 1000)
+    assert vb == alone(6, 3, 1400)
+
+
+def test_assign_between_runs():
+    a = Signal(modbv(0)[16:])
+    sima = Simulation(bench(a, 10, 1))
+    b = Signal(modbv(0)[16:])
+    simb = Simulation(bench(b, 10, 1))
+    sima.run(100, quiet=1)
+    simb.run(100, quiet=1)
+    a.next = 1000
+    # a runs in its own simulation only
+    simb.run(100, quiet=1)
+    assert a == 10
+    assert b == 20
+    sima.run(1, quiet=1)
+    assert a == 1000
+    sima.quit()
+    simb.quit()
+
+
+def test_trace(tmpdir):
+    with tmpdir.as_cwd():
+        # a trace goes to the next simulation that is created
+        a = Signal(modbv(0)[16:])
+        topa = bench(a, 10, 1)
+        topa.config_sim(trace=True, name='a')
+        topa.run_sim(50, quiet=1)
+        b = Signal(modbv(0)[16:])
+        topb = bench(b, 10, 2)
+        topb.config_sim(trace=True, name='b')
+        topb.run_sim(100, quiet=1)
+        topa.run_sim(50, quiet=1)
+        topb.run_sim(100, quiet=1)
+        topa.quit_sim()
+        topb.quit_sim()
+        traceSignals.name = None
+        traces = []
+        for name in 'ab':
+            with open(name + '.vcd') as f:
+                traces.append(f.read())
+    a, b = traces
+    assert '#100\n' in a and '#110\n' not in a
+    assert '#200\n' in b
@@ -0,0 +1,190 @@
+from __future__ import absolute_import
+
+import random
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError
+from myhdl._packed import _error
+from myhdl._Simulation import _error as _simerror
+from helpers import raises_kind
+
+
+@block
+def lfsr24(lfsr, enable, clock, reset):
+
+    @always(clock.posedge, reset.posedge)
+    def logic():
+        if reset == 1:
+            lfsr.next = 1
+        else:
+            if enable:
+                lfsr.next = lfsr << 1
+                lfsr.next[0] = lfsr[23] ^ lfsr[22] ^ lfsr[21] ^ lfsr[16]
+
+    return logic
+
+
+def run_lfsr(init, lanes=None, packed=False):
+    lfsr = Signal(modbv(0)[24:])
+    enable, clock, reset = [Signal(bool(0)) for i in range(3)]
+    sim = Simulation(lfsr24(lfsr, enable, clock, reset), Clock(clock, 10),
+                     lanes=lanes, packed=packed)
+    lfsr.next = init
+    enable.next = 1
+    sim.run(500, quiet=1)
+    values = lfsr.val.tolist() if lanes else [int(lfsr)]
+    sim.quit()
+    return values
+
+
+def test_lfsr():
+    random.seed(5)
+    inits = [random.randrange(1, 2**24) for i in range(70)]
+    expected = []
+    for v in inits:
+        expected.extend(run_lfsr(v))
+    assert run_lfsr(inits, lanes=70, packed=True) == expected
+
+
+@block
+def xor3(z, a, b, c):
+
+    @instance
+    def logic():
+        while 1:
+            yield a, b, c
+            z.next = a ^ b ^ c
+
+    return logic
+
+
+def test_scrambler():
+    random.seed(2)
+    n = 100
+    il = [Signal(bool(0)) for i in range(8)]
+    ol = [Signal(bool(0)) for i in range(8)]
+    gates = []
+    taps = []
+    for i in range(8):
+        j, k = random.sample([m for m in range(8) if m != i], 2)
+        gates.append(xor3(ol[i], il[i], il[j], il[k]))
+        taps.append((i, j, k))
+    clk = Signal(bool(0))
+    sim = Simulation(gates, Clock(clk, 10), lanes=n, packed=True)
+    sim.run(10, quiet=1)
+    vectors = [random.randrange(256) for i in range(n)]
+    for b, s in enumerate(il):
+        s.next = [(v >> b) & 1 for v in vectors]
+    sim.run(10, quiet=1)
+    outputs = [s.val.tolist() for s in ol]
+    for lane, v in enumerate(vectors):
+        for i, j, k in taps:
+            expected = ((v >> i) ^ (v >> j) ^ (v >> k)) & 1
+            assert outputs[i][lane] == expected
+    sim.quit()
+
+
+def test_arithmetic():
+    cnt = Signal(modbv(0)[6:])
+    step = Signal(intbv(0)[4:])
+    lt = Signal(bool(0))
+    eq = Signal(bool(0))
+    diff = Signal(modbv(0)[6:])
+    clk = Signal(bool(0))
+
+    @block
+    def logic(cnt, step, lt, eq, diff, clk):
+
+        @always(clk.posedge)
+        def seq():
+            cnt.next = cnt + step
+
+        @always_comb
+        def comb():
+            lt.next = cnt < 20
+            eq.next = cnt == step
+            diff.next = step - cnt
+
+        return seq, comb
+
+    steps = list(range(16))
+    sim = Simulation(logic(cnt, step, lt, eq, diff, clk), Clock(clk, 10),
+                     lanes=16, packed=True)
+    step.next = steps
+    sim.run(70, quiet=1)
+    counts = [(7 * s) % 64 for s in steps]
+    assert cnt.val.tolist() == counts
+    assert lt.val.tolist() == [c < 20 for c in counts]
+    assert eq.val.tolist() == [c == s for c, s in zip(counts, steps)]
+    assert diff.val.tolist() == [(s - c) % 64 for c, s in zip(counts, steps)]
+    sim.quit()
+
+
+def test_branch():
+    a = Signal(bool(0))
+    b = Signal(bool(0))
+
+    @block
+    def logic(b, a):
+
+        @always_comb
+        def comb():
+            if a:
+                b.next = 1
+            else:
+                b.next = 0
+
+        return comb
+
+    sim = Simulation(logic(b, a), Clock(Signal(bool(0)), 10), lanes=4,
+                     packed=True)
+    a.next = 1
+    sim.run(10, quiet=1)
+    assert b.val.tolist() == [True] * 4
+    a.next = [0, 1, 0, 1]
+    with raises_kind(SimulationError, _error.Branch):
+        sim.run(10, quiet=1)
+
+
+def test_bounds():
+    q = Signal(intbv(0)[4:])
+    d = Signal(intbv(0)[4:])
+
+    @block
+    def logic(q, d):
+
+        @always_comb
+        def comb():
+            q.next = d + 1
+
+        return comb
+
+    sim = Simulation(logic(q, d), Clock(Signal(bool(0)), 10), lanes=3,
+                     packed=True)
+    d.next = [0, 3, 14]
+    sim.run(10, quiet=1)
+    assert q.val.tolist() == [1, 4, 15]
+    d.next = [0, 15, 14]
+    with pytest.raises(ValueError):
+        sim.run(10, quiet=1)
+
+
+def test_args():
+    s = Signal(intbv(0, min=-8, max=8))
+    t = Signal(bool(0))
+
+    @block
+    def logic(t, s):
+
+        @always_comb
+        def comb():
+            t.next = s[0]
+
+        return comb
+
+    with raises_kind(SimulationError, _simerror.PackedLanes):
+        Simulation(logic(t, s), packed=True)
+    with raises_kind(SimulationError, _error.ValType):
+        Simulation(logic(t, s), lanes=4, packed=True)
@@ -0,0 +1,198 @@
+from __future__ import absolute_import
+
+import os
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError, SimulationWarning
+from myhdl._partition import _error
+from myhdl._Simulation import _error as _simerror
+from helpers import raises_kind
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'),
+                                reason="requires os.fork")
+
+
+@block
+def counter(cnt, clk, limit=None):
+
+    @always(clk.posedge)
+    def logic():
+        if limit is not None and cnt == limit:
+            raise StopSimulation("limit reached")
+        cnt.next = (cnt + 1) % 256
+
+    return logic
+
+
+@block
+def register(q, d, clk):
+
+    @always(clk.posedge)
+    def logic():
+        q.next = d
+
+    return logic
+
+
+class Design(object):
+
+    """ Two clock domains that sample each other's counter """
+
+    def __init__(self, limit=None, monitor=True):
+        self.clka, self.clkb = Signal(bool(0)), Signal(bool(0))
+        self.sigs = [Signal(intbv(0)[8:]) for i in range(4)]
+        a, b, qa, qb = self.sigs
+        self.log = log = []
+        self.domain_a = [counter(a, self.clka), register(qa, b, self.clka)]
+        self.domain_b = [counter(b, self.clkb, limit),
+                         register(qb, a, self.clkb)]
+        self.args = [self.domain_a, self.domain_b,
+                     Clock(self.clka, 10), Clock(self.clkb, 14)]
+        if monitor:
+
+            @instance
+            def mon():
+                while 1:
+                    yield qa, qb
+                    log.append((now(), int(qa), int(qb)))
+
+            self.args.append(mon)
+
+    def values(self):
+        return [int(s) for s in self.sigs]
+
+
+def reference(duration, **kwargs):
+    d = Design(**kwargs)
+    sim = Simulation(d.args)
+    sim.run(duration, quiet=1)
+    values = d.values()
+    sim.quit()
+    return d.log, values
+
+
+def test_groups():
+    log, values = reference(1000)
+    d = Design()
+    sim = Simulation(d.args, partitions=[d.domain_b])
+    sim.run(500, quiet=1)
+    sim.run(500, quiet=1)
+    assert now() == 1000
+    assert d.log == log
+    assert d.values() == values
+    sim.quit()
+
+
+def test_until():
+    # the watchpoint suspends the run before the time step is over
+    results = []
+    for partitions in (None, 'groups'):
+        d = Design()
+        if partitions is None:
+            sim = Simulation(d.args)
+        else:
+            sim = Simulation(d.args, partitions=[d.domain_b])
+        qa = d.sigs[2]
+        assert sim.run(2000, quiet=1, until=(qa, lambda v: v == 5)) == 1
+        results.append((now(), d.values()))
+        sim.run(300, quiet=1)
+        results.append((now(), d.values(), d.log))
+        sim.quit()
+    assert results[0][1][2] == 5
+    assert results[:2] == results[2:]
+
+
+def test_auto():
+    log, values = reference(1000, monitor=False)
+    d = Design(monitor=False)
+    sim = Simulation(d.args, partitions='auto')
+    assert len(sim._link.plan.args) == 2
+    sim.run(1000, quiet=1)
+    assert d.values() == values
+    sim.quit()
+
+
+def test_auto_single():
+    # the monitor reads both domains
+    d = Design()
+    with pytest.warns(SimulationWarning):
+        sim = Simulation(d.args, partitions='auto')
+    assert sim._link is None
+    sim.quit()
+
+
+def test_stop():
+    d = Design(limit=20)
+    sim = Simulation(d.args)
+    assert sim.run(quiet=1) == 0
+    t, log = now(), d.log
+    d = Design(limit=20)
+    sim = Simulation(d.args, partitions=[d.domain_b])
+    assert sim.run(quiet=1) == 0
+    assert now() == t
+    assert d.log == log
+
+
+def test_child_error():
+
+    @block
+    def failing(clk):
+
+        @always(clk.posedge)
+        def logic():
+            if now() > 100:
+                raise ValueError("failing block")
+
+        return logic
+
+    d = Design()
+    f = failing(d.clkb)
+    sim = Simulation(d.args, f, partitions=[d.domain_b + [f]])
+    with pytest.raises(ValueError):
+        sim.run(1000, quiet=1)
+
+
+def test_comb_driver():
+    d = Design()
+    a, b, qa, qb = d.sigs
+    c = Signal(intbv(0)[8:])
+
+    @block
+    def comb(c, a):
+
+        @always_comb
+        def logic():
+            c.next = a
+
+        return logic
+
+    inst = comb(c, a)
+    reg = register(qb, c, d.clkb)
+    with raises_kind(SimulationError, _error.Driver):
+        Simulation(d.domain_a, inst, reg, Clock(d.clka, 10),
+                   Clock(d.clkb, 14), partitions=[[reg]])
+
+
+def test_multi_driven():
+    d = Design()
+    a, b, qa, qb = d.sigs
+    other = register(qa, b, d.clkb)
+    with raises_kind(SimulationError, _error.MultiDriven):
+        Simulation(d.args, other, partitions=[d.domain_b + [other]])
+
+
+def test_args():
+    d = Design()
+    with raises_kind(SimulationError, _simerror.CyclePartitions):
+        Simulation(d.args, engine='cycle', partitions='auto')
+    d = Design()
+    with raises_kind(SimulationError, _error.Member):
+        Simulation(d.domain_a, Clock(d.clka, 10),
+                   partitions=[d.domain_b])
+    d = Design()
+    sim = Simulation(d.args, partitions=[d.domain_b])
+    with raises_kind(SimulationError, _simerror.Partitioned):
+        sim.checkpoint('unused.ckpt')
+    sim.quit()
@@ -0,0 +1,165 @@
+from __future__ import absolute_import
+
+import warnings
+
+import pytest
+
+from myhdl import *
+from myhdl import InstanceError, SimulationWarning
+
+
+@block
+def chain(a, b, c, clk):
+
+    @always(clk.posedge)
+    def count():
+        a.next = a + 1
+
+    @always_comb
+    def inc1():
+        b.next = a + 1
+
+    @always_comb
+    def inc2():
+        c.next = b + 1
+
+    return count, inc1, inc2
+
+
+def observe(mark):
+    a, b, c = [Signal(intbv(0)[8:]) for i in range(3)]
+    clk = Signal(bool(0))
+    seen = []
+
+    @always(a, b, c)
+    def monitor():
+        seen.append((now(), int(a), int(b), int(c)))
+
+    if mark:
+        postponed(monitor)
+    sim = Simulation(chain(a, b, c, clk), monitor, Clock(clk, 10))
+    sim.run(30, quiet=1)
+    activations = sim.activations
+    sim.quit()
+    return seen, activations
+
+
+def test_once_per_timestep():
+    seen, activations = observe(False)
+    # the monitor sees the intermediate values of the delta cycles
+    assert (5, 1, 1, 2) in seen
+    assert len(seen) == 11
+    seen, activations = observe(True)
+    assert seen == [(5, 1, 2, 3), (15, 2, 3, 4), (25, 3, 4, 5)]
+
+
+def test_generator():
+    a = Signal(intbv(0)[8:])
+    b = Signal(intbv(0)[8:])
+    seen = []
+
+    @instance
+    def stimulus():
+        for i in range(1, 4):
+            yield delay(10)
+            a.next = i
+            # a zero delay does not end the time step
+            yield delay(0)
+            b.next = i
+
+    @instance
+    def monitor():
+        while 1:
+            yield a, b
+            seen.append((now(), int(a), int(b)))
+
+    sim = Simulation(stimulus, postponed(monitor))
+    sim.run(quiet=1)
+    assert seen == [(10, 1, 1), (20, 2, 2), (30, 3, 3)]
+
+
+def test_assign():
+    a = Signal(intbv(0)[8:])
+    b = Signal(intbv(0)[8:])
+    seen = []
+
+    @instance
+    def stimulus():
+        for i in range(1, 4):
+            yield delay(10)
+            a.next = i
+
+    @always(a)
+    def copy():
+        b.next = a
+
+    @always(b)
+    def monitor():
+        seen.append((now(), int(b)))
+
+    # the delta cycles go on after a postponed block assigns a signal
+    sim = Simulation(stimulus, postponed(copy), monitor)
+    sim.run(quiet=1)
+    assert seen == [(10, 1), (20, 2), (30, 3)]
+
+
+def test_args():
+    with pytest.raises(InstanceError):
+        postponed(lambda: None)
+
+
+def test_cycle_fallback():
+    a, b, c = [Signal(intbv(0)[8:]) for i in range(3)]
+    clk = Signal(bool(0))
+
+    @always(clk.posedge)
+    def monitor():
+        pass
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        sim = Simulation(chain(a, b, c, clk), postponed(monitor),
+                         Clock(clk, 10), engine='cycle')
+    assert sim.engine == 'event'
+    assert any(issubclass(x.category, SimulationWarning) for x in w)
+    sim.quit()
+
+
+
+@pytest.mark.parametrize('timeout', [False, True])
+def test_tuple_relisted(timeout):
+    a = Signal(intbv(0)[8:])
+    b = Signal(intbv(0)[8:])
+    seen = []
+
+    @instance
+    def stimulus():
+        yield delay(40)
+        a.next = 1
+        b.next = 1
+        yield delay(10)
+        a.next = 2
+        yield delay(10)
+        b.next = 2
+
+    @instance
+    def tuplemonitor():
+        while 1:
+            yield a, b
+            seen.append((now(), int(a), int(b)))
+
+    @instance
+    def timeoutmonitor():
+        while 1:
+            # a generator waiter, subscribed to each clause
+            yield a, b, delay(1000)
+            seen.append((now(), int(a), int(b)))
+
+    monitor = timeoutmonitor if timeout else tuplemonitor
+
+    # both subscriptions of the monitor trigger at 40, and it still hears
+    # each signal afterwards
+    sim = Simulation(stimulus, postponed(monitor))
+    sim.run(100, quiet=1)
+    sim.quit()
+    assert seen == [(40, 1, 1), (50, 2, 1), (60, 2, 2)]
@@ -0,0 +1,118 @@
+from __future__ import absolute_import
+from __future__ import print_function
+
+import json
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationWarning
+
+
+@block
+def incrementer(count, clk):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + 1
+
+    return logic
+
+
+@block
+def doubler(dout, din):
+
+    @always_comb
+    def logic():
+        dout.next = 2 * din
+
+    return logic
+
+
+@block
+def bench(count, double):
+    clk = Signal(bool(0))
+    inc = incrementer(count, clk)
+    dbl = doubler(double, count)
+    clkgen = Clock(clk, 10)
+    return inc, dbl, clkgen
+
+
+def test_profile(tmpdir):
+    count = Signal(modbv(0)[8:])
+    double = Signal(modbv(0)[9:])
+    top = bench(count, double)
+    sim = Simulation(top)
+    sim.run(100, quiet=1, profile=True)
+    sim.run(100, quiet=1)
+    sim.run(100, quiet=1, profile=True)
+    sim.quit()
+    prof = sim.profile
+    procs = prof.processes
+    inc = "%s.%s.logic" % (top.name, top.subs[0].name)
+    dbl = "%s.%s.logic" % (top.name, top.subs[1].name)
+    assert sorted(procs) == sorted([inc, dbl])
+    # the initial activation, and 10 edges in each of two profiled runs
+    assert procs[inc][0] == 21
+    assert procs[dbl][0] == 21
+    assert procs[inc][1] >= 0
+    updates = prof.updates
+    assert updates["%s.count" % top.name] == 20
+    # including the initial always_comb assignment
+    assert updates["%s.double" % top.name] == 21
+    assert sum(prof.deltas.values()) > 0
+    assert max(prof.deltas) == 3
+    assert prof.depth[0][1] >= 1
+
+    out = tmpdir.join('report.txt')
+    with open(str(out), 'w') as f:
+        prof.report(f)
+    text = out.read()
+    assert inc in text
+    assert "delta cycles" in text
+
+    path = str(tmpdir.join('profile.json'))
+    prof.dump(path)
+    with open(path) as f:
+        data = json.load(f)
+    assert data['processes'][inc][0] == 21
+
+    path = str(tmpdir.join('profile.folded'))
+    prof.dumpStacks(path)
+    with open(path) as f:
+        lines = f.read().splitlines()
+    stacks = [line.rsplit(' ', 1)[0] for line in lines]
+    assert sorted(stacks) == sorted([inc.replace('.', ';'),
+                                     dbl.replace('.', ';')])
+
+
+def test_no_profile():
+    count = Signal(modbv(0)[8:])
+    double = Signal(modbv(0)[9:])
+    sim = Simulation(bench(count, double))
+    sim.run(100, quiet=1)
+    sim.quit()
+    assert sim.profile is None
+
+
+def test_generator():
+    clk = Signal(bool(0))
+
+    def gen():
+        for i in range(5):
+            yield delay(10)
+            clk.next = not clk
+
+    sim = Simulation(gen())
+    sim.run(quiet=1, profile=True)
+    assert sim.profile.processes['gen'][0] == 5
+
+
+def test_cycle_engine():
+    count = Signal(modbv(0)[8:])
+    double = Signal(modbv(0)[9:])
+    sim = Simulation(bench(count, double), engine='cycle')
+    with pytest.warns(SimulationWarning):
+        sim.run(100, quiet=1, profile=True)
+    sim.quit()
+    assert sim.profile is None
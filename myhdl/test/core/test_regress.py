@@ -0,0 +1,155 @@
+from __future__ import absolute_import
+from __future__ import print_function
+
+import json
+
+import pytest
+
+from myhdl import *
+
+# Python 2 has concurrent.futures with the futures backport only
+pytest.importorskip('concurrent.futures')
+
+from myhdl import regress as regression
+from myhdl.regress import Job, regress
+
+
+@block
+def counter(count, clk):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + 1
+
+    return logic
+
+
+@block
+def bench(n, expected):
+    count = Signal(modbv(0)[16:])
+    clk = Signal(bool(0))
+    dut = counter(count, clk)
+    clkgen = Clock(clk, 10)
+
+    @instance
+    def check():
+        yield delay(10 * n + 1)
+        print("count", int(count))
+        assert count == expected
+        raise StopSimulation()
+
+    return dut, clkgen, check
+
+
+@block
+def broken():
+    raise ValueError("no bench")
+
+
+@block
+def spin():
+    clk = Signal(bool(0))
+
+    @instance
+    def loop():
+        yield clk
+        while True:
+            pass
+
+    return Clock(clk, 10), loop
+
+
+@block
+def stubborn():
+    clk = Signal(bool(0))
+
+    @instance
+    def loop():
+        yield clk
+        while True:
+            try:
+                while True:
+                    pass
+            except Exception:
+                pass
+
+    return Clock(clk, 10), loop
+
+
+def test_results(tmpdir):
+    path = str(tmpdir.join('report.json'))
+    jobs = [Job(bench, dict(n=n, expected=n)) for n in range(1, 6)]
+    jobs.append((bench, dict(n=3, expected=4)))
+    jobs.append(Job(broken, name='broken'))
+    rep = regress(jobs, workers=2, report=path)
+    with open(path) as f:
+        assert json.load(f) == rep
+    assert rep['passed'] == 5
+    assert rep['failed'] == 2
+    results = rep['jobs']
+    for n, r in enumerate(results[:5], 1):
+        assert r['status'] == 'pass'
+        assert r['name'] == "bench(expected=%d, n=%d)" % (n, n)
+        assert r['time'] == 10 * n + 1
+        assert "count %d" % n in r['stdout']
+        assert r['wall'] >= 0
+    assert results[5]['status'] == 'fail'
+    assert 'AssertionError' in results[5]['error']
+    assert results[6]['status'] == 'error'
+    assert 'no bench' in results[6]['error']
+    assert results[6]['time'] is None
+
+
+def test_duration():
+    rep = regress([Job(bench, dict(n=100, expected=0), duration=55)],
+                  workers=1)
+    r = rep['jobs'][0]
+    assert r['status'] == 'pass'
+    assert r['time'] == 55
+
+
+def test_timeout():
+    jobs = [Job(spin)] + [Job(bench, dict(n=n, expected=n))
+                          for n in range(4)]
+    rep = regress(jobs, workers=1, timeout=0.5)
+    assert [r['status'] for r in rep['jobs']] == ['timeout'] + ['pass'] * 4
+
+
+def test_kill(monkeypatch):
+    monkeypatch.setattr(regression, '_grace', 0.5)
+    jobs = [Job(stubborn)] + [Job(bench, dict(n=n, expected=n))
+                              for n in range(3)]
+    rep = regress(jobs, workers=1, timeout=0.5)
+    statuses = [r['status'] for r in rep['jobs']]
+    assert statuses[0] == 'timeout'
+    assert 'killed' in rep['jobs'][0]['error']
+    assert statuses[1:] == ['pass'] * 3
+
+
+def test_kill_queued(monkeypatch):
+    # jobs that wait in the call queue of the pool are not timed out
+    monkeypatch.setattr(regression, '_grace', 0.5)
+    jobs = [Job(stubborn), Job(stubborn)] + \
+        [Job(bench, dict(n=n, expected=n)) for n in range(4)]
+    rep = regress(jobs, workers=2, timeout=1)
+    statuses = [r['status'] for r in rep['jobs']]
+    assert statuses == ['timeout'] * 2 + ['pass'] * 4
+
+
+def test_main(tmpdir, capsys):
+    jobfile = tmpdir.join('jobs.json')
+    factory = "%s:bench" % __name__
+    jobfile.write(json.dumps([
+        {"factory": factory,
+         "params": [{"n": 2, "expected": 2}, {"n": 3, "expected": 3}]},
+        {"factory": factory, "params": {"n": 2, "expected": 0},
+         "name": "wrong"},
+    ]))
+    path = str(tmpdir.join('report.json'))
+    assert regression.main(['-j', '2', '-o', path, str(jobfile)]) == 1
+    out = capsys.readouterr()[0]
+    assert "FAIL     wrong" in out
+    assert "2 passed, 1 failed" in out
+    with open(path) as f:
+        rep = json.load(f)
+    assert [r['status'] for r in rep['jobs']] == ['pass', 'pass', 'fail']
@@ -0,0 +1,187 @@
+from __future__ import absolute_import
+
+import io
+
+from myhdl import *
+from myhdl import SimulationError
+from myhdl._Simulation import _error
+from helpers import raises_kind
+
+
+@block
+def fifo(dout, empty, din, wr, rd, clk, rst, depth=4):
+    mem = [Signal(intbv(0)[8:]) for i in range(depth)]
+    wptr = Signal(intbv(0, min=0, max=depth))
+    rptr = Signal(intbv(0, min=0, max=depth))
+    count = Signal(intbv(0, min=0, max=depth + 1))
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        if wr and count < depth:
+            mem[wptr].next = din
+            wptr.next = (wptr + 1) % depth
+        if rd and count > 0:
+            dout.next = mem[rptr]
+            rptr.next = (rptr + 1) % depth
+        count.next = count + (wr and count < depth) - (rd and count > 0)
+        empty.next = count == 0
+
+    return logic
+
+
+@block
+def counter(cnt, clk, rst):
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        cnt.next = cnt + 1
+
+    return logic
+
+
+@block
+def soc(outs, cnt, clk, rst, n):
+    ins = [Signal(intbv(0)[8:]) for i in range(n)]
+    wrs = [Signal(bool(0)) for i in range(n)]
+    rds = [Signal(bool(0)) for i in range(n)]
+    empties = [Signal(bool(0)) for i in range(n)]
+    insts = [fifo(outs[i], empties[i], ins[i], wrs[i], rds[i], clk, rst)
+             for i in range(n)]
+
+    @instance
+    def stimulus():
+        rst.next = 1
+        yield clk.negedge
+        rst.next = 0
+        for t in range(200):
+            yield clk.negedge
+            for i in range(n):
+                # each fifo is busy for a short while only
+                busy = 20 * i <= t < 20 * i + 10
+                if busy:
+                    ins[i].next = t % 256
+                wrs[i].next = busy and t % 2 == 0
+                rds[i].next = busy and t % 2 == 1
+
+    return insts, counter(cnt, clk, rst), stimulus
+
+
+def run_soc(**kwargs):
+    n = 5
+    outs = [Signal(intbv(0)[8:]) for i in range(n)]
+    cnt = Signal(modbv(0)[16:])
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    log = []
+
+    @instance
+    def monitor():
+        while 1:
+            yield outs
+            log.append((now(), [int(s) for s in outs]))
+
+    sim = Simulation(soc(outs, cnt, clk, rst, n), monitor, Clock(clk, 10),
+                     **kwargs)
+    sim.run(2200, quiet=1)
+    values = [int(s) for s in outs], int(cnt)
+    sim.quit()
+    return sim, log, values
+
+
+def test_equivalence():
+    ref, log, values = run_soc()
+    assert ref.activity is None
+    sim, skiplog, skipvalues = run_soc(skip_idle=True)
+    assert skiplog == log
+    assert skipvalues == values
+    assert sim.activations == ref.activations
+
+
+def test_activity():
+    sim, log, values = run_soc(skip_idle=True)
+    blocks = sim.activity.blocks
+    assert len(blocks) == 6
+    for name, (n, skips) in blocks.items():
+        assert n + skips == 220
+        if 'counter' in name:
+            # reads its own output, which changes on each edge
+            assert skips == 0
+        else:
+            assert skips > 150
+    f = io.StringIO()
+    sim.activity.report(f)
+    assert 'skipped' in f.getvalue()
+
+
+@block
+def reg(q, d, clk):
+
+    @always_seq(clk.posedge, reset=None)
+    def logic():
+        q.next = d
+
+    return logic
+
+
+def run_order(data_first, **kwargs):
+    q = Signal(intbv(0)[8:])
+    d = Signal(intbv(0)[8:])
+    clk = Signal(bool(0))
+    log = []
+
+    @instance
+    def stimulus():
+        for i in range(12):
+            # the input changes after idle edges, in the same delta
+            # cycle as the clock edge
+            v = i // 3 + 1
+            if data_first:
+                d.next = v
+                clk.next = 1
+            else:
+                clk.next = 1
+                d.next = v
+            yield delay(5)
+            log.append(('q', int(q)))
+            clk.next = 0
+            yield delay(5)
+
+    sim = Simulation(reg(q, d, clk), stimulus, **kwargs)
+    sim.run(100, quiet=1)
+    sim.quit()
+    return log
+
+
+def test_order():
+    for data_first in (True, False):
+        log = run_order(data_first)
+        assert log[-1] == ('q', 4)
+        assert run_order(data_first, skip_idle=True) == log
+
+
+def test_restore(tmpdir):
+    q = Signal(intbv(0)[8:])
+    d = Signal(intbv(0)[8:])
+    clk = Signal(bool(0))
+    path = str(tmpdir.join('reg.ckpt'))
+    sim = Simulation(reg(q, d, clk), Clock(clk, 10), skip_idle=True)
+    d.next = 5
+    sim.run(100, quiet=1)
+    sim.checkpoint(path)
+    d.next = 7
+    sim.run(100, quiet=1)
+    assert q == 7
+    sim.restore(path)
+    assert q == 5
+    sim.run(100, quiet=1)
+    assert q == 5
+    assert list(sim.activity.blocks.values())[0][1] > 0
+    sim.quit()
+
+
+def test_args():
+    clk = Signal(bool(0))
+    with raises_kind(SimulationError, _error.CycleSkip):
+        Simulation(Clock(clk, 10), engine='cycle', skip_idle=True)
+    with raises_kind(SimulationError, _error.CycleSkip):
+        Simulation(Clock(clk, 10), lanes=2, skip_idle=True)
@@ -0,0 +1,108 @@
+from __future__ import absolute_import
+
+import pytest
+
+from myhdl import *
+from myhdl import SimulationError
+
+
+@block
+def incrementer(count, clk):
+
+    @always(clk.posedge)
+    def logic():
+        count.next = count + 1
+
+    return logic
+
+
+@block
+def bench(count):
+    clk = Signal(bool(0))
+    inc = incrementer(count, clk)
+    clkgen = Clock(clk, 10)
+    return inc, clkgen
+
+
+def test_run_until():
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count))
+    # the clock rises at 5, 15, ...
+    assert sim.run(until=(count, lambda v: v == 5), quiet=1) == 1
+    assert now() == 45
+    assert count == 5
+    assert sim.run(until=count, quiet=1) == 1
+    assert now() == 55
+    assert count == 6
+    # the until watchpoint is removed after the run
+    assert sim.run(100, quiet=1) == 1
+    assert now() == 155
+    sim.quit()
+
+
+def test_stop():
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count))
+    sim.watch(count, lambda v: v == 3, 'stop')
+    assert sim.run(quiet=1) == 0
+    assert now() == 25
+    with pytest.raises(StopSimulation):
+        sim.run(quiet=1)
+
+
+def test_callback():
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count))
+    sim.run(100, quiet=1)
+    activations = sim.activations
+    seen = []
+    wp = sim.watch(count, lambda v: v % 2 == 0,
+                   lambda sig: seen.append((now(), int(sig))))
+    sim.run(40, quiet=1)
+    # the watchpoint runs are not activations
+    assert sim.activations - activations == 4
+    assert seen == [(115, 12), (135, 14)]
+    assert wp.hits == 2
+    sim.unwatch(wp)
+    sim.run(40, quiet=1)
+    assert wp.hits == 2
+    sim.quit()
+
+
+def test_callback_stops():
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count))
+
+    def check(sig):
+        if sig == 4:
+            raise StopSimulation("count reached 4")
+
+    sim.watch(count, action=check)
+    assert sim.run(quiet=1) == 0
+    assert now() == 35
+
+
+def test_no_change():
+    count = Signal(modbv(0)[8:])
+    idle = Signal(bool(0))
+    sim = Simulation(bench(count))
+    wp = sim.watch(idle)
+    assert sim.run(100, quiet=1) == 1
+    assert now() == 100
+    assert wp.hits == 0
+    sim.quit()
+
+
+def test_errors():
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count))
+    with pytest.raises(SimulationError):
+        sim.watch(count, action='pause')
+    with pytest.raises(SimulationError):
+        sim.watch(count.posedge)
+    sim.quit()
+    count = Signal(modbv(0)[8:])
+    sim = Simulation(bench(count), engine='cycle')
+    with pytest.raises(SimulationError):
+        sim.watch(count)
+    sim.quit()
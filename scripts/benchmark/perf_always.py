@@ -0,0 +1,95 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare the generator and the direct-call processes of always blocks
+
+Usage: python perf_always.py [N]
+
+N always_seq registers, N always_comb adders and N edge-triggered always
+blocks run on the same Clock. They are simulated with the generator
+waiters that wrap the block functions, and with the processes that call
+the functions directly. The script reports the run times.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (Signal, ResetSignal, Simulation, Clock, modbv, always,
+                   always_seq, always_comb)
+
+CYCLES = 2000
+
+
+def stage(q, d, s, t, clock, reset):
+
+    @always_seq(clock.posedge, reset=reset)
+    def seq():
+        q.next = s
+
+    @always_comb
+    def comb():
+        s.next = d + 1
+
+    @always(clock.negedge)
+    def edge():
+        t.next = q
+
+    return seq, comb, edge
+
+
+def bench(n, direct):
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=1, isasync=False)
+    qs = [Signal(modbv(0)[8:]) for i in range(n + 1)]
+    ss = [Signal(modbv(0)[8:]) for i in range(n)]
+    ts = [Signal(modbv(0)[8:]) for i in range(n)]
+    insts = []
+    for i in range(n):
+        insts.extend(stage(qs[i + 1], qs[i], ss[i], ts[i], clock, reset))
+    if direct:
+        procs = insts
+    else:
+        procs = [inst.waiter for inst in insts]
+    return procs, Clock(clock, 10)
+
+
+def run(n, direct):
+    sim = Simulation(bench(n, direct))
+    start = time.time()
+    sim.run(CYCLES * 10, quiet=1)
+    elapsed = time.time() - start
+    activations = sim.activations
+    sim.quit()
+    return elapsed, activations
+
+
+def main(n):
+    print("stages: %d, cycles: %d" % (n, CYCLES))
+    for direct in (False, True):
+        elapsed, activations = run(n, direct)
+        print("%-12s %8.3f s %10d activations" %
+              (direct and "direct" or "generator", elapsed, activations))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    main(n)
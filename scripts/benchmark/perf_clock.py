@@ -0,0 +1,80 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare a generator clock with the native Clock
+
+Usage: python perf_clock.py [cycles]
+
+The timer design of timer.py is driven by a clock written as a
+generator, and by a Clock object.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, Clock, instance, delay
+
+from timer import timer_sig
+
+MAXVAL = 1234
+
+
+def bench(native):
+    clock = Signal(bool(0))
+    reset = Signal(bool(0))
+    flag = Signal(bool(0))
+
+    dut = timer_sig(flag, clock, reset, MAXVAL)
+
+    if native:
+        clkgen = Clock(clock, 20)
+    else:
+        @instance
+        def clkgen():
+            while 1:
+                yield delay(10)
+                clock.next = not clock
+
+    return dut, clkgen
+
+
+def run(native, cycles):
+    sim = Simulation(bench(native))
+    start = time.time()
+    sim.run(20 * cycles, quiet=1)
+    elapsed = time.time() - start
+    sim.quit()
+    return elapsed
+
+
+def main(cycles):
+    gen = run(False, cycles)
+    native = run(True, cycles)
+    print("cycles:     %d" % cycles)
+    print("generator:  %.3f s" % gen)
+    print("Clock:      %.3f s" % native)
+    print("speedup:    %.2f" % (gen / native))
+
+
+if __name__ == '__main__':
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    main(cycles)
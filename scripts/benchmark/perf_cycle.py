@@ -0,0 +1,126 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Compare event-driven and cycle-based simulation
+
+Usage: python perf_cycle.py [cycles]
+
+The timer, lfsr24 and findmax designs are clocked by a Clock object,
+with stimulus written as always_seq blocks, and simulated with both
+engines. The script checks that the designs end up in the same state.
+
+The timer and lfsr24 designs consist of a single sequential block, which
+runs at about the same speed with both engines; findmax has a tree of
+combinational blocks. The longdiv and randgen testbenches of
+perf_designs.py use @instance generators, and fall back to event-driven
+simulation.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import warnings
+
+from myhdl import Signal, ResetSignal, Simulation, Clock, intbv, modbv, \
+    always_seq, SimulationWarning
+
+from timer import timer_sig
+from lfsr24 import lfsr24
+from test_findmax import maxn
+from perf_designs import designs
+
+
+def bench_timer():
+    flag = Signal(bool(0))
+    clock = Signal(bool(0))
+    reset = Signal(bool(0))
+    dut = timer_sig(flag, clock, reset, 1234)
+    return dut, Clock(clock, 20), [flag]
+
+
+def bench_lfsr24():
+    lfsr = Signal(intbv(0)[24:])
+    enable = Signal(bool(1))
+    clock = Signal(bool(0))
+    reset = Signal(bool(0))
+    dut = lfsr24(lfsr, enable, clock, reset)
+    return dut, Clock(clock, 20), [lfsr]
+
+
+def bench_findmax():
+    L = 32
+    W = 16
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=1, isasync=False)
+    a = [Signal(intbv(0)[W:]) for i in range(L)]
+    z = Signal(intbv(0)[W:])
+    seed = Signal(modbv(1)[32:])
+
+    dut = maxn(z, a)
+
+    @always_seq(clock.posedge, reset=reset)
+    def stimulus():
+        seed.next = seed * 1103515245 + 12345
+        for i in range(L - 1):
+            a[i].next = a[i + 1]
+        a[L - 1].next = seed[32:32 - W]
+
+    return (dut, stimulus), Clock(clock, 20), [z, seed]
+
+
+benches = [('timer', bench_timer),
+           ('lfsr24', bench_lfsr24),
+           ('findmax', bench_findmax),
+           ]
+
+
+def run(bench, engine, cycles):
+    dut, clock, sigs = bench()
+    sim = Simulation(dut, clock, engine=engine)
+    start = time.time()
+    sim.run(20 * cycles, quiet=1)
+    elapsed = time.time() - start
+    state = [int(s) for s in sigs]
+    sim.quit()
+    return elapsed, state
+
+
+def main(cycles):
+    print("cycles: %d" % cycles)
+    print("%10s %10s %10s %10s" % ("design", "event", "cycle", "speedup"))
+    for name, bench in benches:
+        event, expected = run(bench, 'event', cycles)
+        cycle, state = run(bench, 'cycle', cycles)
+        assert state == expected, name
+        print("%10s %10.3f %10.3f %10.2f" % (name, event, cycle,
+                                             event / cycle))
+    for name, bench in designs:
+        if name in dict(benches):
+            continue
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always', SimulationWarning)
+            sim = Simulation(bench(), engine='cycle')
+        sim.quit()
+        print("%10s %s" % (name, w[0].message if w else sim.engine))
+
+
+if __name__ == '__main__':
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    main(cycles)
@@ -0,0 +1,76 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Testbenches of the benchmark designs, for use by the perf scripts
+
+Each entry of 'designs' maps a design name to a function that returns
+the testbench instances of that design. The testbenches are those of
+the test_<name>.py scripts, with printing removed where applicable.
+"""
+from __future__ import absolute_import
+
+from myhdl import Signal, intbv, delay, instance
+
+from timer import timer_sig
+from random_generator import random_generator
+from test_timer import test_timer
+from test_lfsr24 import test_lfsr24
+from test_longdiv import test_longdiv
+from test_findmax import test_findmax
+
+
+def bench_timer():
+    return test_timer(timer_sig)
+
+
+def bench_randgen():
+
+    random_word = Signal(intbv(0)[31:])
+    enable = Signal(bool())
+    clock = Signal(bool())
+    reset = Signal(bool())
+
+    dut = random_generator(random_word, enable, clock, reset)
+
+    @instance
+    def stimulus():
+        enable.next = 0
+        clock.next = 0
+        reset.next = 0
+        yield delay(10)
+        reset.next = 1
+        yield delay(10)
+        reset.next = 0
+        enable.next = 1
+        for i in range(2**20):
+            yield delay(10)
+            clock.next = 1
+            yield delay(10)
+            clock.next = 0
+
+    return dut, stimulus
+
+
+designs = [('timer', bench_timer),
+           ('lfsr24', test_lfsr24),
+           ('longdiv', test_longdiv),
+           ('findmax', test_findmax),
+           ('randgen', bench_randgen),
+           ]
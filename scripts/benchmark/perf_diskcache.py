@@ -0,0 +1,80 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Measure the elaboration time with a cold and a warm on-disk cache
+
+Usage: python perf_diskcache.py
+
+Each design of perf_designs.py, and the many-instance design of
+perf_elaborate.py, is elaborated in a fresh process: without the
+on-disk cache, with an empty cache directory, and again with the cache
+that the previous run filled. The script reports the elaboration times.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from perf_designs import designs
+
+_child = """
+import sys
+import time
+import perf_designs
+import perf_elaborate
+start = time.time()
+if %(name)r == 'many':
+    perf_elaborate.top(1000)
+else:
+    dict(perf_designs.designs)[%(name)r]()
+print(time.time() - start)
+"""
+
+
+def elaborate(name, cachedir):
+    env = dict(os.environ)
+    env.pop('MYHDL_CACHE_DIR', None)
+    if cachedir is not None:
+        env['MYHDL_CACHE_DIR'] = cachedir
+    out = subprocess.check_output([sys.executable, '-c', _child % locals()],
+                                  env=env, cwd=os.path.dirname(
+                                      os.path.abspath(__file__)))
+    return float(out.split()[-1])
+
+
+def main():
+    print("%-12s %10s %10s %10s" % ("design", "no cache", "cold", "warm"))
+    for name in [d[0] for d in designs] + ['many']:
+        cachedir = tempfile.mkdtemp()
+        try:
+            t0 = elaborate(name, None)
+            t1 = elaborate(name, cachedir)
+            t2 = elaborate(name, cachedir)
+        finally:
+            shutil.rmtree(cachedir)
+        print("%-12s %8.4f s %8.4f s %8.4f s" % (name, t0, t1, t2))
+
+
+if __name__ == '__main__':
+    main()
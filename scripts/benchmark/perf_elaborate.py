@@ -0,0 +1,115 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Measure the elaboration time of many identical instances
+
+Usage: python perf_elaborate.py [N]
+
+A block with N instances of the same always_seq, always_comb and
+instance bodies is elaborated with the source analysis caches, and
+with lookups that always miss, which is the cost without the caches.
+The script reports the elaboration time and the cache statistics.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (block, instance, always_seq, always_comb, Signal,
+                   ResetSignal, modbv)
+from myhdl._cache import _Cache, _clearCaches
+from myhdl.debug import print_cache_stats
+
+
+@block
+def cell(q, d, en, clock, reset):
+
+    @always_seq(clock.posedge, reset=reset)
+    def seq():
+        if en:
+            q.next = d
+
+    return seq
+
+
+@block
+def adder(s, a, b):
+
+    @always_comb
+    def comb():
+        s.next = a + b
+
+    return comb
+
+
+@block
+def monitor(s, clock):
+
+    @instance
+    def watch():
+        while 1:
+            yield clock.posedge
+            if s == 0:
+                pass
+
+    return watch
+
+
+@block
+def top(n):
+    clock = Signal(bool(0))
+    reset = ResetSignal(0, active=1, isasync=True)
+    en = Signal(bool(1))
+    qs = [Signal(modbv(0)[8:]) for i in range(n + 1)]
+    ss = [Signal(modbv(0)[8:]) for i in range(n)]
+    insts = []
+    for i in range(n):
+        insts.append(cell(qs[i + 1], ss[i], en, clock, reset))
+        insts.append(adder(ss[i], qs[i], qs[i + 1]))
+        insts.append(monitor(ss[i], clock))
+    return insts
+
+
+def elaborate(n):
+    _clearCaches()
+    start = time.time()
+    top(n)
+    return time.time() - start
+
+
+def main(n):
+    cached = elaborate(n)
+    print("instances of each kind: %d" % n)
+    print("with caches:      %.3f s" % cached)
+    print_cache_stats()
+    lookup = _Cache.lookup
+    _Cache.lookup = lambda self, key: None
+    try:
+        uncached = elaborate(n)
+    finally:
+        _Cache.lookup = lookup
+    print()
+    print("without caches:   %.3f s" % uncached)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    main(n)
@@ -0,0 +1,109 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Benchmark the cost of the future event queue
+
+Usage: python perf_eventqueue.py [N ...]
+
+For each number of pending events N, the script measures:
+
+queue -- schedule N events at random times and drain the queue
+legacy -- the same with the former sorted list (only for small N,
+          as draining it is quadratic)
+sim -- a Simulation with N processes that each wait on random delays
+
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import random
+from operator import itemgetter
+from random import randrange
+
+from myhdl import Simulation, StopSimulation, delay, instance
+from myhdl._simulator import _EventQueue
+
+random.seed(1)  # random, but deterministic
+
+LEGACY_MAX = 20000
+STEPS = 5
+
+
+def bench_queue(n):
+    times = [randrange(1, 10 * n) for i in range(n)]
+    q = _EventQueue()
+    start = time.time()
+    for t in times:
+        q.schedule(t, None)
+    while q:
+        q.pop()
+    return time.time() - start
+
+
+def bench_legacy(n):
+    times = [randrange(1, 10 * n) for i in range(n)]
+    q = []
+    start = time.time()
+    for t in times:
+        q.append((t, None))
+    while q:
+        q.sort(key=itemgetter(0))
+        t = q[0][0]
+        while q and q[0][0] == t:
+            del q[0]
+    return time.time() - start
+
+
+def waiter(n):
+    for i in range(STEPS):
+        yield delay(randrange(1, 10 * n))
+
+
+def bench_sim(n):
+
+    procs = [waiter(n) for i in range(n)]
+
+    @instance
+    def stop():
+        yield delay(10 * n * STEPS)
+        raise StopSimulation()
+
+    sim = Simulation(procs, stop)
+    start = time.time()
+    sim.run(quiet=1)
+    return time.time() - start
+
+
+def main(sizes):
+    print("%10s %10s %10s %10s" % ("N", "queue", "legacy", "sim"))
+    for n in sizes:
+        q = bench_queue(n)
+        if n <= LEGACY_MAX:
+            legacy = "%10.3f" % bench_legacy(n)
+        else:
+            legacy = "%10s" % "-"
+        s = bench_sim(n)
+        print("%10d %10.3f %s %10.3f" % (n, q, legacy, s))
+
+
+if __name__ == '__main__':
+    sizes = [int(a) for a in sys.argv[1:]] or [10000, 100000, 1000000]
+    main(sizes)
@@ -0,0 +1,120 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Measure the fan-out of a clock to many processes
+
+Usage: python perf_fanout.py [N]
+
+In the clocked configuration, one clock drives N always blocks and N
+instances that wait on its rising edge. In the idle configuration, 2*N
+instances wait on an enable that does not change. In both, a few
+monitors wait on the clock edge or the enable, which leaves a stale
+subscription in a waiter list each time a monitor runs. The script
+reports the run times.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, Clock, always, instance, intbv
+
+CYCLES = 200
+MONITORS = 10
+
+
+def reg(q, d, clock):
+
+    @always(clock.posedge)
+    def logic():
+        q.next = d
+
+    return logic
+
+
+def counter(count, clock):
+
+    @instance
+    def logic():
+        while 1:
+            yield clock.posedge
+            count.next = count + 1
+
+    return logic
+
+
+def idle(en):
+
+    @instance
+    def logic():
+        while 1:
+            yield en
+
+    return logic
+
+
+def monitor(en, clock):
+
+    @instance
+    def logic():
+        events = (clock.posedge, en)
+        while 1:
+            yield events
+
+    return logic
+
+
+def bench(n, clocked):
+    clock = Signal(bool(0))
+    en = Signal(bool(0))
+    d = Signal(bool(1))
+    insts = [Clock(clock, 10)]
+    for i in range(n):
+        if clocked:
+            insts.append(reg(Signal(bool(0)), d, clock))
+            insts.append(counter(Signal(intbv(0, min=0, max=2**16)), clock))
+        else:
+            insts.append(idle(en))
+            insts.append(idle(en))
+    for i in range(MONITORS):
+        insts.append(monitor(en, clock))
+    return insts
+
+
+def run(n, clocked):
+    sim = Simulation(bench(n, clocked))
+    start = time.time()
+    sim.run(CYCLES * 10, quiet=1)
+    elapsed = time.time() - start
+    sim.quit()
+    return elapsed
+
+
+def main(n):
+    print("processes: %d, cycles: %d" % (2 * n + MONITORS, CYCLES))
+    for clocked in (True, False):
+        print("%-8s %8.3f s" % (clocked and "clocked" or "idle",
+                                run(n, clocked)))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    main(n)
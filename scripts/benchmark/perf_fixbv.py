@@ -0,0 +1,107 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Measure the simulation speed of a fixbv FIR filter
+
+Usage: python perf_fixbv.py [N]
+
+A direct form FIR filter with N taps on Q15 fixbv samples: a shift
+register of the samples, a multiplier per tap and a chain of adders.
+Nearly all signals carry fixbv values. The script reports the run time
+and the number of signal updates per second.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (Signal, Simulation, Clock, always, always_comb,
+                   modbv)
+from myhdl._fixbv import fixbv
+
+CYCLES = 1000
+
+
+def q15(v=0):
+    return fixbv(v, shift=-15, min=-2**15, max=2**15)
+
+
+def q30(v=0):
+    return fixbv(v, shift=-30, min=-2**35, max=2**35)
+
+
+def source(x, clock):
+    lfsr = Signal(modbv(1)[16:])
+
+    @always(clock.posedge)
+    def gen():
+        lfsr.next = lfsr[15:] << 1 | (lfsr[15] ^ lfsr[13] ^ lfsr[12] ^ lfsr[10])
+        x.next = q15(lfsr.signed())
+
+    return gen
+
+
+def tap(t, d, p, s, sn, coef, clock):
+
+    @always(clock.posedge)
+    def shift():
+        t.next = d
+
+    @always_comb
+    def mul():
+        p.next = t * coef
+
+    @always_comb
+    def add():
+        sn.next = s + p
+
+    return shift, mul, add
+
+
+def bench(n):
+    clock = Signal(bool(0))
+    x = Signal(q15())
+    ts = [x] + [Signal(q15()) for i in range(n)]
+    ps = [Signal(q30()) for i in range(n)]
+    ss = [Signal(q30()) for i in range(n + 1)]
+    coefs = [q15((i * 7919) % 2**15 - 2**14) for i in range(n)]
+    insts = [source(x, clock), Clock(clock, 10)]
+    for i in range(n):
+        insts.extend(tap(ts[i + 1], ts[i], ps[i], ss[i], ss[i + 1],
+                         coefs[i], clock))
+    return insts
+
+
+def main(n):
+    sim = Simulation(bench(n))
+    start = time.time()
+    sim.run(CYCLES * 10, quiet=1)
+    elapsed = time.time() - start
+    sim.quit()
+    # per cycle: each tap, product and sum changes once, besides the clock
+    updates = CYCLES * (3 * n + 2)
+    print("taps: %d, cycles: %d" % (n, CYCLES))
+    print("%8.3f s %12.0f updates/s" % (elapsed, updates / elapsed))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    main(n)
@@ -0,0 +1,120 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+
+""" Compare rerunning a preamble per scenario with forking after it
+
+Usage: python perf_fork.py [N]
+
+A generator testbench drives a chain of registers through a long
+preamble, and then N scenarios, each with its own stimulus, for a
+shorter tail. The scenarios are run once by rebuilding the simulation
+and rerunning the preamble for each of them, and once with
+fork_scenarios after a single preamble. The script reports the run
+times, and checks that the results agree.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, Clock, modbv, always, instance
+
+STAGES = 50
+PREAMBLE = 4000
+TAIL = 1000
+
+
+def bench(mode):
+    clock = Signal(bool(0))
+    qs = [Signal(modbv(0)[16:]) for i in range(STAGES + 1)]
+
+    def stage(q, d):
+        @always(clock.posedge)
+        def reg():
+            q.next = d + 1
+        return reg
+
+    @instance
+    def stimulus():
+        # a generator: its state can not be checkpointed
+        i = 0
+        while 1:
+            yield clock.negedge
+            i += 1
+            qs[0].next = i * mode[0]
+
+    regs = [stage(qs[i + 1], qs[i]) for i in range(STAGES)]
+    return (regs, stimulus, Clock(clock, 10)), qs[-1]
+
+
+def scenario(mode, n):
+    def run(sim):
+        mode[0] = n
+        sim.run(TAIL * 10, quiet=1)
+        return int(run.out)
+    return run
+
+
+def rerun(n):
+    results = []
+    for i in range(n):
+        mode = [1]
+        insts, out = bench(mode)
+        sim = Simulation(insts)
+        sim.run(PREAMBLE * 10, quiet=1)
+        s = scenario(mode, i + 2)
+        s.out = out
+        results.append(s(sim))
+        sim.quit()
+    return results
+
+
+def fork(n):
+    mode = [1]
+    insts, out = bench(mode)
+    sim = Simulation(insts)
+    sim.run(PREAMBLE * 10, quiet=1)
+    scenarios = []
+    for i in range(n):
+        s = scenario(mode, i + 2)
+        s.out = out
+        scenarios.append(s)
+    results = sim.fork_scenarios(scenarios)
+    sim.quit()
+    return results
+
+
+def main(n):
+    print("scenarios: %d, preamble: %d, tail: %d cycles" %
+          (n, PREAMBLE, TAIL))
+    outcomes = []
+    for f in (rerun, fork):
+        start = time.time()
+        results = f(n)
+        outcomes.append(results)
+        print("%-8s %8.3f s" % (f.__name__, time.time() - start))
+    assert outcomes[0] == outcomes[1]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    main(n)
@@ -0,0 +1,128 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare separate simulations with a batched simulation
+
+Usage: python perf_lanes.py [N]
+
+Two designs are simulated for N independent stimulus vectors: a
+pipeline of mixing stages without data-dependent control flow, and a
+GCD unit whose branches depend on the data, so that the lanes diverge.
+Each design is run once as N separate simulations, and once as a
+single simulation with lanes=N. The script reports the run times and
+the speedup, and checks that the results agree.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import random
+
+from myhdl import (Signal, ResetSignal, Simulation, Clock, intbv, modbv,
+                   always, always_seq, instance)
+
+STAGES = 8
+CYCLES = 300
+
+
+def mixer(seed, lanes):
+    clk = Signal(bool(0))
+    qs = [Signal(modbv(0)[32:]) for i in range(STAGES + 1)]
+
+    def stage(q, d):
+        @always(clk.posedge)
+        def logic():
+            q.next = (d ^ (d << 3)) + 0x9e37
+        return logic
+
+    stages = [stage(qs[i + 1], qs[i]) for i in range(STAGES)]
+    sim = Simulation(stages, Clock(clk, 10), lanes=lanes)
+    qs[0].next = seed
+    return sim, qs[-1]
+
+
+def gcd(seed, lanes):
+    a, b = seed
+    clk = Signal(bool(0))
+    x, y = Signal(intbv(0)[16:]), Signal(intbv(0)[16:])
+    start = Signal(bool(1))
+    rst = ResetSignal(0, active=1, isasync=False)
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        if start:
+            x.next = a
+            y.next = b
+        elif x != y:
+            if x > y:
+                x.next = x - y
+            else:
+                y.next = y - x
+
+    @instance
+    def stimulus():
+        yield clk.negedge
+        start.next = 0
+
+    sim = Simulation(logic, stimulus, Clock(clk, 10), lanes=lanes)
+    return sim, x
+
+
+def run(design, seed, lanes):
+    sim, out = design(seed, lanes)
+    sim.run(CYCLES * 10, quiet=1)
+    if lanes is None:
+        values = [int(out)]
+    else:
+        values = out.val.tolist()
+    sim.quit()
+    return values
+
+
+def main(n):
+    random.seed(1)
+    seeds = {
+        mixer: [random.randrange(2**32) for i in range(n)],
+        gcd: [(random.randrange(1, 1000), random.randrange(1, 1000))
+              for i in range(n)]
+    }
+    print("lanes: %d, cycles: %d" % (n, CYCLES))
+    for design in (mixer, gcd):
+        start = time.time()
+        separate = []
+        for seed in seeds[design]:
+            separate.extend(run(design, seed, None))
+        t1 = time.time() - start
+        start = time.time()
+        if design is gcd:
+            seed = ([s[0] for s in seeds[gcd]], [s[1] for s in seeds[gcd]])
+        else:
+            seed = seeds[design]
+        batched = run(design, seed, n)
+        t2 = time.time() - start
+        assert batched == separate
+        print("%-6s separate %8.3f s  batched %8.3f s  speedup %6.1f" %
+              (design.__name__, t1, t2, t1 / t2))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    main(n)
@@ -0,0 +1,91 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare a free running clock with a lazy clock in a mostly idle design
+
+Usage: python perf_lazyclock.py [N]
+
+A slow peripheral model, driven by delays, signals that data is ready
+every N time units. A testbench process then transfers a burst of words
+on a fast clock, and waits for the next ready. The script reports the
+run times and the time steps.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, Clock, instance, delay, modbv
+
+BURSTS = 50
+WORDS = 16
+
+
+def peripheral(ready, n):
+
+    @instance
+    def model():
+        while 1:
+            yield delay(n)
+            ready.next = not ready
+
+    return model
+
+
+def transfer(data, ready, clock):
+
+    @instance
+    def logic():
+        while 1:
+            yield ready
+            for i in range(WORDS):
+                yield clock.posedge
+                data.next = data + 1
+
+    return logic
+
+
+def run(n, lazy):
+    clock = Signal(bool(0))
+    ready = Signal(bool(0))
+    data = Signal(modbv(0)[16:])
+    sim = Simulation(Clock(clock, 2, lazy=lazy), peripheral(ready, n),
+                     transfer(data, ready, clock))
+    start = time.time()
+    sim.run(BURSTS * n + n // 2, quiet=1)
+    elapsed = time.time() - start
+    timesteps = sim.timesteps
+    assert data == BURSTS * WORDS
+    sim.quit()
+    return elapsed, timesteps
+
+
+def main(n):
+    print("bursts: %d, interval: %d" % (BURSTS, n))
+    for lazy in (False, True):
+        elapsed, timesteps = run(n, lazy)
+        print("%-8s %8.3f s %10d timesteps" %
+              (lazy and "lazy" or "free", elapsed, timesteps))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    main(n)
@@ -0,0 +1,96 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+""" Measure the effect of levelizing always_comb blocks
+
+Usage: python perf_levelize.py [cycles]
+
+Each design is simulated with and without levelization. The script
+reports the process activations per time step, and the run time.
+Besides the designs of perf_designs.py, there is a clocked variant of
+findmax, and a ripple chain of always_comb blocks.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, Clock, modbv, always, always_comb
+
+from perf_designs import designs
+from perf_cycle import bench_findmax
+
+
+def bench_findmax_clocked():
+    dut, clock, sigs = bench_findmax()
+    return dut, clock
+
+
+def stage(b, a, count):
+
+    @always_comb
+    def logic():
+        b.next = a + count
+
+    return logic
+
+
+def bench_chain(n=16):
+    """ A ripple chain, in which each stage also reads the counter """
+    clock = Signal(bool(0))
+    count = Signal(modbv(0)[16:])
+    sigs = [Signal(modbv(0)[16:]) for i in range(n + 1)]
+    stages = [stage(sigs[i + 1], sigs[i], count) for i in range(n)]
+
+    @always(clock.posedge)
+    def counter():
+        count.next = count + 1
+        sigs[0].next = count
+
+    return stages, counter, Clock(clock, 20)
+
+
+benches = designs + [('findmax/clk', bench_findmax_clocked),
+                     ('chain', bench_chain)]
+
+
+def run(bench, levelize, duration):
+    sim = Simulation(bench(), levelize=levelize)
+    start = time.time()
+    sim.run(duration, quiet=1)
+    elapsed = time.time() - start
+    rate = float(sim.activations) / sim.timesteps
+    sim.quit()
+    return rate, elapsed
+
+
+def main(cycles):
+    print("%12s %12s %12s %10s %10s" %
+          ("design", "act/step", "levelized", "time", "levelized"))
+    for name, bench in benches:
+        rate, elapsed = run(bench, False, 20 * cycles)
+        lrate, lelapsed = run(bench, True, 20 * cycles)
+        print("%12s %12.2f %12.2f %10.3f %10.3f" %
+              (name, rate, lrate, elapsed, lelapsed))
+
+
+if __name__ == '__main__':
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    main(cycles)
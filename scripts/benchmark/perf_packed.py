@@ -0,0 +1,135 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare separate, batched and packed simulations of single-bit logic
+
+Usage: python perf_packed.py [N]
+
+Two designs are simulated for N independent test instances: the 24 bit
+LFSR of lfsr24.py, from N seeds, and a random scrambler network of xor
+gates, as in the randscrambler conversion test, with N random input
+sequences. Each design is run as N separate simulations, as a batched
+simulation with lanes=N, and as a packed simulation with lanes=N and
+packed=True. The script reports the run times, and checks that the
+results agree.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import random
+
+from myhdl import Signal, Simulation, Clock, modbv, instance, delay
+
+from lfsr24 import lfsr24
+
+CYCLES = 200
+WIDTH = 8
+DEPTH = 6
+
+
+def lfsr(seeds, lanes, packed):
+    reg = Signal(modbv(0)[24:])
+    enable, clock, reset = [Signal(bool(0)) for i in range(3)]
+    sim = Simulation(lfsr24(reg, enable, clock, reset), Clock(clock, 10),
+                     lanes=lanes, packed=packed)
+    reg.next = seeds
+    enable.next = 1
+    sim.run(CYCLES * 10, quiet=1)
+    return sim, [reg]
+
+
+def xor3(z, a, b, c):
+    @instance
+    def logic():
+        while 1:
+            yield a, b, c
+            z.next = a ^ b ^ c
+    return logic
+
+
+def scrambler(inputs, lanes, packed):
+    rnd = random.Random(2)
+    layers = [[Signal(bool(0)) for i in range(WIDTH)]
+              for d in range(DEPTH + 1)]
+    gates = []
+    for d in range(DEPTH):
+        il, ol = layers[d], layers[d + 1]
+        for i in range(WIDTH):
+            j, k = rnd.sample([m for m in range(WIDTH) if m != i], 2)
+            gates.append(xor3(ol[i], il[i], il[j], il[k]))
+
+    @instance
+    def stimulus():
+        for vector in inputs:
+            yield delay(10)
+            for b, s in enumerate(layers[0]):
+                s.next = vector[b]
+        yield delay(10)
+
+    sim = Simulation(gates, stimulus, lanes=lanes, packed=packed)
+    sim.run(CYCLES * 10 + 5, quiet=1)
+    return sim, layers[-1]
+
+
+def run(design, stimulus, lanes=None, packed=False):
+    sim, outs = design(stimulus, lanes, packed)
+    if lanes is None:
+        values = [[int(s)] for s in outs]
+    else:
+        values = [s.val.tolist() for s in outs]
+    sim.quit()
+    return values
+
+
+def main(n):
+    rnd = random.Random(1)
+    seeds = [rnd.randrange(1, 2**24) for i in range(n)]
+    vectors = [[rnd.randrange(2**WIDTH) for i in range(CYCLES)]
+               for k in range(n)]
+    print("instances: %d, cycles: %d" % (n, CYCLES))
+    for design in (lfsr, scrambler):
+        if design is lfsr:
+            single = seeds
+            lanes = seeds
+        else:
+            single = [[[(v >> b) & 1 for b in range(WIDTH)] for v in seq]
+                      for seq in vectors]
+            lanes = [[[(seq[c] >> b) & 1 for seq in vectors]
+                      for b in range(WIDTH)] for c in range(CYCLES)]
+        start = time.time()
+        separate = [[] for s in design(single[0], None, False)[1]]
+        for stimulus in single:
+            for l, v in zip(separate, run(design, stimulus)):
+                l.extend(v)
+        times = [time.time() - start]
+        for packed in (False, True):
+            start = time.time()
+            values = run(design, lanes, n, packed)
+            times.append(time.time() - start)
+            assert [[int(v) for v in l] for l in values] == separate
+        print("%-9s separate %7.3f s  batched %7.3f s  packed %7.3f s" %
+              ((design.__name__,) + tuple(times)))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    main(n)
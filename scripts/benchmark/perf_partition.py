@@ -0,0 +1,92 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare a single process simulation with a partitioned one
+
+Usage: python perf_partition.py [N]
+
+The design has N clock domains with unrelated periods. Each domain is
+a chain of registers, and its input is synchronized from the output of
+the previous domain. The simulation is run once in a single process,
+and once with partitions='auto', that runs each domain in a process of
+its own. The script reports the run times and the number of CPUs, and
+checks that the final signal values agree. The partitioned run only
+pays off with several CPUs.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+import multiprocessing
+
+from myhdl import Signal, Simulation, Clock, modbv, always
+
+STAGES = 200
+DURATION = 20000
+
+
+def stage(q, d, clock):
+    @always(clock.posedge)
+    def reg():
+        q.next = d + 1
+    return reg
+
+
+def bench(n):
+    insts = []
+    outs = []
+    prev = None
+    for k in range(n):
+        clock = Signal(bool(0))
+        qs = [Signal(modbv(0)[16:]) for i in range(STAGES + 1)]
+        if prev is not None:
+            # synchronize the output of the previous domain
+            insts.append(stage(qs[0], prev, clock))
+        insts.extend(stage(qs[i + 1], qs[i], clock) for i in range(STAGES))
+        insts.append(Clock(clock, 10 + 2 * k))
+        prev = qs[-1]
+        outs.append(qs[-1])
+    return insts, outs
+
+
+def run(n, partitions):
+    insts, outs = bench(n)
+    sim = Simulation(insts, partitions=partitions)
+    sim.run(DURATION, quiet=1)
+    values = [int(s) for s in outs]
+    sim.quit()
+    return values
+
+
+def main(n):
+    print("domains: %d, stages: %d, duration: %d, cpus: %d" %
+          (n, STAGES, DURATION, multiprocessing.cpu_count()))
+    outcomes = []
+    for name, partitions in (('single', None), ('auto', 'auto')):
+        start = time.time()
+        outcomes.append(run(n, partitions))
+        print("%-8s %8.3f s" % (name, time.time() - start))
+    assert outcomes[0] == outcomes[1]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    main(n)
@@ -0,0 +1,91 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+
+""" Compare monitors that run in the delta cycles and in the postponed region
+
+Usage: python perf_postponed.py [N]
+
+A chain of N always_comb incrementers is driven by a counter on a Clock.
+A monitor is sensitive to all the signals of the chain. It runs in every
+delta cycle in which one of them changes, or once per time step when it is
+marked as postponed. The script reports the run times and the number of
+monitor calls.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (Signal, Simulation, Clock, modbv, always, always_comb,
+                   postponed)
+
+CYCLES = 2000
+
+
+def incrementer(q, d):
+
+    @always_comb
+    def comb():
+        q.next = d + 1
+
+    return comb
+
+
+def bench(n, mark, calls):
+    clock = Signal(bool(0))
+    sigs = [Signal(modbv(0)[8:]) for i in range(n + 1)]
+
+    @always(clock.posedge)
+    def count():
+        sigs[0].next = sigs[0] + 1
+
+    @always(*sigs)
+    def monitor():
+        calls.append(sigs[-1].val)
+
+    insts = [incrementer(sigs[i + 1], sigs[i]) for i in range(n)]
+    if mark:
+        postponed(monitor)
+    return count, insts, monitor, Clock(clock, 10)
+
+
+def run(n, mark):
+    calls = []
+    sim = Simulation(bench(n, mark, calls))
+    start = time.time()
+    sim.run(CYCLES * 10, quiet=1)
+    elapsed = time.time() - start
+    sim.quit()
+    return elapsed, len(calls)
+
+
+def main(n):
+    print("chain: %d, cycles: %d" % (n, CYCLES))
+    for mark in (False, True):
+        elapsed, calls = run(n, mark)
+        print("%-10s %8.3f s %10d monitor calls" %
+              (mark and "postponed" or "delta", elapsed, calls))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    main(n)
@@ -0,0 +1,59 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare the future event queue schedulers on the benchmark designs
+
+Usage: python perf_scheduler.py [duration]
+
+Each design of perf_designs.py is simulated for the given duration
+(default 200000 time units) with each scheduler.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Simulation
+from myhdl._simulator import _schedulers
+
+from perf_designs import designs
+
+
+def bench(design, scheduler, duration):
+    sim = Simulation(design(), scheduler=scheduler)
+    start = time.time()
+    sim.run(duration, quiet=1)
+    elapsed = time.time() - start
+    sim.quit()
+    return elapsed
+
+
+def main(duration):
+    names = sorted(_schedulers)
+    print("%-10s" % "design" + "".join("%10s" % n for n in names))
+    for name, design in designs:
+        times = [bench(design, n, duration) for n in names]
+        print("%-10s" % name + "".join("%10.3f" % t for t in times))
+
+
+if __name__ == '__main__':
+    duration = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    main(duration)
@@ -0,0 +1,85 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+
+""" Time slice and concatenation shadow signals of wide buses
+
+Usage: python perf_shadow.py [N]
+
+A bus of N 8-bit fields is sliced into N slice signals, and reassembled
+from them by a ConcatSignal. Each clock cycle, a counter block updates the
+bus, and an always_comb block per field reads its slice. A final block
+compares the concatenation with the bus. The script reports the run time
+and the process activations.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (Signal, ConcatSignal, Simulation, Clock, modbv, intbv,
+                   always, always_comb)
+
+CYCLES = 1000
+
+
+def field(q, d):
+
+    @always_comb
+    def comb():
+        q.next = d
+
+    return comb
+
+
+def bench(n):
+    clock = Signal(bool(0))
+    bus = Signal(modbv(0)[8 * n:])
+    slices = [bus(8 * i + 8, 8 * i) for i in reversed(range(n))]
+    whole = ConcatSignal(*slices)
+    outs = [Signal(intbv(0)[8:]) for i in range(n)]
+    step = sum(i << 8 * i for i in range(1, n + 1))
+
+    @always(clock.posedge)
+    def count():
+        bus.next = bus + step
+
+    @always(clock.negedge)
+    def check():
+        assert whole == bus
+
+    insts = [field(q, d) for q, d in zip(outs, slices)]
+    return count, check, insts, Clock(clock, 10)
+
+
+def main(n):
+    print("fields: %d, cycles: %d" % (n, CYCLES))
+    sim = Simulation(bench(n))
+    start = time.time()
+    sim.run(CYCLES * 10, quiet=1)
+    elapsed = time.time() - start
+    print("%8.3f s %10d activations" % (elapsed, sim.activations))
+    sim.quit()
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    main(n)
@@ -0,0 +1,101 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Benchmark the pending signal update list with bitwise assignments
+
+Usage: python perf_siglist.py [N]
+
+N processes each build a 32-bit word with one 'next' access per bit
+on every clock edge. The script reports the number of 'next' accesses,
+which is the number of _update calls the former append-only siglist
+made, and the number of _update calls actually made.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import Signal, Simulation, intbv, always, instance, delay
+from myhdl._Signal import _Signal
+
+W = 32
+CYCLES = 1000
+
+counts = {'next': 0, 'update': 0}
+
+
+def bitwise(dout, din, clock):
+
+    @always(clock.posedge)
+    def logic():
+        for i in range(W):
+            dout.next[i] = din[(i + 1) % W]
+        counts['next'] += W
+
+    return logic
+
+
+def bench(n):
+    clock = Signal(bool(0))
+    words = [Signal(intbv(i)[W:]) for i in range(n + 1)]
+    insts = [bitwise(words[i + 1], words[i], clock) for i in range(n)]
+
+    @instance
+    def clkgen():
+        for i in range(2 * CYCLES):
+            yield delay(10)
+            clock.next = not clock
+
+    return insts, clkgen
+
+
+def counted(update):
+
+    def counted_update(self):
+        counts['update'] += 1
+        return update(self)
+
+    return counted_update
+
+
+def main(n):
+    # the signals bind the update method of their value type when they
+    # are constructed
+    saved = _Signal._updateBool, _Signal._updateIntbv
+    _Signal._updateBool = counted(_Signal._updateBool)
+    _Signal._updateIntbv = counted(_Signal._updateIntbv)
+    try:
+        sim = Simulation(bench(n))
+        start = time.time()
+        sim.run(quiet=1)
+        elapsed = time.time() - start
+    finally:
+        _Signal._updateBool, _Signal._updateIntbv = saved
+    print("processes:          %d" % n)
+    print("cycles:             %d" % CYCLES)
+    print("next accesses:      %d" % counts['next'])
+    print("_update calls:      %d" % counts['update'])
+    print("time:               %.3f s" % elapsed)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    main(n)
@@ -0,0 +1,142 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+
+""" Measure the skipping of idle always_seq blocks
+
+Usage: python perf_skip.py [N]
+
+A system with N peripherals, each a FIFO and a timer in always_seq blocks
+on a common clock, is simulated with and without skip_idle. A host
+process addresses one peripheral at a time, so that the others are idle.
+The script reports the run times and the skip ratio, and checks that the
+results agree.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (block, always_seq, instance, Signal, ResetSignal,
+                   Simulation, Clock, intbv, modbv)
+
+CYCLES = 2000
+DEPTH = 8
+BURST = 20
+
+
+@block
+def fifo(dout, din, wr, rd, clk, rst):
+    mem = [Signal(intbv(0)[8:]) for i in range(DEPTH)]
+    wptr = Signal(intbv(0, min=0, max=DEPTH))
+    rptr = Signal(intbv(0, min=0, max=DEPTH))
+    count = Signal(intbv(0, min=0, max=DEPTH + 1))
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        if wr and count < DEPTH:
+            mem[wptr].next = din
+            wptr.next = (wptr + 1) % DEPTH
+        if rd and count > 0:
+            dout.next = mem[rptr]
+            rptr.next = (rptr + 1) % DEPTH
+        count.next = count + (wr and count < DEPTH) - (rd and count > 0)
+
+    return logic
+
+
+@block
+def timer(expired, load, en, clk, rst):
+    cnt = Signal(modbv(0)[16:])
+
+    @always_seq(clk.posedge, reset=rst)
+    def logic():
+        if load:
+            cnt.next = 100
+        elif en and cnt != 0:
+            cnt.next = cnt - 1
+        expired.next = en and cnt == 0
+
+    return logic
+
+
+@block
+def system(outs, expired, clk, rst, n):
+    din = Signal(intbv(0)[8:])
+    wrs = [Signal(bool(0)) for i in range(n)]
+    rds = [Signal(bool(0)) for i in range(n)]
+    loads = [Signal(bool(0)) for i in range(n)]
+    ens = [Signal(bool(0)) for i in range(n)]
+    insts = []
+    for i in range(n):
+        insts.append(fifo(outs[i], din, wrs[i], rds[i], clk, rst))
+        insts.append(timer(expired[i], loads[i], ens[i], clk, rst))
+
+    @instance
+    def host():
+        rst.next = 1
+        yield clk.negedge
+        rst.next = 0
+        for t in range(CYCLES):
+            yield clk.negedge
+            i = (t // BURST) % n
+            phase = t % BURST
+            write = phase < BURST // 2 - 1 and phase % 2 == 0
+            if write:
+                din.next = t % 256
+            wrs[i].next = write
+            rds[i].next = phase < BURST // 2 - 1 and phase % 2 == 1
+            loads[i].next = phase == 0
+            ens[i].next = phase < BURST - 1
+
+    return insts, host
+
+
+def run(n, skip_idle):
+    outs = [Signal(intbv(0)[8:]) for i in range(n)]
+    expired = [Signal(bool(0)) for i in range(n)]
+    clk = Signal(bool(0))
+    rst = ResetSignal(0, active=1, isasync=False)
+    sim = Simulation(system(outs, expired, clk, rst, n), Clock(clk, 10),
+                     skip_idle=skip_idle)
+    start = time.time()
+    sim.run(CYCLES * 10 + 20, quiet=1)
+    secs = time.time() - start
+    values = [int(s) for s in outs] + [bool(s) for s in expired]
+    sim.quit()
+    return sim, secs, values
+
+
+def main(n):
+    print("peripherals: %d, cycles: %d" % (n, CYCLES))
+    sim, ref, values = run(n, False)
+    sim, secs, skipvalues = run(n, True)
+    assert skipvalues == values
+    blocks = sim.activity.blocks.values()
+    skips = sum(s for e, s in blocks)
+    total = sum(e + s for e, s in blocks)
+    print("all blocks %7.3f s  skip_idle %7.3f s  (%.1fx, %.1f%% skipped)" %
+          (ref, secs, ref / secs, 100.0 * skips / total))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    main(n)
@@ -0,0 +1,131 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Benchmark the waiters on a tuple of signals or edges
+
+Usage: python perf_tuplewaiter.py [N]
+
+Like perf_inferWaiter.py, N processes wait on the same signals, that a
+stimulus changes at random. The processes wait on a tuple of signals,
+and on a tuple of edges, with the specialized tuple waiters and with
+the general _Waiter. The script reports the run time, the number of
+waiter and subscription objects created, and the number of waiter list
+purges.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import random
+import sys
+import time
+from random import randrange
+
+from myhdl import Signal, Simulation, StopSimulation, intbv, delay
+from myhdl import _Waiter as waitermod
+from myhdl._Signal import _WaiterList
+from myhdl._Waiter import _Waiter, _SignalTupleWaiter, _EdgeTupleWaiter
+
+STEPS = 5000
+
+
+def signalTuple(a, b, c, d, r):
+    senslist = (a, b, c, d)
+    while 1:
+        yield senslist
+        r.next = a + b + c + d
+
+
+def edgeTuple(a, b, c, d, r):
+    senslist = (c.posedge, d.negedge)
+    while 1:
+        yield senslist
+        r.next = a + b
+
+
+def bench(n, genFunc, waiterType):
+    a, b = [Signal(intbv(0)[5:]) for i in range(2)]
+    c, d = [Signal(bool(0)) for i in range(2)]
+    r = [Signal(intbv(0)[8:]) for i in range(n)]
+    insts = [waiterType(genFunc(a, b, c, d, r[i])) for i in range(n)]
+
+    def stimulus():
+        for i in range(STEPS):
+            yield delay(randrange(1, 10))
+            if randrange(2):
+                a.next = randrange(32)
+            if randrange(2):
+                b.next = randrange(32)
+            c.next = randrange(2)
+            d.next = randrange(2)
+        raise StopSimulation()
+
+    return insts, _Waiter(stimulus())
+
+
+def counted(cls, name, counts):
+    method = cls.__dict__[name]
+
+    def wrapper(self, *args):
+        counts[name] += 1
+        return method(self, *args)
+
+    setattr(cls, name, wrapper)
+    return method
+
+
+def run(n, genFunc, waiterType):
+    random.seed(1)
+    sim = Simulation(bench(n, genFunc, waiterType))
+    start = time.time()
+    sim.run(quiet=1)
+    elapsed = time.time() - start
+    # count the objects and purges in a second run
+    random.seed(1)
+    sim = Simulation(bench(n, genFunc, waiterType))
+    counts = {'__init__': 0, 'purge': 0}
+    classes = [_Waiter, _SignalTupleWaiter, _EdgeTupleWaiter]
+    if hasattr(waitermod, '_Trigger'):
+        classes.append(waitermod._Trigger)
+    saved = [(cls, counted(cls, '__init__', counts)) for cls in classes
+             if '__init__' in cls.__dict__]
+    purge = counted(_WaiterList, 'purge', counts)
+    try:
+        sim.run(quiet=1)
+    finally:
+        for cls, method in saved:
+            cls.__init__ = method
+        _WaiterList.purge = purge
+    return elapsed, counts['__init__'], counts['purge']
+
+
+def main(n):
+    print("processes: %d, stimulus steps: %d" % (n, STEPS))
+    for genFunc in (signalTuple, edgeTuple):
+        for waiterType in (_Waiter, genFunc is signalTuple and
+                           _SignalTupleWaiter or _EdgeTupleWaiter):
+            elapsed, objects, purges = run(n, genFunc, waiterType)
+            print("%-12s %-20s %8.3f s %8d objects %8d purges" %
+                  (genFunc.__name__, waiterType.__name__, elapsed,
+                   objects, purges))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    main(n)
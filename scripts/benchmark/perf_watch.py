@@ -0,0 +1,93 @@
+#  This file is part of the myhdl library, a Python package for using
+#  Python as a Hardware Description Language.
+#
+#  Copyright (C) 2003-2008 Jan Decaluwe
+#
+#  The myhdl library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public License as
+#  published by the Free Software Foundation; either version 2.1 of the
+#  License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful, but
+#  WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library; if not, write to the Free Software
+#  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA 02111-1307 USA
+
+
+""" Compare polling processes with watchpoints to end a simulation
+
+Usage: python perf_watch.py [N]
+
+A counter raises a done flag after N clock cycles, and the simulation
+should stop then. Testbench processes that check the flag on each clock
+edge are compared with watchpoints on the flag. The script reports the
+run times and the process activations.
+"""
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import time
+
+from myhdl import (Signal, Simulation, Clock, StopSimulation, always,
+                   instance, intbv)
+
+CHECKS = 10
+
+
+def counter(done, clock, n):
+    count = Signal(intbv(0, min=0, max=n + 1))
+
+    @always(clock.posedge)
+    def logic():
+        if count == n - 1:
+            done.next = 1
+        else:
+            count.next = count + 1
+
+    return logic
+
+
+def poll(done, clock):
+
+    @instance
+    def check():
+        while 1:
+            yield clock.posedge
+            if done:
+                raise StopSimulation()
+
+    return check
+
+
+def bench(n, watch):
+    clock = Signal(bool(0))
+    done = Signal(bool(0))
+    insts = [Clock(clock, 10), counter(done, clock, n)]
+    if not watch:
+        insts.extend(poll(done, clock) for i in range(CHECKS))
+    sim = Simulation(insts)
+    if watch:
+        for i in range(CHECKS):
+            sim.watch(done, action='stop')
+    return sim
+
+
+def main(n):
+    print("cycles: %d, checks: %d" % (n, CHECKS))
+    for watch in (False, True):
+        sim = bench(n, watch)
+        start = time.time()
+        sim.run(quiet=1)
+        elapsed = time.time() - start
+        print("%-10s %8.3f s %10d activations" %
+              (watch and "watch" or "poll", elapsed, sim.activations))
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    main(n)